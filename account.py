@@ -0,0 +1,136 @@
+import pickle
+import struct
+import time
+
+# Progress flags, stored as one bit each. Append new flags at the end;
+# existing bit positions must never move.
+FLAG_FIELDS = (
+    'aStatus', 'eStatus', 'iStatus', 'oStatus', 'uStatus',
+    'introStatus', 'vowelScreen',
+    'easyChallenge', 'intermediateChallenge', 'hardChallenge',
+    'finalAchievement',
+    'achievementOne', 'achievementTwo', 'achievementThree', 'achievementFour',
+)
+FLAG_BITS = {name: 1 << bit for bit, name in enumerate(FLAG_FIELDS)}
+SETTING_FIELDS = ('music_volume', 'sfx_volume')
+STAT_FIELDS = ('created_at', 'sessions')
+
+# Encoded accounts start with MAGIC and a format version. To change the
+# layout: add a _BODY struct and decoder for the new version, bump
+# FORMAT_VERSION, and register a function in _MIGRATIONS that turns a field
+# dict of the previous version into one of the next.
+MAGIC = b'SIUA'
+FORMAT_VERSION = 1
+_HEADER = struct.Struct('<4sH')
+_BODY_V1 = struct.Struct('<IdddI')  # flags, music_volume, sfx_volume, created_at, sessions
+
+
+class Account:
+    """One learner's progress and settings.
+
+    A plain value type: the attributes are fixed by __slots__, so a typo or a
+    field nobody declared fails loudly instead of being saved to one file and
+    missing from the next. Flags are exposed as booleans and packed into an
+    integer for storage (see pack_flags()).
+    """
+
+    __slots__ = ('username',) + FLAG_FIELDS + SETTING_FIELDS + STAT_FIELDS
+
+    def __init__(self, username: str = "user", flags=0, music_volume=0.5, sfx_volume=0.5,
+                 created_at=None, sessions=0):
+        self.username = username
+        self.unpack_flags(flags)
+
+        # User Preference Settings
+        self.music_volume = music_volume
+        self.sfx_volume = sfx_volume
+
+        # Stats
+        self.created_at = time.time() if created_at is None else created_at
+        self.sessions = sessions
+
+    def pack_flags(self):
+        flags = 0
+        for name, bit in FLAG_BITS.items():
+            if getattr(self, name):
+                flags |= bit
+        return flags
+
+    def unpack_flags(self, flags):
+        for name, bit in FLAG_BITS.items():
+            setattr(self, name, bool(flags & bit))
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state):
+        # Also called with the __dict__ of Account objects pickled before
+        # __slots__, possibly from register.Account; their missing fields get
+        # the defaults and fields that no longer exist are dropped.
+        if isinstance(state, tuple):
+            state = {**(state[0] or {}), **state[1]}
+        Account.__init__(self, state.get('username', "user"), created_at=0.0)
+        for name, value in state.items():
+            if name in self.__slots__:
+                setattr(self, name, value)
+
+    def __eq__(self, other):
+        return isinstance(other, Account) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return f"Account({self.username!r}, flags={self.pack_flags():#x})"
+
+
+def encode(account):
+    """Serialize account into the compact versioned format."""
+    return (_HEADER.pack(MAGIC, FORMAT_VERSION)
+            + _BODY_V1.pack(account.pack_flags(), account.music_volume, account.sfx_volume,
+                            account.created_at, account.sessions)
+            + account.username.encode('utf-8'))
+
+
+def _decode_v1(body):
+    flags, music_volume, sfx_volume, created_at, sessions = _BODY_V1.unpack_from(body)
+    return {
+        'username': body[_BODY_V1.size:].decode('utf-8'),
+        'flags': flags,
+        'music_volume': music_volume,
+        'sfx_volume': sfx_volume,
+        'created_at': created_at,
+        'sessions': sessions,
+    }
+
+
+_DECODERS = {1: _decode_v1}
+_MIGRATIONS = {}  # version -> function(fields of that version) -> fields of version + 1
+
+
+def decode(data):
+    """Read an account written by encode() of this or any earlier format version."""
+    magic, version = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Not an encoded account")
+    if version not in _DECODERS:
+        raise ValueError(f"Unsupported account format version {version}")
+
+    fields = _DECODERS[version](data[_HEADER.size:])
+    while version < FORMAT_VERSION:
+        fields = _MIGRATIONS[version](fields)
+        version += 1
+    return Account(**fields)
+
+
+class _LegacyUnpickler(pickle.Unpickler):
+    # Old account files are pickled register.Account objects; nothing else is allowed in
+    def find_class(self, module, name):
+        if name == 'Account' and module in ('register', 'account', '__main__'):
+            return Account
+        raise pickle.UnpicklingError(f"Unexpected object {module}.{name} in account file")
+
+
+def load_legacy(file):
+    """Read an account pickled by older versions without importing register or Kivy."""
+    return _LegacyUnpickler(file).load()
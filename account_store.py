@@ -0,0 +1,325 @@
+import io
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+from account import MAGIC, Account, decode, encode, load_legacy
+from profile_db import ProfileDatabase
+
+
+class JournalBackend:
+    """Stores the account as an encoded snapshot plus an append-only journal.
+
+    Each change is one short line appended to the journal: a CRC32 and the
+    changed fields as JSON. Loading reads the snapshot and replays the
+    journal on top of it; a torn or damaged line (a crash mid-append) fails
+    its checksum and stops the replay there, and load() then writes a new
+    snapshot and starts an empty journal, so later appends don't end up
+    behind the damage. save() writes a new snapshot to
+    a temporary file and renames it over the old one, so the snapshot is
+    always either the old or the new version, and only then empties the
+    journal. Replaying a journal onto a snapshot that already contains it is
+    harmless, since entries only set fields.
+
+    Snapshots use the format from account.encode(). A pickled account from
+    older versions is still read, from legacy_path if there is no snapshot
+    yet, and the next save() replaces it with the new format.
+    """
+
+    def __init__(self, path='account_data.dat', legacy_path='account_data.pkl'):
+        self.path = path
+        self.legacy_path = legacy_path
+        self.journal_path = os.path.splitext(path)[0] + '.journal'
+        self.journal_entries = 0
+        self.journal_damaged = False
+        self.snapshots = 0
+
+    def _snapshot_path(self):
+        if os.path.exists(self.path):
+            return self.path
+        if self.legacy_path and os.path.exists(self.legacy_path):
+            return self.legacy_path
+        return None
+
+    def exists(self):
+        return self._snapshot_path() is not None
+
+    def load(self):
+        """Return the account with the journal applied, or None if there is no snapshot."""
+        path = self._snapshot_path()
+        if path is None:
+            return None
+        try:
+            account = self._read_snapshot(path)
+        except Exception:
+            # Keep the damaged files around instead of letting a new account overwrite them
+            os.replace(path, _backup_path(path))
+            if os.path.exists(self.journal_path):
+                os.replace(self.journal_path, _backup_path(self.journal_path))
+            raise
+
+        account = self._replay(account)
+        if self.journal_damaged:
+            # New entries would be appended to the torn line and dropped with it on the next load
+            try:
+                self.save(account)
+            except OSError as e:
+                print(f"Could not rewrite {self.path} after a damaged journal: {e}")
+        return account
+
+    def read(self):
+        """Like load(), but leaves the files alone when they can't be read; errors are raised."""
+        path = self._snapshot_path()
+        if path is None:
+            return None
+        return self._replay(self._read_snapshot(path))
+
+    def _read_snapshot(self, path):
+        with open(path, 'rb') as file:
+            data = file.read()
+        if data.startswith(MAGIC):
+            account = decode(data)
+        else:
+            account = load_legacy(io.BytesIO(data))
+        if not isinstance(account, Account):
+            raise ValueError(f"{path} does not hold an account")
+        return account
+
+    def _replay(self, account):
+        self.journal_entries = 0
+        self.journal_damaged = False
+        for fields in self._read_journal():
+            for name, value in fields.items():
+                if name in Account.__slots__:
+                    setattr(account, name, value)
+            self.journal_entries += 1
+        return account
+
+    def _read_journal(self):
+        if not os.path.exists(self.journal_path):
+            return
+        with open(self.journal_path, 'rb') as file:
+            for line in file:
+                checksum, _, payload = line.rstrip(b'\n').partition(b' ')
+                try:
+                    valid = int(checksum, 16) == zlib.crc32(payload)
+                except ValueError:
+                    valid = False
+                if not valid:
+                    print(f"Ignoring damaged entries at the end of {self.journal_path}")
+                    self.journal_damaged = True
+                    return
+                yield json.loads(payload)
+
+    def switch(self, username):
+        """Return the stored account if it is username's; there are no other profiles to switch to."""
+        account = self.load()
+        if account is not None and account.username.lower() == username.lower():
+            return account
+        return None
+
+    def append(self, fields):
+        """Record changed fields with a single small append."""
+        payload = json.dumps(fields, separators=(',', ':')).encode()
+        with open(self.journal_path, 'ab') as file:
+            file.write(b'%08x %s\n' % (zlib.crc32(payload), payload))
+            file.flush()
+            os.fsync(file.fileno())
+        self.journal_entries += 1
+
+    def save(self, account):
+        """Atomically replace the snapshot with account and empty the journal."""
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'wb') as file:
+            file.write(encode(account))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.path)
+        self.snapshots += 1
+
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self.journal_entries = 0
+
+
+def _backup_path(path):
+    """A name for keeping a damaged file that doesn't overwrite an earlier backup."""
+    backup = f"{path}.corrupt-{time.strftime('%Y%m%d-%H%M%S')}"
+    candidate, number = backup, 1
+    while os.path.exists(candidate):
+        number += 1
+        candidate = f"{backup}-{number}"
+    return candidate
+
+
+class AccountStore:
+    """Keeps the current learner's account in memory and persists every change to the backend.
+
+    The account is loaded once, on the first get(). update() applies the
+    change in memory and appends it to the journal right away. Changes that
+    happen in bursts, like dragging a volume slider, can pass defer=True to
+    be merged and appended together after write_delay seconds. Once the
+    journal holds compact_after entries, the timer thread folds it into a
+    new snapshot. The app calls close() when it stops, which writes anything
+    pending and compacts.
+
+    The backend is the shared ProfileDatabase by default, which holds every
+    learner on the machine; JournalBackend keeps a single account in files
+    next to the app, the way it used to be stored.
+
+    Listeners added with add_listener() are called as listener(account,
+    fields) after every change, with fields None when the whole account was
+    replaced. Changes are made on the UI thread, so listeners may touch
+    widgets.
+    """
+
+    def __init__(self, backend=None, write_delay=1.0, compact_after=50):
+        self.backend = backend or ProfileDatabase()
+        self.write_delay = write_delay
+        self.compact_after = compact_after
+        self.load_error = None
+        self._account = None
+        self._loaded = False
+        self._pending = {}
+        self._timer = None
+        self._lock = threading.RLock()  # guards the account, _pending and _timer
+        self._write_lock = threading.Lock()  # keeps backend writes in order
+        self._listeners = []
+
+        # Counters
+        self.reads = 0
+        self.changes = 0
+
+    def get(self):
+        """Return the account, or None when there is none or it couldn't be read."""
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            self.reads += 1
+            return self._account
+
+    def exists(self):
+        return self.get() is not None
+
+    def add_listener(self, listener):
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, account, fields=None):
+        for listener in list(self._listeners):
+            listener(account, fields)
+
+    def _load(self):
+        self._loaded = True
+        try:
+            self._account = self.backend.load()
+        except Exception as e:
+            self.load_error = e
+            print(f"Error loading account data: {e}")
+
+    def set(self, account):
+        """Replace the whole account, e.g. when registering. Written immediately."""
+        with self._write_lock:
+            with self._lock:
+                self._loaded = True
+                self.load_error = None
+                self._account = account
+                self._pending.clear()
+                self.changes += 1
+                try:
+                    self.backend.save(account)
+                except (OSError, sqlite3.Error) as e:
+                    print(f"Error saving account data: {e}")
+        self._notify(account)
+
+    def switch(self, username):
+        """Make another learner's profile current. Returns it, or None if there is no such profile."""
+        self.flush()
+        with self._write_lock:
+            with self._lock:
+                account = self.backend.switch(username)
+                if account is not None:
+                    self._loaded = True
+                    self.load_error = None
+                    self._account = account
+        if account is not None:
+            self._notify(account)
+        return account
+
+    def update(self, defer=False, **fields):
+        """Set attributes on the account. Returns the account, or None if there is none."""
+        with self._lock:
+            account = self.get()
+            if account is None:
+                return None
+            for name, value in fields.items():
+                setattr(account, name, value)
+            self.changes += 1
+
+            if defer:
+                self._pending.update(fields)
+                self._schedule()
+
+        if not defer:
+            with self._write_lock:
+                try:
+                    self.backend.append(fields)
+                except (OSError, sqlite3.Error) as e:
+                    print(f"Error saving account data: {e}")
+            if self.backend.journal_entries >= self.compact_after:
+                with self._lock:
+                    self._schedule()
+
+        self._notify(account, fields)
+        return account
+
+    def _schedule(self):
+        if self._timer is None:
+            # Not restarted on later changes, so a write is never put off for long
+            self._timer = threading.Timer(self.write_delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self, compact=False):
+        """Append deferred changes now, and compact the journal if it has grown."""
+        with self._write_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                pending, self._pending = self._pending, {}
+                account = self._account
+
+            try:
+                if pending:
+                    self.backend.append(pending)
+                if account is not None and self.backend.journal_entries and (
+                        compact or self.backend.journal_entries >= self.compact_after):
+                    with self._lock:
+                        self.backend.save(account)
+            except (OSError, sqlite3.Error) as e:
+                print(f"Error saving account data: {e}")
+                with self._lock:
+                    self._pending = {**pending, **self._pending}
+
+    def close(self):
+        self.flush(compact=True)
+
+    def stats(self):
+        return {
+            'reads': self.reads,
+            'changes': self.changes,
+            'pending': len(self._pending),
+            'journal_entries': self.backend.journal_entries,
+            'snapshots': self.backend.snapshots,
+        }
+
+
+# Shared by the app and every screen
+account_store = AccountStore()
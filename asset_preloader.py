@@ -0,0 +1,190 @@
+import heapq
+import itertools
+import threading
+import time
+
+from kivy.clock import Clock
+from kivy.event import EventDispatcher
+from kivy.loader import Loader
+from kivy.properties import BooleanProperty, NumericProperty, StringProperty
+from kivy.resources import resource_find
+
+from asset_resolver import asset_resolver
+from gesture_recognizer import gesture_recognizer
+from progress import progress as learner_progress
+from sound_bank import INSTRUCTION, sound_bank
+
+# (progress flag, screen, reference picture) for each vowel, in lesson order
+VOWELS = (
+    ('aStatus', 'a_screen', 'assets/hands/letterA.PNG'),
+    ('eStatus', 'e_screen', 'assets/hands/letterE.PNG'),
+    ('iStatus', 'i_screen', 'assets/hands/letterI.PNG'),
+    ('oStatus', 'o_screen', 'assets/hands/letterO.PNG'),
+    ('uStatus', 'u_screen', 'assets/hands/letterU.PNG'),
+)
+INTRO_INSTRUCTION = 'assets/sounds/thumbsup_instruction.mp3'
+LETTER_INSTRUCTION = 'assets/sounds/copyinstruction.mp3'
+
+
+class _Task:
+    def __init__(self, name, function, main_thread):
+        self.name = name
+        self.function = function
+        self.main_thread = main_thread
+
+
+class AssetPreloader(EventDispatcher):
+    """Warms up what the learner's next screen needs, in the background.
+
+    Started once the home screen is on screen. Tasks run one at a time in
+    priority order on a worker thread: loading the recognizer (classifier
+    and MediaPipe graph) and reading files happen right there; handing
+    pictures to the Kivy Loader, decoding sounds and building screens have
+    to happen on the UI thread, so the worker schedules them on the Clock
+    and waits for them.
+
+    plan() puts the intro first while introStatus is false, and otherwise
+    the first vowel that isn't done yet. Progress is observable: bind to
+    progress (0 to 1), current or finished, or ask is_ready(name).
+    """
+
+    progress = NumericProperty(0.0)
+    current = StringProperty('')
+    finished = BooleanProperty(False)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._queue = []
+        self._order = itertools.count()
+        self._ready = set()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._images = {}  # path -> ProxyImage, kept so the Loader doesn't drop them
+        self.total = 0
+        self.durations = {}  # task name -> seconds
+
+    def add(self, priority, name, function, main_thread=False):
+        """Queue function() under name; lower priorities run first. Names already queued or done are skipped."""
+        if name in self._ready or any(task.name == name for _, _, task in self._queue):
+            return
+        heapq.heappush(self._queue, (priority, next(self._order), _Task(name, function, main_thread)))
+        self.total += 1
+
+    def is_ready(self, name):
+        return name in self._ready
+
+    def plan(self, screen_manager, learner=learner_progress):
+        """Queue the warm-up tasks for where learner is likely to go next."""
+        def picture(path):
+            # The letter screens show these 200 pixels wide
+            path = asset_resolver.resolve(path, 200)
+            self.add(priority, f'read {path}', lambda: _read(path))
+            self.add(priority, f'texture {path}', lambda: self._load_image(path), main_thread=True)
+
+        def sound(path):
+            self.add(priority, f'sound {path}', lambda: sound_bank.release(sound_bank.acquire(path, INSTRUCTION)),
+                     main_thread=True)
+
+        def screen(name):
+            self.add(priority, f'screen {name}', lambda: screen_manager.get_screen(name), main_thread=True)
+
+        pending = [vowel for vowel in VOWELS if not getattr(learner, vowel[0])]
+
+        # 0: the screen the learner will most likely open next
+        priority = 0
+        if not learner.introStatus:
+            sound(INTRO_INSTRUCTION)
+        elif pending:
+            picture(pending[0][2])
+            sound(LETTER_INSTRUCTION)
+
+        # 1: the recognizer every camera screen waits for
+        priority = 1
+        self.add(priority, 'recognizer', _load_recognizer)
+
+        # 2: build that screen
+        priority = 2
+        if not learner.introStatus:
+            screen('intro')
+        elif pending:
+            screen(pending[0][1])
+
+        # 3: the other lessons
+        priority = 3
+        if not learner.introStatus:
+            sound(LETTER_INSTRUCTION)
+        for _, _, path in pending[1:] + [vowel for vowel in VOWELS if vowel not in pending]:
+            picture(path)
+
+    def start(self, screen_manager):
+        if self._thread is not None:
+            return
+        self.plan(screen_manager)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+
+    def _run(self):
+        start = time.perf_counter()
+        while self._queue and not self._stop_event.is_set():
+            _, _, task = heapq.heappop(self._queue)
+            Clock.schedule_once(lambda dt, name=task.name: setattr(self, 'current', name), 0)
+            task_start = time.perf_counter()
+            if task.main_thread:
+                self._run_on_main_thread(task)
+            else:
+                _run_task(task)
+            self.durations[task.name] = time.perf_counter() - task_start
+            self._ready.add(task.name)
+            Clock.schedule_once(lambda dt, done=len(self._ready): self._set_progress(done), 0)
+
+        if not self._stop_event.is_set():
+            print(f"Preloaded {len(self._ready)} assets in {time.perf_counter() - start:.2f} s")
+            Clock.schedule_once(lambda dt: setattr(self, 'finished', True), 0)
+
+    def _run_on_main_thread(self, task):
+        done = threading.Event()
+
+        def run(dt):
+            _run_task(task)
+            done.set()
+
+        Clock.schedule_once(run, 0)
+        # The UI thread stops calling the Clock when the app closes
+        while not done.wait(0.1):
+            if self._stop_event.is_set():
+                return
+
+    def _load_image(self, path):
+        # The letter screens show these through AsyncImage, which asks the Loader
+        self._images[path] = Loader.image(resource_find(path))
+
+    def _set_progress(self, done):
+        self.progress = done / self.total if self.total else 1.0
+        if self.progress >= 1.0:
+            self.current = ''
+
+
+def _run_task(task):
+    try:
+        task.function()
+    except Exception as e:
+        print(f"Preloading {task.name} failed: {e}")
+
+
+def _load_recognizer():
+    gesture_recognizer.load()
+    print(gesture_recognizer.report())
+
+
+def _read(path):
+    # Pulls the file into the OS cache so creating the texture on the UI thread doesn't wait for the disk
+    with open(path, 'rb') as file:
+        while file.read(1 << 20):
+            pass
+
+
+# Started by the app after the first frame
+asset_preloader = AssetPreloader()
@@ -0,0 +1,93 @@
+import json
+import os
+
+MANIFEST_PATH = 'assets/build/manifest.json'
+
+
+def asset_key(path):
+    """Lookup key for an asset path: forward slashes, no leading ./, lower case."""
+    return os.path.normpath(path).replace('\\', '/').lower()
+
+
+class AssetResolver:
+    """Maps the asset paths used in the code to what should actually be loaded.
+
+    build_assets.py packs the menu icons into atlases and writes smaller
+    copies of the large pictures, listed in a manifest. resolve() returns
+    the atlas:// URI of an icon, or the smallest copy of a picture that is
+    at least `size` pixels wide (pass dp() sizes, so screen density counts).
+    Without a manifest, or for anything it doesn't list, the original file
+    is used.
+
+    Lookups ignore case, so 'assets/Ii.png' finds assets/iI.png on file
+    systems that are case sensitive too.
+    """
+
+    def __init__(self, manifest_path=MANIFEST_PATH, root='assets'):
+        self.manifest_path = manifest_path
+        self.root = root
+        self._images = None
+        self._files = None
+
+        # Counters
+        self.atlas_hits = 0
+        self.variant_hits = 0
+        self.originals = 0
+
+    def _load(self):
+        self._files = {}
+        for directory, _, names in os.walk(self.root):
+            for name in names:
+                path = os.path.join(directory, name).replace('\\', '/')
+                self._files.setdefault(asset_key(path), path)
+
+        self._images = {}
+        if not os.path.exists(self.manifest_path):
+            return
+        try:
+            with open(self.manifest_path) as file:
+                images = json.load(file)['images']
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Ignoring asset manifest {self.manifest_path}: {e}")
+            return
+
+        # Anything whose generated file went missing falls back to the original
+        for key, entry in images.items():
+            if 'atlas' in entry and not os.path.exists(entry['atlas_file']):
+                continue
+            entry['variants'] = sorted(
+                (width, path) for width, path in entry.get('variants', ()) if os.path.exists(path))
+            self._images[key] = entry
+
+    def reload(self):
+        self._images = None
+
+    def resolve(self, path, size=None):
+        """Return the source to load for asset path, shown about `size` pixels wide."""
+        if self._images is None:
+            self._load()
+        key = asset_key(path)
+        entry = self._images.get(key)
+        if entry is not None:
+            if 'atlas' in entry:
+                self.atlas_hits += 1
+                return entry['atlas']
+            if size:
+                for width, variant in entry['variants']:
+                    if width >= size:
+                        self.variant_hits += 1
+                        return variant
+        self.originals += 1
+        return self._files.get(key, path)
+
+    def stats(self):
+        return {
+            'manifest': bool(self._images),
+            'atlas_hits': self.atlas_hits,
+            'variant_hits': self.variant_hits,
+            'originals': self.originals,
+        }
+
+
+# Shared by every screen that shows pictures
+asset_resolver = AssetResolver()
@@ -0,0 +1,113 @@
+import glob
+import json
+import os
+import shutil
+import time
+
+from PIL import Image
+
+from asset_resolver import MANIFEST_PATH, asset_key
+
+BUILD_DIR = os.path.dirname(MANIFEST_PATH)
+
+# Atlas name -> icons; one per screen, so a menu binds a single texture
+ATLASES = {
+    'home': ('intro', 'checkIntro', 'vowels', 'checkVowels', 'lockVowels',
+             'vowelsChallengeClick', 'vowelsChallengeCheck', 'vowelsChallengeLocked'),
+    'vowels_menu': ('aA', 'eE', 'iI', 'oO', 'uU',
+                    'checkaA', 'checkEe', 'checkIi', 'checkOo', 'checkUu',
+                    'lockAa', 'lockEe', 'lockIi', 'lockOo', 'lockUu'),
+    'challenges_menu': ('vowelsEasyClick', 'vowelsEasyCheck', 'vowelsEasyLocked',
+                        'vowelsInterClick', 'vowelsInterCheck', 'vowelsInterLocked',
+                        'vowelsHardClick', 'vowelsHardCheck', 'vowelsHardLocked'),
+}
+ATLAS_SIZE = 1024
+
+# Pictures shown at 200 dp: a copy for density 1 and one for density 2
+VARIANT_PATTERNS = ('assets/hands/*.PNG', 'assets/challenges/*/*.jpg')
+VARIANT_WIDTHS = (200, 400)
+
+
+def texture_bytes(width, height):
+    # Kivy uploads RGBA, 4 bytes per pixel
+    return width * height * 4
+
+
+def build_atlases(images):
+    from kivy.atlas import Atlas
+
+    before = after = 0
+    for name, icons in ATLASES.items():
+        paths = [os.path.join('assets', icon + '.png') for icon in icons]
+        for path in paths:
+            with Image.open(path) as image:
+                before += texture_bytes(*image.size)
+
+        outname = os.path.join(BUILD_DIR, name)
+        atlas_file, meta = Atlas.create(outname, paths, ATLAS_SIZE)
+        for page in meta:
+            with Image.open(os.path.join(BUILD_DIR, page)) as image:
+                after += texture_bytes(*image.size)
+
+        uri = 'atlas://' + outname.replace('\\', '/')
+        for icon, path in zip(icons, paths):
+            images[asset_key(path)] = {'atlas': f'{uri}/{icon}', 'atlas_file': atlas_file}
+        print(f"{atlas_file}: {len(paths)} icons in {len(meta)} page(s)")
+    return before, after
+
+
+def build_variants(images):
+    before = after = 0
+    for pattern in VARIANT_PATTERNS:
+        for path in sorted(glob.glob(pattern)):
+            path = path.replace('\\', '/')
+            stem, extension = os.path.splitext(os.path.relpath(path, 'assets'))
+            variants = []
+            with Image.open(path) as image:
+                before += texture_bytes(*image.size)
+                smallest = image.size
+                for width in VARIANT_WIDTHS:
+                    if width >= image.width:
+                        break
+                    height = round(image.height * width / image.width)
+                    target = os.path.join(BUILD_DIR, f'{stem}@{width}{extension}').replace('\\', '/')
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    image.resize((width, height), Image.LANCZOS).save(target, optimize=True)
+                    variants.append((width, target))
+                    smallest = min(smallest, (width, height))
+            after += texture_bytes(*smallest)
+            images[asset_key(path)] = {'variants': variants}
+            print(f"{path}: {', '.join(str(width) for width, _ in variants) or 'already small'}")
+    return before, after
+
+
+def main():
+    """Pack the menu icons into atlases and write smaller copies of the large pictures.
+
+    Everything goes to assets/build/, with a manifest.json that AssetResolver
+    reads at runtime. Run it again whenever a picture in assets/ changes;
+    delete assets/build/ to go back to the original files. Needs Pillow.
+    """
+    start = time.perf_counter()
+    if os.path.isdir(BUILD_DIR):
+        shutil.rmtree(BUILD_DIR)
+    os.makedirs(BUILD_DIR)
+
+    images = {}
+    icons_before, icons_after = build_atlases(images)
+    pictures_before, pictures_after = build_variants(images)
+
+    with open(MANIFEST_PATH, 'w') as file:
+        json.dump({'version': 1, 'images': images}, file, indent=1)
+
+    mib = 2 ** 20
+    print(f"Menu icons: {icons_before / mib:.1f} MiB of textures in "
+          f"{sum(len(icons) for icons in ATLASES.values())} files -> "
+          f"{icons_after / mib:.1f} MiB in {len(ATLASES)} atlases")
+    print(f"Pictures at density 1: {pictures_before / mib:.1f} MiB -> {pictures_after / mib:.1f} MiB of textures")
+    print(f"Wrote {MANIFEST_PATH} in {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == '__main__':
+    # python build_assets.py
+    main()
@@ -0,0 +1,153 @@
+import threading
+import time
+
+from kivy.clock import Clock
+
+from frame_sources import make_frame_source
+
+
+class CameraManager:
+    """Keeps one webcam stream open for all camera screens.
+
+    Screens acquire() the camera when they start and release() it when they
+    leave. The device is only closed after no screen has used it for
+    idle_timeout seconds, so going from one letter or challenge screen to the
+    next (or back through a menu) reuses the stream that is already open.
+
+    Opening happens lazily on the first read(), which runs on the recognition
+    worker thread, so a slow driver never blocks the UI.
+
+    capture_size is only a request: drivers pick the closest mode they support,
+    so the size actually delivered is read back into effective_size. MJPG is
+    requested too, where the driver offers it, since uncompressed YUYV at
+    higher resolutions often can't reach 30 fps over USB 2.
+
+    source_spec picks what stands in for "the camera": a camera index, a video
+    file or a directory of images (see make_frame_source). When it is None,
+    SIGNITUP_FRAME_SOURCE decides, so the screens and benchmarks can run from
+    a recording on a machine without a webcam.
+    """
+
+    def __init__(self, source_spec=None, idle_timeout=10.0, capture_size=(640, 480), use_mjpg=True):
+        self.source_spec = source_spec
+        self.idle_timeout = idle_timeout
+        self.capture_size = capture_size
+        self.use_mjpg = use_mjpg
+        self.effective_size = None
+        self.effective_fourcc = None
+        self._source = None
+        self._users = 0
+        self._lock = threading.Lock()  # guards _users and _close_event
+        self._device_lock = threading.Lock()  # guards opening, reading and closing the device
+        self._close_event = None
+        self._last_open_failure = float('-inf')
+
+        # Counters
+        self.opens = 0
+        self.last_open_latency = None
+        self.total_open_latency = 0.0
+        self.frames_delivered = 0
+
+    @property
+    def is_open(self):
+        return self._source is not None
+
+    def acquire(self):
+        """Register a user of the camera and cancel any pending close."""
+        with self._lock:
+            self._users += 1
+            if self._close_event:
+                self._close_event.cancel()
+                self._close_event = None
+
+    def release(self):
+        """Unregister a user; the device closes after idle_timeout without users."""
+        with self._lock:
+            self._users = max(0, self._users - 1)
+            if self._users or self._source is None:
+                return
+
+        if self.idle_timeout <= 0:
+            self.close()
+        elif not self._close_event:
+            self._close_event = Clock.schedule_once(self._close_if_idle, self.idle_timeout)
+
+    def read(self):
+        """Read the next frame, opening the device first if needed. Returns (ret, frame)."""
+        if not self._users:
+            # A worker that outlived its screen must not reopen the device
+            return False, None
+
+        with self._device_lock:
+            if self._source is None:
+                if time.perf_counter() - self._last_open_failure < 1.0:
+                    return False, None
+                try:
+                    self._open()
+                except IOError as e:
+                    self._last_open_failure = time.perf_counter()
+                    print(f"Error opening frame source: {e}")
+                    return False, None
+
+            ret, frame = self._source.read()
+            if ret:
+                self.frames_delivered += 1
+            return ret, frame
+
+    def grab(self):
+        """Take the next frame off an open device without decoding it, to keep the stream warm."""
+        if not self._users:
+            return False
+        with self._device_lock:
+            if self._source is None:
+                return False
+            return self._source.grab()
+
+    def _open(self):
+        start = time.perf_counter()
+        source = make_frame_source(self.source_spec, capture_size=self.capture_size, use_mjpg=self.use_mjpg)
+        source.open()
+        self._source = source
+        self.effective_size = source.effective_size
+        self.effective_fourcc = source.effective_fourcc
+        self.last_open_latency = time.perf_counter() - start
+        self.total_open_latency += self.last_open_latency
+        self.opens += 1
+        print(f"Frame source {source.describe()} opened in {self.last_open_latency * 1000:.0f} ms, "
+              f"{self.effective_size} {self.effective_fourcc}")
+
+    def _close_if_idle(self, dt):
+        self._close_event = None
+        with self._lock:
+            if self._users:
+                return
+        self.close()
+
+    def close(self):
+        """Close the device now, whether or not a screen still uses it."""
+        if self._close_event:
+            self._close_event.cancel()
+            self._close_event = None
+
+        with self._device_lock:
+            if self._source is not None:
+                self._source.release()
+                self._source = None
+
+    def stats(self):
+        return {
+            'open': self.is_open,
+            'source': repr(self._source) if self._source else None,
+            'users': self._users,
+            'opens': self.opens,
+            'last_open_latency': self.last_open_latency,
+            'total_open_latency': self.total_open_latency,
+            'frames_delivered': self.frames_delivered,
+            'requested_size': self.capture_size,
+            'effective_size': self.effective_size,
+            'effective_fourcc': self.effective_fourcc,
+        }
+
+
+# Shared by every camera screen
+camera_manager = CameraManager()
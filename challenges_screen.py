@@ -1,7 +1,3 @@
-import os
-import pickle
-
-from kivy.core.audio import SoundLoader
 from kivymd.uix.boxlayout import MDBoxLayout
 from kivymd.uix.button import MDRaisedButton
 from kivymd.uix.screen import MDScreen
@@ -11,7 +7,10 @@ from kivy.uix.gridlayout import GridLayout
 from kivy.uix.behaviors import ButtonBehavior
 from kivy.uix.image import Image
 from kivy.metrics import dp
+from asset_resolver import asset_resolver
 from helpers import *
+from progress import progress
+from sound_bank import sound_bank
 from status import status_tracker
 
 class ImageButton(ButtonBehavior, Image):
@@ -24,8 +23,8 @@ class ChallengesScreen(MDScreen):
 
         # Initialize sounds
         self.sfx = {
-            'button_click': SoundLoader.load('assets/sounds/select2.mp3'),
-            'challenge_select': SoundLoader.load('assets/sounds/select2.mp3')
+            'button_click': sound_bank.acquire('assets/sounds/select2.mp3'),
+            'challenge_select': sound_bank.acquire('assets/sounds/select2.mp3')
         }
 
         # Main container to center content vertically
@@ -87,18 +86,11 @@ class ChallengesScreen(MDScreen):
         update_spacers()
 
         self.add_widget(main_box)
-
-    def on_enter(self):
-        """Update volumes when screen becomes active"""
-        for sound in self.sfx.values():
-            if sound:
-                sound.volume = self.app.sfx_volume
-        self.add_challenge_buttons()
+        self.add_widget(self.back_button)
 
     def play_sfx(self, sound_name):
         """Helper method to play SFX with current volume"""
         if sound_name in self.sfx and self.sfx[sound_name]:
-            self.sfx[sound_name].volume = self.app.sfx_volume
             self.sfx[sound_name].play()
 
     def open_vowel_easy(self, *args):
@@ -117,92 +109,50 @@ class ChallengesScreen(MDScreen):
         app.openVowelHard()
 
     def add_challenge_buttons(self):
-        # Clear existing widgets first
-        self.layout.clear_widgets()
-
-        if not os.path.exists("account_data.pkl"):
-            print("No account_data.pkl found. Creating new account.")
-            self.create_default_account()
-        else:
-            with open("account_data.pkl", "rb") as file:
-                account = pickle.load(file)
-
-            # easy button
-            if account.easyChallenge:
-                easyBtn = ImageButton(
-                    source=f'assets/vowelsEasyCheck.png',
-                    size_hint=(None, None),
-                    size=(dp(150), dp(150))
-                )
-            else:
-                easyBtn = ImageButton(
-                    source=f'assets/vowelsEasyClick.png',
-                    size_hint=(None, None),
-                    size=(dp(150), dp(150)),
-                )
-
-            # intermediate button
-            if not account.easyChallenge:
-                intermediateBtn = ImageButton(
-                    source=f'assets/vowelsInterLocked.png',
-                    size_hint=(None, None),
-                    size=(dp(150), dp(150)),
-                    disabled = True
-                )
-            elif account.intermediateChallenge:
-                intermediateBtn = ImageButton(
-                    source=f'assets/vowelsInterCheck.png',
-                    size_hint=(None, None),
-                    size=(dp(150), dp(150))
-                )
-            else:
-                intermediateBtn = ImageButton(
-                    source=f'assets/vowelsInterClick.png',
-                    size_hint=(None, None),
-                    size=(dp(150), dp(150)),
-                )
-
-            # hard button
-            if not account.intermediateChallenge:
-                hardBtn = ImageButton(
-                    source=f'assets/vowelsHardLocked.png',
-                    size_hint=(None, None),
-                    size=(dp(150), dp(150)),
-                    disabled=True
-                )
-            elif account.hardChallenge:
-                hardBtn = ImageButton(
-                    source=f'assets/vowelsHardCheck.png',
-                    size_hint=(None, None),
-                    size=(dp(150), dp(150))
-                )
+        """Creates the challenge buttons and the back button once; refresh_challenge_buttons keeps them current."""
+        easyBtn = ImageButton(source=asset_resolver.resolve('assets/vowelsEasyClick.png'), size_hint=(None, None), size=(dp(150), dp(150)))
+        intermediateBtn = ImageButton(source=asset_resolver.resolve('assets/vowelsInterClick.png'), size_hint=(None, None), size=(dp(150), dp(150)))
+        hardBtn = ImageButton(source=asset_resolver.resolve('assets/vowelsHardClick.png'), size_hint=(None, None), size=(dp(150), dp(150)))
+        self.challenge_buttons = [easyBtn, intermediateBtn, hardBtn]
+
+        # Bind buttons with sound effects
+        easyBtn.bind(on_press=lambda x: (self.play_sfx('button_click'), self.open_vowel_easy()))
+        intermediateBtn.bind(on_press=lambda x: (self.play_sfx('button_click'), self.open_vowel_intermediate()))
+        hardBtn.bind(on_press=lambda x: (self.play_sfx('button_click'), self.open_vowel_hard()))
+
+        self.layout.add_widget(easyBtn)
+        self.layout.add_widget(intermediateBtn)
+        self.layout.add_widget(hardBtn)
+
+        self.back_button = MDRaisedButton(
+            text='Back to Menu',
+            md_bg_color='gray',
+            on_release=lambda x: (self.play_sfx('button_click'), self.go_back()),
+            size_hint=(0.5, None),
+            pos_hint={'center_x': 0.5, 'center_y': 0.3}
+        )
+
+        self.refresh_challenge_buttons()
+        progress.bind(easyChallenge=self.refresh_challenge_buttons,
+                      intermediateChallenge=self.refresh_challenge_buttons,
+                      hardChallenge=self.refresh_challenge_buttons)
+
+    def refresh_challenge_buttons(self, *args):
+        """Updates the challenge button images and locks from the progress model."""
+        # Each challenge unlocks once the one before it is done: (name, unlocked, done)
+        states = [
+            ('Easy', True, progress.easyChallenge),
+            ('Inter', progress.easyChallenge, progress.intermediateChallenge),
+            ('Hard', progress.intermediateChallenge, progress.hardChallenge),
+        ]
+        for button, (name, unlocked, done) in zip(self.challenge_buttons, states):
+            button.disabled = not unlocked
+            if not unlocked:
+                button.source = asset_resolver.resolve(f'assets/vowels{name}Locked.png')
+            elif done:
+                button.source = asset_resolver.resolve(f'assets/vowels{name}Check.png')
             else:
-                hardBtn = ImageButton(
-                    source=f'assets/vowelsHardClick.png',
-                    size_hint=(None, None),
-                    size=(dp(150), dp(150)),
-                )
-
-            # Bind buttons with sound effects
-            easyBtn.bind(on_press=lambda x: (self.play_sfx('button_click'), self.open_vowel_easy()))
-            intermediateBtn.bind(on_press=lambda x: (self.play_sfx('button_click'), self.open_vowel_intermediate()))
-            hardBtn.bind(on_press=lambda x: (self.play_sfx('button_click'), self.open_vowel_hard()))
-
-            self.layout.add_widget(easyBtn)
-            self.layout.add_widget(intermediateBtn)
-            self.layout.add_widget(hardBtn)
-
-            back_button = MDRaisedButton(
-                text='Back to Menu',
-                md_bg_color='gray',
-                on_release=lambda x: (self.play_sfx('button_click'), self.go_back()),
-                size_hint=(0.5, None),
-                pos_hint={'center_x': 0.5, 'center_y': 0.3}
-            )
-            self.add_widget(back_button)
-
-    def create_default_account(self):
-        print('Creating default account')
+                button.source = asset_resolver.resolve(f'assets/vowels{name}Click.png')
 
     def go_back(self, *args):
         self.play_sfx('button_click')
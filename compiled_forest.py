@@ -0,0 +1,211 @@
+import os
+import pickle
+import sys
+import time
+
+import numpy as np
+
+
+class CompiledForest:
+    """A RandomForestClassifier flattened into contiguous NumPy arrays.
+
+    All trees share one set of node arrays (feature, threshold, left, right)
+    and roots holds the index of each tree's first node. Leaves point back to
+    themselves, so every sample can be walked max_depth steps without
+    branching. leaf_proba stores the normalized class probabilities of each
+    node exactly as DecisionTreeClassifier.predict_proba computes them, and
+    the trees are summed in estimator order, so the output is bit-for-bit the
+    same as the scikit-learn model it was compiled from.
+    """
+
+    def __init__(self, feature, threshold, left, right, leaf_proba, roots, classes, max_depth):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.leaf_proba = leaf_proba
+        self.roots = roots
+        self.classes_ = classes
+        self.max_depth = int(max_depth)
+
+    @classmethod
+    def from_sklearn(cls, model):
+        """Compile a fitted single-output RandomForestClassifier."""
+        n_classes = len(model.classes_)
+        features, thresholds, lefts, rights, probas, roots = [], [], [], [], [], []
+        offset = 0
+        max_depth = 0
+
+        for estimator in model.estimators_:
+            tree = estimator.tree_
+            nodes = np.arange(tree.node_count)
+            is_leaf = tree.children_left == -1
+
+            # Same normalization as DecisionTreeClassifier.predict_proba
+            proba = tree.value[:, 0, :n_classes].copy()
+            normalizer = proba.sum(axis=1)[:, np.newaxis]
+            normalizer[normalizer == 0.0] = 1.0
+            proba /= normalizer
+
+            features.append(np.where(is_leaf, 0, tree.feature))
+            thresholds.append(np.where(is_leaf, 0.0, tree.threshold))
+            lefts.append(np.where(is_leaf, nodes, tree.children_left) + offset)
+            rights.append(np.where(is_leaf, nodes, tree.children_right) + offset)
+            probas.append(proba)
+            roots.append(offset)
+
+            offset += tree.node_count
+            max_depth = max(max_depth, tree.max_depth)
+
+        return cls(
+            feature=np.concatenate(features).astype(np.intp),
+            threshold=np.concatenate(thresholds).astype(np.float64),
+            left=np.concatenate(lefts).astype(np.intp),
+            right=np.concatenate(rights).astype(np.intp),
+            leaf_proba=np.concatenate(probas).astype(np.float64),
+            roots=np.asarray(roots, dtype=np.intp),
+            classes=np.asarray(model.classes_),
+            max_depth=max_depth,
+        )
+
+    @classmethod
+    def load(cls, path):
+        """Load a forest written by save(); scikit-learn is not imported."""
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                feature=data['feature'].astype(np.intp),
+                threshold=data['threshold'],
+                left=data['left'].astype(np.intp),
+                right=data['right'].astype(np.intp),
+                leaf_proba=data['leaf_proba'],
+                roots=data['roots'].astype(np.intp),
+                classes=data['classes'],
+                max_depth=data['max_depth'],
+            )
+
+    def save(self, path):
+        np.savez(
+            path,
+            feature=self.feature.astype(np.int32),
+            threshold=self.threshold,
+            left=self.left.astype(np.int32),
+            right=self.right.astype(np.int32),
+            leaf_proba=self.leaf_proba,
+            roots=self.roots.astype(np.int32),
+            classes=self.classes_,
+            max_depth=np.int32(self.max_depth),
+        )
+
+    def apply(self, X):
+        """Return the leaf index reached in every tree, shape (n_samples, n_trees)."""
+        # scikit-learn trees compare float32 features against float64 thresholds
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+
+        rows = np.arange(len(X))[:, np.newaxis]
+        nodes = np.broadcast_to(self.roots, (len(X), len(self.roots))).copy()
+        for _ in range(self.max_depth):
+            go_left = X[rows, self.feature[nodes]] <= self.threshold[nodes]
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+        return nodes
+
+    def predict_proba(self, X):
+        """Class probabilities, shape (n_samples, n_classes); accepts one sample or a batch."""
+        leaves = self.apply(X)
+
+        # Trees have to be added one after another, in estimator order, like the
+        # forest does; a plain sum() may pair them up and round differently
+        if len(leaves) == 1:
+            proba = np.cumsum(self.leaf_proba[leaves[0]], axis=0)[-1:]
+        else:
+            proba = np.zeros((len(leaves), self.leaf_proba.shape[1]))
+            for tree_leaves in leaves.T:
+                proba += self.leaf_proba[tree_leaves]
+        proba /= len(self.roots)
+        return proba
+
+    def predict(self, X):
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+
+
+def compiled_path(model_path):
+    """Where the compiled copy of a pickled model lives, e.g. model.p -> model.forest.npz."""
+    return os.path.splitext(model_path)[0] + '.forest.npz'
+
+
+def load_model(model_path):
+    """Load the compiled forest for model_path, compiling it from the pickle if needed.
+
+    A compiled file older than the pickle is ignored.
+    """
+    path = compiled_path(model_path)
+    if os.path.exists(path) and os.path.getmtime(path) >= os.path.getmtime(model_path):
+        return CompiledForest.load(path)
+
+    with open(model_path, 'rb') as file:
+        model_dict = pickle.load(file)
+    return CompiledForest.from_sklearn(model_dict['model'])
+
+
+def export(model_path='./model.p'):
+    """Compile the pickled model and write it next to the pickle."""
+    with open(model_path, 'rb') as file:
+        model = pickle.load(file)['model']
+
+    forest = CompiledForest.from_sklearn(model)
+    path = compiled_path(model_path)
+    forest.save(path)
+    print(f"Wrote {path}: {len(forest.roots)} trees, {len(forest.feature)} nodes, depth {forest.max_depth}")
+    return path
+
+
+def benchmark(model_path='./model.p', samples=2000, single_iterations=500):
+    """Check the compiled forest against scikit-learn and compare their latency."""
+    with open(model_path, 'rb') as file:
+        model = pickle.load(file)['model']
+    forest = CompiledForest.from_sklearn(model)
+
+    rng = np.random.default_rng(0)
+    X = (rng.random((samples, model.n_features_in_)) * 0.6).astype(np.float32)
+
+    identical = np.array_equal(model.predict_proba(X), forest.predict_proba(X))
+    print(f"Batch of {samples} bit-for-bit identical: {identical}")
+
+    mismatches = sum(not np.array_equal(model.predict_proba(x.reshape(1, -1)), forest.predict_proba(x))
+                     for x in X[:200])
+    print(f"Single-sample mismatches in 200 samples: {mismatches}")
+
+    x = X[:1]
+    start = time.perf_counter()
+    for _ in range(single_iterations):
+        model.predict_proba(x)
+    sklearn_single = (time.perf_counter() - start) / single_iterations
+
+    start = time.perf_counter()
+    for _ in range(single_iterations):
+        forest.predict_proba(x)
+    compiled_single = (time.perf_counter() - start) / single_iterations
+
+    start = time.perf_counter()
+    model.predict_proba(X)
+    sklearn_batch = time.perf_counter() - start
+
+    start = time.perf_counter()
+    forest.predict_proba(X)
+    compiled_batch = time.perf_counter() - start
+
+    print(f"Single sample: scikit-learn {sklearn_single * 1e3:.3f} ms, compiled {compiled_single * 1e3:.3f} ms "
+          f"({sklearn_single / compiled_single:.1f}x)")
+    print(f"Batch of {samples}: scikit-learn {sklearn_batch * 1e3:.2f} ms, compiled {compiled_batch * 1e3:.2f} ms "
+          f"({sklearn_batch / compiled_batch:.1f}x)")
+
+
+if __name__ == '__main__':
+    # python compiled_forest.py [export|benchmark] [model path]
+    command = sys.argv[1] if len(sys.argv) > 1 else 'export'
+    path = sys.argv[2] if len(sys.argv) > 2 else './model.p'
+    if command == 'benchmark':
+        benchmark(path)
+    else:
+        export(path)
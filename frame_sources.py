@@ -0,0 +1,230 @@
+import os
+import time
+
+import cv2
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp')
+
+
+class FrameSource:
+    """Something that delivers BGR frames like cv2.VideoCapture does.
+
+    Subclasses implement _open(), _read() and _release(). Recorded sources
+    are paced to their frame rate when realtime is True, or delivered as fast
+    as the caller reads them otherwise, which is what benchmarks want.
+    """
+
+    live = False
+
+    def __init__(self, fps=30.0, realtime=True):
+        self.fps = fps
+        self.realtime = realtime
+        self.effective_size = None
+        self.effective_fourcc = None
+        self.is_open = False
+        self._next_frame_time = None
+
+    def open(self):
+        self._open()
+        self.is_open = True
+        self._next_frame_time = None
+
+    def read(self):
+        """Return (ret, frame) for the next frame."""
+        if self.realtime and not self.live:
+            self._pace()
+        return self._read()
+
+    def grab(self):
+        """Advance past the next frame without decoding it if possible. Returns True on success."""
+        if self.realtime and not self.live:
+            self._pace()
+        return self._grab()
+
+    def release(self):
+        if self.is_open:
+            self._release()
+            self.is_open = False
+
+    def _pace(self):
+        now = time.perf_counter()
+        if self._next_frame_time is None:
+            self._next_frame_time = now
+        elif self._next_frame_time > now:
+            time.sleep(self._next_frame_time - now)
+        else:
+            # Fell behind; don't try to catch up with a burst of frames
+            self._next_frame_time = now
+        self._next_frame_time += 1.0 / self.fps
+
+    def _open(self):
+        raise NotImplementedError
+
+    def _read(self):
+        raise NotImplementedError
+
+    def _grab(self):
+        return self._read()[0]
+
+    def _release(self):
+        pass
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.describe()})"
+
+    def describe(self):
+        return ''
+
+
+class CameraSource(FrameSource):
+    """A webcam. capture_size and MJPG are requests; what the driver picked is read back."""
+
+    live = True
+
+    def __init__(self, camera_index=0, capture_size=(640, 480), use_mjpg=True):
+        super().__init__(realtime=True)
+        self.camera_index = camera_index
+        self.capture_size = capture_size
+        self.use_mjpg = use_mjpg
+        self._capture = None
+
+    def _open(self):
+        self._capture = cv2.VideoCapture(self.camera_index)
+        if not self._capture.isOpened():
+            self._capture.release()
+            self._capture = None
+            raise IOError(f"Cannot open camera {self.camera_index}")
+        if self.use_mjpg:
+            self._capture.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+        if self.capture_size:
+            self._capture.set(cv2.CAP_PROP_FRAME_WIDTH, self.capture_size[0])
+            self._capture.set(cv2.CAP_PROP_FRAME_HEIGHT, self.capture_size[1])
+
+        self.effective_size = (int(self._capture.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                               int(self._capture.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+        fourcc = int(self._capture.get(cv2.CAP_PROP_FOURCC))
+        self.effective_fourcc = ''.join(chr((fourcc >> (8 * i)) & 0xFF) for i in range(4)) if fourcc else None
+        self.fps = self._capture.get(cv2.CAP_PROP_FPS) or self.fps
+
+    def _read(self):
+        return self._capture.read()
+
+    def _grab(self):
+        # Keeps the driver's buffer drained without paying for the decode
+        return self._capture.grab()
+
+    def _release(self):
+        self._capture.release()
+        self._capture = None
+
+    def describe(self):
+        return f"camera {self.camera_index}"
+
+
+class VideoFileSource(FrameSource):
+    """A recorded video, restarted from the beginning when it ends if loop is True."""
+
+    def __init__(self, path, realtime=True, loop=True):
+        super().__init__(realtime=realtime)
+        self.path = path
+        self.loop = loop
+        self._capture = None
+
+    def _open(self):
+        self._capture = cv2.VideoCapture(self.path)
+        if not self._capture.isOpened():
+            self._capture.release()
+            self._capture = None
+            raise IOError(f"Cannot open video {self.path}")
+        self.fps = self._capture.get(cv2.CAP_PROP_FPS) or self.fps
+        self.effective_size = (int(self._capture.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                               int(self._capture.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+
+    def _read(self):
+        ret, frame = self._capture.read()
+        if not ret and self.loop:
+            self._capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self._capture.read()
+        return ret, frame
+
+    def _release(self):
+        self._capture.release()
+        self._capture = None
+
+    def describe(self):
+        return self.path
+
+
+class ImageSequenceSource(FrameSource):
+    """The images in a directory, in file name order, played back at fps.
+
+    The first max_cached frames are kept once decoded. A sequence up to
+    that length loops without decoding again, so benchmarks measure the
+    pipeline rather than imread(); a longer one only keeps that prefix
+    in memory and decodes the rest on every pass. An image that can't be
+    decoded is a failed read.
+    """
+
+    def __init__(self, directory, fps=30.0, realtime=True, loop=True, max_cached=300):
+        super().__init__(fps=fps, realtime=realtime)
+        self.directory = directory
+        self.loop = loop
+        self.max_cached = max_cached
+        self._paths = []
+        self._frames = {}
+        self._position = 0
+
+    def _open(self):
+        self._paths = sorted(os.path.join(self.directory, name) for name in os.listdir(self.directory)
+                             if name.lower().endswith(IMAGE_EXTENSIONS))
+        if not self._paths:
+            raise IOError(f"No images in {self.directory}")
+        self._position = 0
+        first = self._frame(0)
+        if first is None:
+            raise IOError(f"Cannot read {self._paths[0]}")
+        self.effective_size = (first.shape[1], first.shape[0])
+
+    def _frame(self, index):
+        frame = self._frames.get(index)
+        if frame is None:
+            frame = cv2.imread(self._paths[index])
+            if frame is not None and index < self.max_cached:
+                self._frames[index] = frame
+        return frame
+
+    def _read(self):
+        if self._position >= len(self._paths):
+            if not self.loop:
+                return False, None
+            self._position = 0
+
+        frame = self._frame(self._position)
+        self._position += 1
+        return frame is not None, frame
+
+    def _release(self):
+        self._frames.clear()
+
+    def describe(self):
+        return self.directory
+
+
+def make_frame_source(spec=None, realtime=None, capture_size=(640, 480), use_mjpg=True):
+    """Build a FrameSource from a spec string.
+
+    The spec is a camera index ("0"), a video file or a directory of images.
+    Without one, SIGNITUP_FRAME_SOURCE is used, then camera 0. Pacing comes
+    from SIGNITUP_FRAME_PACING ("realtime" or "fast") unless realtime is given.
+    """
+    if spec is None:
+        spec = os.environ.get('SIGNITUP_FRAME_SOURCE', '0')
+    if realtime is None:
+        realtime = os.environ.get('SIGNITUP_FRAME_PACING', 'realtime') != 'fast'
+
+    spec = str(spec)
+    if spec.isdigit():
+        return CameraSource(int(spec), capture_size=capture_size, use_mjpg=use_mjpg)
+    if os.path.isdir(spec):
+        return ImageSequenceSource(spec, realtime=realtime)
+    return VideoFileSource(spec, realtime=realtime)
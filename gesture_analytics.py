@@ -0,0 +1,364 @@
+import glob
+import os
+import threading
+import time
+
+import numpy as np
+
+# Names for the recognizer's class indices, for reports
+LABELS = ('A', 'E', 'I', 'O', 'U', 'Intro')
+
+# Screens attempts are made on
+LETTER, INTRO, INTERMEDIATE, HARD = range(4)
+SCREEN_NAMES = ('letter', 'intro', 'intermediate', 'hard')
+
+# Row kinds. A FRAME row is one recognition result shown to the learner.
+START, FRAME, SUCCESS, FAILURE, ABANDONED = range(5)
+
+# predicted values that aren't a class
+NO_HAND = -1
+PREDICTION_ERROR = -2
+
+# Column name -> dtype; one array per column, in memory and on disk
+COLUMNS = {
+    'timestamp': np.float64,
+    'started_at': np.float64,  # when the attempt started; identifies it
+    'screen': np.uint8,
+    'target': np.int8,
+    'predicted': np.int8,
+    'confidence': np.float32,
+    'hold': np.float32,  # seconds the correct gesture had been held
+    'matched': np.bool_,  # the screen counted the frame as the correct gesture
+    'event': np.uint8,
+}
+
+
+class GestureAnalytics:
+    """Records every recognition attempt on the gesture screens.
+
+    Rows go into preallocated column arrays used as a ring buffer, so
+    recording a frame is a handful of scalar writes and allocates nothing.
+    When the ring fills up, and when the app stops, the rows are copied out
+    in one go and written on a background thread as a chunk of columns
+    (an .npz per chunk) in `directory`. load() reads all chunks back plus
+    the rows not flushed yet, and the report methods work on that.
+
+    Chunks older than retention_days are deleted after each write, and
+    once there are more than max_chunks the oldest are merged into one, so
+    a machine that runs for months keeps a bounded history and load()
+    opens a bounded number of files.
+
+    A frame counts as correct when the screen's GestureHold matched it,
+    which is what the learner saw; frames the motion gate reused aren't
+    logged, since no new prediction was made for them.
+
+    An attempt starts when a screen is entered (start_attempt()) and ends in
+    success, failure, or being abandoned when the screen is left. Only one
+    attempt is open at a time.
+    """
+
+    def __init__(self, capacity=4096, directory='gesture_analytics', confidence_threshold=0.7,
+                 retention_days=90, max_chunks=64):
+        self.capacity = capacity
+        self.directory = directory
+        self.confidence_threshold = confidence_threshold  # for records made without a matched state
+        self.retention_days = retention_days
+        self.max_chunks = max_chunks
+        self._lock = threading.Lock()
+        self._prune_lock = threading.Lock()
+        self._columns = {name: np.zeros(capacity, dtype=dtype) for name, dtype in COLUMNS.items()}
+        self._position = 0
+        self._chunk = 0
+        self._writers = []
+
+        # The open attempt
+        self._started_at = 0.0
+        self._screen = 0
+        self._target = 0
+        self._open = False
+
+        # Counters
+        self.rows = 0
+        self.flushes = 0
+        self.chunks_deleted = 0
+        self.chunks_merged = 0
+
+    def _append(self, event, predicted=NO_HAND, confidence=0.0, hold=0.0, matched=False):
+        with self._lock:
+            i = self._position
+            columns = self._columns
+            columns['timestamp'][i] = time.time()
+            columns['started_at'][i] = self._started_at
+            columns['screen'][i] = self._screen
+            columns['target'][i] = self._target
+            columns['predicted'][i] = predicted
+            columns['confidence'][i] = confidence
+            columns['hold'][i] = hold
+            columns['matched'][i] = matched
+            columns['event'][i] = event
+            self._position = i + 1
+            self.rows += 1
+            full = self._position == self.capacity
+        if full:
+            self.flush()
+
+    def start_attempt(self, screen, target):
+        """Begin an attempt at gesture `target` on `screen`; ends any attempt left open."""
+        self.abandon()
+        self._started_at = time.time()
+        self._screen = screen
+        self._target = target
+        self._open = True
+        self._append(START)
+
+    def record(self, predicted, confidence=0.0, hold=0.0, matched=None):
+        """Log one recognition result of the open attempt.
+
+        matched None means the screen has no hold state; confidence_threshold decides then.
+        """
+        if not self._open:
+            return
+        if matched is None:
+            matched = predicted == self._target and confidence >= self.confidence_threshold
+        self._append(FRAME, predicted, confidence, hold, matched)
+
+    def record_result(self, result, hold=0.0, matched=None):
+        """Log a RecognitionResult of the open attempt; results the motion gate reused are skipped."""
+        if result.stage == 'reused':
+            return
+        if not result.hand_detected:
+            self.record(NO_HAND, matched=False)
+        elif result.error is not None:
+            self.record(PREDICTION_ERROR, matched=False)
+        else:
+            self.record(result.class_idx, result.confidence, hold, matched)
+
+    def end_attempt(self, event, hold=0.0):
+        """Close the open attempt with SUCCESS, FAILURE or ABANDONED. Does nothing if none is open."""
+        if self._open:
+            self._append(event, hold=hold)
+            self._open = False
+
+    def success(self, hold=0.0):
+        self.end_attempt(SUCCESS, hold)
+
+    def failure(self):
+        self.end_attempt(FAILURE)
+
+    def abandon(self):
+        self.end_attempt(ABANDONED)
+
+    def flush(self, wait=False):
+        """Write the buffered rows to a new chunk file and empty the ring."""
+        with self._lock:
+            if self._position == 0:
+                return
+            chunk = {name: column[:self._position].copy() for name, column in self._columns.items()}
+            self._position = 0
+            self._chunk += 1
+            path = os.path.join(self.directory, f"attempts-{int(time.time())}-{os.getpid()}-{self._chunk}.npz")
+            self.flushes += 1
+
+        writer = threading.Thread(target=self._write, args=(path, chunk), daemon=True)
+        writer.start()
+        self._writers = [w for w in self._writers if w.is_alive()] + [writer]
+        if wait:
+            self.join()
+
+    def join(self):
+        for writer in self._writers:
+            writer.join()
+        self._writers = []
+
+    def _write(self, path, chunk):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            temp_path = path + '.tmp'
+            with open(temp_path, 'wb') as file:
+                np.savez(file, **chunk)
+            os.replace(temp_path, path)
+            self._prune()
+        except OSError as e:
+            print(f"Error saving gesture analytics: {e}")
+
+    def _chunk_paths(self):
+        # Named attempts-<unix time>-..., so the name gives the chunk's age
+        paths = []
+        for path in glob.glob(os.path.join(self.directory, 'attempts-*.npz')):
+            try:
+                written = int(os.path.basename(path).split('-')[1])
+            except (IndexError, ValueError):
+                continue
+            paths.append((written, path))
+        return sorted(paths)
+
+    def _prune(self):
+        """Delete chunks past retention_days and merge the oldest beyond max_chunks."""
+        with self._prune_lock:
+            chunks = self._chunk_paths()
+            if self.retention_days:
+                cutoff = time.time() - self.retention_days * 86400
+                for written, path in chunks:
+                    if written < cutoff:
+                        os.remove(path)
+                        self.chunks_deleted += 1
+                chunks = [(written, path) for written, path in chunks if written >= cutoff]
+
+            if self.max_chunks and len(chunks) > self.max_chunks:
+                oldest = chunks[:len(chunks) - self.max_chunks + 1]
+                parts = [_read_chunk(path, self.confidence_threshold) for _, path in oldest]
+                merged = {name: np.concatenate([part[name] for part in parts if part is not None])
+                          for name in COLUMNS}
+                # Keeps the oldest chunk's time, so retention still goes by it
+                path = os.path.join(self.directory, f"attempts-{oldest[0][0]}-{os.getpid()}-merged.npz")
+                temp_path = path + '.tmp'
+                with open(temp_path, 'wb') as file:
+                    np.savez(file, **merged)
+                for _, old_path in oldest:
+                    os.remove(old_path)
+                os.replace(temp_path, path)
+                self.chunks_merged += len(oldest)
+
+    def close(self):
+        self.abandon()
+        self.flush(wait=True)
+
+    def load(self):
+        """Return {column: array} of every row on disk and in memory, oldest first."""
+        parts = {name: [] for name in COLUMNS}
+        for _, path in self._chunk_paths():
+            chunk = _read_chunk(path, self.confidence_threshold)
+            if chunk is not None:
+                for name in COLUMNS:
+                    parts[name].append(chunk[name])
+        with self._lock:
+            for name, column in self._columns.items():
+                parts[name].append(column[:self._position].copy())
+
+        data = {name: np.concatenate(arrays) for name, arrays in parts.items()}
+        order = np.argsort(data['timestamp'], kind='stable')
+        return {name: column[order] for name, column in data.items()}
+
+    def _select(self, data, screen):
+        data = self.load() if data is None else data
+        if screen is None:
+            return data
+        mask = data['screen'] == screen
+        return {name: column[mask] for name, column in data.items()}
+
+    def time_to_success(self, screen=None, data=None):
+        """Return {target: array of seconds from start to success} for successful attempts."""
+        data = self._select(data, screen)
+        done = data['event'] == SUCCESS
+        seconds = data['timestamp'][done] - data['started_at'][done]
+        targets = data['target'][done]
+        return {int(target): seconds[targets == target] for target in np.unique(targets)}
+
+    def time_to_success_percentiles(self, percentiles=(50, 90, 95), screen=None, data=None):
+        """Return {label: {'count': n, 'p50': seconds, ...}} per target gesture."""
+        report = {}
+        for target, seconds in self.time_to_success(screen, data).items():
+            row = {'count': len(seconds)}
+            for p, value in zip(percentiles, np.percentile(seconds, percentiles)):
+                row[f'p{p}'] = float(value)
+            report[label(target)] = row
+        return report
+
+    def confusion_counts(self, screen=None, data=None):
+        """Return a (targets x classes) matrix counting frames by target and predicted class.
+
+        Frames without a hand or with a prediction error aren't counted.
+        """
+        data = self._select(data, screen)
+        frames = (data['event'] == FRAME) & (data['predicted'] >= 0)
+        matrix = np.zeros((len(LABELS), len(LABELS)), dtype=np.int64)
+        np.add.at(matrix, (data['target'][frames], data['predicted'][frames]), 1)
+        return matrix
+
+    def incorrect_flickers(self, screen=None, data=None):
+        """Return {label: mean number of correct -> incorrect switches per successful attempt}.
+
+        A switch is a frame with a hand that the screen didn't match right
+        after one it did: the "Gesture incorrect" flicker while the learner
+        holds the sign.
+        """
+        data = self._select(data, screen)
+        frames = (data['event'] == FRAME) & (data['predicted'] != NO_HAND)
+        started_at = data['started_at'][frames]
+        targets = data['target'][frames]
+        correct = data['matched'][frames]
+
+        order = np.lexsort((data['timestamp'][frames], started_at))
+        started_at, targets, correct = started_at[order], targets[order], correct[order]
+        flicker = correct[:-1] & ~correct[1:] & (started_at[:-1] == started_at[1:])
+
+        succeeded = data['event'] == SUCCESS
+        report = {}
+        for target in np.unique(data['target'][succeeded]):
+            attempts = data['started_at'][succeeded & (data['target'] == target)]
+            count = np.isin(started_at[1:][flicker], attempts).sum()
+            report[label(target)] = float(count) / len(attempts)
+        return report
+
+    def confidence_summary(self, screen=None, data=None):
+        """Return {label: {'frames', 'p50', 'p90'}} of the model's confidence on frames of that target."""
+        data = self._select(data, screen)
+        frames = (data['event'] == FRAME) & (data['predicted'] >= 0)
+        report = {}
+        for target in np.unique(data['target'][frames]):
+            confidence = data['confidence'][frames & (data['target'] == target)]
+            p50, p90 = np.percentile(confidence, [50, 90])
+            report[label(target)] = {'frames': len(confidence), 'p50': float(p50), 'p90': float(p90)}
+        return report
+
+    def outcomes(self, screen=None, data=None):
+        """Return {label: {'success': n, 'failure': n, 'abandoned': n}}."""
+        data = self._select(data, screen)
+        report = {}
+        for event, name in ((SUCCESS, 'success'), (FAILURE, 'failure'), (ABANDONED, 'abandoned')):
+            targets = data['target'][data['event'] == event]
+            for target, count in zip(*np.unique(targets, return_counts=True)):
+                report.setdefault(label(target), {'success': 0, 'failure': 0, 'abandoned': 0})[name] = int(count)
+        return report
+
+
+def _read_chunk(path, confidence_threshold):
+    """Return {column: array} of a chunk file, or None if it can't be read."""
+    try:
+        with np.load(path) as chunk:
+            data = {name: chunk[name] for name in COLUMNS if name in chunk.files}
+    except (OSError, ValueError) as e:
+        print(f"Skipping {path}: {e}")
+        return None
+
+    missing = [name for name in COLUMNS if name not in data]
+    if missing == ['matched']:
+        # Written before the screens logged their matched state
+        data['matched'] = (data['predicted'] == data['target']) & (data['confidence'] >= confidence_threshold)
+    elif missing:
+        print(f"Skipping {path}: no {', '.join(missing)}")
+        return None
+    return data
+
+
+def label(target):
+    return LABELS[target] if 0 <= target < len(LABELS) else str(target)
+
+
+# Shared by the gesture screens
+gesture_analytics = GestureAnalytics()
+
+
+if __name__ == '__main__':
+    # python gesture_analytics.py [letter|intro|intermediate|hard]
+    import sys
+
+    screen = SCREEN_NAMES.index(sys.argv[1]) if len(sys.argv) > 1 else None
+    data = gesture_analytics.load()
+    print(f"{len(data['timestamp'])} rows")
+    print("Outcomes:", gesture_analytics.outcomes(screen, data))
+    print("Time to success (s):", gesture_analytics.time_to_success_percentiles(screen=screen, data=data))
+    print("Incorrect flickers per success:", gesture_analytics.incorrect_flickers(screen, data))
+    print("Confidence:", gesture_analytics.confidence_summary(screen, data))
+    print("Confusion (rows: target, columns: predicted", ", ".join(LABELS) + "):")
+    print(gesture_analytics.confusion_counts(screen, data))
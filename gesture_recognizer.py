@@ -0,0 +1,383 @@
+import dataclasses
+import os
+import threading
+import time
+
+import cv2
+import mediapipe as mp
+import numpy as np
+
+from compiled_forest import load_model
+from landmark_features import LandmarkFeatureExtractor
+from motion_gate import MotionGate
+from pipeline_metrics import pipeline_metrics
+from probability_smoother import ProbabilitySmoother
+
+mp_hands = mp.solutions.hands
+mp_drawing = mp.solutions.drawing_utils
+mp_drawing_styles = mp.solutions.drawing_styles
+
+
+def _rgb_style(style):
+    """Swap the channel order of MediaPipe's BGR drawing colors so they look right on RGB frames."""
+    return {key: dataclasses.replace(spec, color=tuple(reversed(spec.color))) for key, spec in style.items()}
+
+
+_landmarks_style = _rgb_style(mp_drawing_styles.get_default_hand_landmarks_style())
+_connections_style = _rgb_style(mp_drawing_styles.get_default_hand_connections_style())
+
+_GRAPH_OPTIONS = ('streaming', 'min_detection_confidence', 'min_tracking_confidence', 'max_num_hands')
+_SIZE_OPTIONS = ('inference_width', 'preview_width')
+_FRAME_OPTIONS = ('inference_stride',)
+
+
+def fit_width(frame, width):
+    """Shrink frame to the given width, keeping its aspect ratio; smaller frames are returned as is."""
+    if not width or frame.shape[1] <= width:
+        return frame
+    height = max(1, round(frame.shape[0] * width / frame.shape[1]))
+    return cv2.resize(frame, (width, height), interpolation=cv2.INTER_AREA)
+
+
+def resident_memory():
+    """Return the current resident memory of this process in bytes, or None if it can't be read."""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+
+    # Without psutil only Linux tells us the current figure; ru_maxrss elsewhere is the peak
+    try:
+        with open('/proc/self/statm') as file:
+            pages = int(file.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class RecognitionResult:
+    """Outcome of running the recognizer on one camera frame."""
+
+    def __init__(self, frame_rgb, seq=0):
+        self.frame_rgb = frame_rgb  # RGB frame with the hand landmarks drawn on it
+        self.seq = seq
+        self.timestamp = time.monotonic()
+        self.hand_detected = False
+        self.class_idx = None  # smoothed over recent frames, see ProbabilitySmoother
+        self.confidence = 0.0
+        self.raw_class_idx = None  # this frame's own prediction
+        self.raw_confidence = 0.0
+        self.stability = 0.0
+        self.error = None
+        self.stage = None  # 'detection' or 'tracking', whichever MediaPipe ran; 'reused' if neither did
+        self.captured_at = None  # time.perf_counter() when the camera frame was read
+
+
+class GestureRecognizer:
+    """Owns the gesture classifier and the MediaPipe Hands graph for the whole app.
+
+    Nothing is loaded at import time. The first camera screen that needs the
+    recognizer calls load() and every other screen reuses the same instances.
+
+    In streaming mode MediaPipe tracks the hand landmarks from one frame to the
+    next and only runs the palm detector when tracking is lost, i.e. when the
+    landmark confidence drops below min_tracking_confidence. Static mode runs
+    the detector on every frame.
+
+    Camera frames are shrunk to inference_width before MediaPipe sees them and
+    to preview_width for display; None keeps the full frame width. MediaPipe
+    returns normalized landmarks, so the features don't depend on either size.
+
+    The classifier's probabilities go through a ProbabilitySmoother, so
+    class_idx and confidence of a result describe the last few frames
+    rather than a single one. With an inference_stride of n only every nth
+    frame goes through MediaPipe and the classifier; the frames in between
+    are shown with the previous landmarks and prediction. A motion_gate
+    (see MotionGate) does the same for frames where nothing moved since the
+    last processed one, e.g. while the learner reads the instructions.
+    """
+
+    def __init__(self, model_path='./model.p', streaming=True, min_detection_confidence=0.3,
+                 min_tracking_confidence=0.5, max_num_hands=1, inference_width=480, preview_width=320,
+                 inference_stride=1, smoother=None, motion_gate=None, metrics=pipeline_metrics):
+        self.model_path = model_path
+        self.metrics = metrics
+        self.inference_width = inference_width
+        self.preview_width = preview_width
+        self.inference_stride = inference_stride
+        self.smoother = smoother if smoother is not None else ProbabilitySmoother()
+        self.motion_gate = motion_gate
+        self.streaming = streaming
+        self.min_detection_confidence = min_detection_confidence
+        self.min_tracking_confidence = min_tracking_confidence
+        self.max_num_hands = max_num_hands
+        self._model = None
+        self._hands = None
+        self._lock = threading.Lock()
+        self._process_lock = threading.Lock()
+        self._tracking = False
+        self._features = LandmarkFeatureExtractor()
+        self._frame_count = 0
+        self._last_landmarks = None
+        self._last_result = None
+
+        # Per-frame counts of which MediaPipe stage ran, and of frames that skipped it
+        self.detection_frames = 0
+        self.tracking_frames = 0
+        self.reused_frames = 0
+
+        # Sizes of the last processed frame, as (width, height)
+        self.input_size = None
+        self.inference_size = None
+        self.preview_size = None
+
+        # Load statistics
+        self.load_time = None
+        self.rss_before_load = None
+        self.rss_after_load = None
+
+    @property
+    def loaded(self):
+        return self._hands is not None
+
+    @property
+    def model(self):
+        self.load()
+        return self._model
+
+    @property
+    def hands(self):
+        self.load()
+        return self._hands
+
+    def load(self):
+        """Load the classifier and build the Hands graph if that hasn't happened yet."""
+        if self._hands is not None:
+            return
+
+        with self._lock:
+            if self._hands is not None:
+                return
+
+            self.rss_before_load = resident_memory()
+            start = time.perf_counter()
+
+            # Flattened copy of the RandomForest, see compiled_forest.py
+            self._model = load_model(self.model_path)
+            self._hands = self._create_hands()
+
+            self.load_time = time.perf_counter() - start
+            self.rss_after_load = resident_memory()
+
+    def _create_hands(self):
+        # Palm detection runs whenever fewer than max_num_hands hands are tracked,
+        # so tracking only pays off when max_num_hands matches what we classify
+        return mp_hands.Hands(
+            static_image_mode=not self.streaming,
+            max_num_hands=self.max_num_hands,
+            min_detection_confidence=self.min_detection_confidence,
+            min_tracking_confidence=self.min_tracking_confidence,
+        )
+
+    def configure(self, **options):
+        """Change the processing widths, inference_stride, streaming, max_num_hands or the confidence thresholds.
+
+        The Hands graph is rebuilt if one of its settings changed after it was loaded.
+        """
+        for name, value in options.items():
+            if name not in _GRAPH_OPTIONS + _SIZE_OPTIONS + _FRAME_OPTIONS:
+                raise ValueError(f"Unknown recognizer option: {name}")
+            setattr(self, name, value)
+
+        if not any(name in _GRAPH_OPTIONS for name in options):
+            return
+
+        with self._process_lock:
+            if self._hands is not None:
+                self._hands.close()
+                self._hands = self._create_hands()
+            self._tracking = False
+
+    def reset_tracking(self):
+        """Forget the tracked hand so the next frame runs the palm detector.
+
+        Called when a new camera stream starts so landmarks and predictions
+        from a previous screen are never carried over.
+        """
+        with self._process_lock:
+            if self._hands is not None and self.streaming:
+                self._hands.reset()
+            self._tracking = False
+            self._frame_count = 0
+            self._last_landmarks = None
+            self._last_result = None
+            self.smoother.reset()
+            if self.motion_gate is not None:
+                self.motion_gate.reset()
+
+    def process(self, frame, seq=0):
+        """Detect a hand in a BGR frame and classify its gesture.
+
+        The frame is shrunk to inference_width and converted to RGB once.
+        MediaPipe reads that buffer, which is then shrunk further to
+        preview_width if needed and annotated with the landmarks for display.
+        Only the first detected hand is classified. Safe to call from a
+        worker thread.
+        """
+        metrics = self.metrics
+        self._frame_count += 1
+        if self._last_result is not None:
+            if self.inference_stride > 1 and self._frame_count % self.inference_stride:
+                return self.reuse(frame, seq)
+            if self.motion_gate is not None:
+                with metrics.stage('motion'):
+                    moved = self.motion_gate.check(frame)
+                if not moved:
+                    metrics.count('motion_skipped')
+                    return self.reuse(frame, seq)
+
+        with metrics.stage('convert'):
+            frame_rgb = cv2.cvtColor(fit_width(frame, self.inference_width), cv2.COLOR_BGR2RGB)
+
+        self.load()
+        with self._process_lock:
+            with metrics.stage('hands'):
+                results = self._hands.process(frame_rgb)
+
+            if self._tracking:
+                stage = 'tracking'
+                self.tracking_frames += 1
+            else:
+                stage = 'detection'
+                self.detection_frames += 1
+            self._tracking = self.streaming and bool(results.multi_hand_landmarks)
+
+        # MediaPipe is done with frame_rgb, so it can be reused for the preview
+        preview_rgb = fit_width(frame_rgb, self.preview_width)
+        result = RecognitionResult(preview_rgb, seq)
+        result.stage = stage
+
+        self.input_size = (frame.shape[1], frame.shape[0])
+        self.inference_size = (frame_rgb.shape[1], frame_rgb.shape[0])
+        self.preview_size = (preview_rgb.shape[1], preview_rgb.shape[0])
+
+        self._last_result = result
+        self._last_landmarks = results.multi_hand_landmarks
+        if not results.multi_hand_landmarks:
+            self.smoother.reset()
+            return result
+
+        result.hand_detected = True
+        with metrics.stage('draw'):
+            for hand_landmarks in results.multi_hand_landmarks:
+                mp_drawing.draw_landmarks(
+                    preview_rgb,
+                    hand_landmarks,
+                    mp_hands.HAND_CONNECTIONS,
+                    _landmarks_style,
+                    _connections_style
+                )
+
+        try:
+            with self._process_lock:
+                with metrics.stage('features'):
+                    features = self._features.extract(results.multi_hand_landmarks[0])
+                with metrics.stage('predict'):
+                    proba = self._model.predict_proba(features.reshape(1, -1))
+                self.smoother.update(proba)
+            result.raw_class_idx = int(np.argmax(proba))
+            result.raw_confidence = float(np.max(proba))
+            result.class_idx = self.smoother.class_idx
+            result.confidence = self.smoother.confidence
+            result.stability = self.smoother.stability
+        except Exception as e:
+            result.error = e
+
+        return result
+
+    def reuse(self, frame, seq=0):
+        """Show a BGR frame with the landmarks and prediction of the last processed frame.
+
+        Only resizes, converts and draws; neither MediaPipe nor the
+        classifier runs. Before the first processed frame this is process().
+        """
+        last = self._last_result
+        if last is None:
+            return self.process(frame, seq)
+
+        with self.metrics.stage('convert'):
+            # Same two steps as process(), so the preview keeps exactly the same size
+            preview_rgb = cv2.cvtColor(fit_width(fit_width(frame, self.inference_width), self.preview_width),
+                                       cv2.COLOR_BGR2RGB)
+        result = RecognitionResult(preview_rgb, seq)
+        result.stage = 'reused'
+        result.hand_detected = last.hand_detected
+        result.class_idx = last.class_idx
+        result.confidence = last.confidence
+        result.raw_class_idx = last.raw_class_idx
+        result.raw_confidence = last.raw_confidence
+        result.stability = last.stability
+        result.error = last.error
+        self.reused_frames += 1
+
+        landmarks = self._last_landmarks
+        if landmarks:
+            with self.metrics.stage('draw'):
+                for hand_landmarks in landmarks:
+                    mp_drawing.draw_landmarks(
+                        preview_rgb,
+                        hand_landmarks,
+                        mp_hands.HAND_CONNECTIONS,
+                        _landmarks_style,
+                        _connections_style
+                    )
+        return result
+
+    def close(self):
+        """Release the Hands graph and the classifier; the next use loads them again."""
+        with self._lock:
+            if self._hands is not None:
+                self._hands.close()
+            self._hands = None
+            self._model = None
+
+    def stats(self):
+        """Return load time and memory figures as a dictionary."""
+        return {
+            'loaded': self.loaded,
+            'streaming': self.streaming,
+            'detection_frames': self.detection_frames,
+            'tracking_frames': self.tracking_frames,
+            'reused_frames': self.reused_frames,
+            'inference_stride': self.inference_stride,
+            'smoother': self.smoother.stats(),
+            'motion_gate': self.motion_gate.stats() if self.motion_gate is not None else None,
+            'input_size': self.input_size,
+            'inference_size': self.inference_size,
+            'preview_size': self.preview_size,
+            'load_time': self.load_time,
+            'rss_before_load': self.rss_before_load,
+            'rss_after_load': self.rss_after_load,
+            'rss_now': resident_memory(),
+        }
+
+    def report(self):
+        """Return a one-line human readable summary of stats()."""
+        stats = self.stats()
+        if not stats['loaded']:
+            return "Gesture recognizer: not loaded"
+
+        def mb(value):
+            return "n/a" if value is None else f"{value / (1024 * 1024):.1f} MB"
+
+        return (f"Gesture recognizer: loaded in {stats['load_time'] * 1000:.0f} ms, "
+                f"RSS {mb(stats['rss_before_load'])} -> {mb(stats['rss_after_load'])}")
+
+
+# Shared by every camera screen; SIGNITUP_INFERENCE_STRIDE=2 classifies every other frame,
+# SIGNITUP_MOTION_GATE=0 runs MediaPipe on still frames too
+gesture_recognizer = GestureRecognizer(
+    inference_stride=int(os.environ.get('SIGNITUP_INFERENCE_STRIDE', 1)),
+    motion_gate=None if os.environ.get('SIGNITUP_MOTION_GATE') == '0' else MotionGate(),
+)
@@ -0,0 +1,88 @@
+import time
+
+# States
+IDLE = 'idle'
+HOLDING = 'holding'
+CONFIRMED = 'confirmed'
+
+
+class GestureHold:
+    """Hold-to-confirm state machine for one target gesture.
+
+    Fed one prediction per camera frame, with the time the frame was
+    captured; the hold is measured between those timestamps, so no timer
+    has to run alongside. A hold starts on a prediction of the target with
+    at least enter_confidence, and from then on predictions down to
+    exit_confidence still count (hysteresis). During a hold, up to
+    max_missed consecutive frames that don't count (another gesture, no
+    hand, an error) are forgiven; every counting frame clears the tally, so
+    only a run of more than max_missed misses starts the hold over. Once
+    the gesture has been held for hold_time seconds the state is CONFIRMED
+    until reset(); with a hold_time of 0 the first good frame confirms.
+
+    update() returns True on the frame the gesture gets confirmed; progress
+    (0 to 1) and held (seconds) are there for the UI.
+    """
+
+    def __init__(self, target, hold_time=3.0, enter_confidence=0.7, exit_confidence=0.6, max_missed=5):
+        self.target = target
+        self.hold_time = hold_time
+        self.enter_confidence = enter_confidence
+        self.exit_confidence = exit_confidence
+        self.max_missed = max_missed
+        self.reset()
+
+    def reset(self):
+        self.state = IDLE
+        self.started_at = None
+        self.held = 0.0
+        self.missed = 0
+        self.matched = False  # whether the last frame counted towards the hold
+
+    @property
+    def holding(self):
+        return self.state == HOLDING
+
+    @property
+    def confirmed(self):
+        return self.state == CONFIRMED
+
+    @property
+    def progress(self):
+        if self.state == CONFIRMED:
+            return 1.0
+        if self.state == IDLE or self.hold_time <= 0:
+            return 0.0
+        return min(self.held / self.hold_time, 1.0)
+
+    def update(self, timestamp, class_idx=None, confidence=0.0):
+        """Feed the prediction for the frame captured at timestamp; class_idx None means no prediction."""
+        if self.state == CONFIRMED:
+            return False
+
+        threshold = self.exit_confidence if self.state == HOLDING else self.enter_confidence
+        self.matched = class_idx == self.target and confidence >= threshold
+        if not self.matched:
+            if self.state == HOLDING:
+                self.missed += 1
+                if self.missed > self.max_missed:
+                    self.reset()
+            return False
+
+        self.missed = 0
+        if self.state == IDLE:
+            self.state = HOLDING
+            self.started_at = timestamp
+        self.held = timestamp - self.started_at
+
+        if self.held >= self.hold_time:
+            self.state = CONFIRMED
+            return True
+        return False
+
+    def update_result(self, result):
+        """Feed a RecognitionResult."""
+        timestamp = result.captured_at if result.captured_at is not None else time.perf_counter()
+        if not result.hand_detected or result.error is not None:
+            return self.update(timestamp)
+        return self.update(timestamp, result.class_idx, result.confidence)
@@ -1,12 +1,4 @@
-import os
-import pickle
-
-import cv2
-import mediapipe as mp
-import numpy as np
 from kivy.clock import Clock
-from kivy.core.audio import SoundLoader
-from kivy.graphics.texture import Texture
 from kivy.metrics import dp
 from kivy.uix.image import Image
 from kivymd.app import MDApp
@@ -18,14 +10,14 @@ from kivymd.uix.progressbar import MDProgressBar
 from kivymd.uix.screen import MDScreen
 from kivymd.uix.scrollview import MDScrollView
 
-# --- Load model and MediaPipe once ---
-model_dict = pickle.load(open('./model.p', 'rb'))
-model = model_dict['model']
-
-mp_hands = mp.solutions.hands
-mp_drawing = mp.solutions.drawing_utils
-mp_drawing_styles = mp.solutions.drawing_styles
-hands = mp_hands.Hands(static_image_mode=True, min_detection_confidence=0.3)
+from account_store import account_store
+from frame_presenter import FramePresenter
+from gesture_analytics import INTRO, gesture_analytics
+from gesture_state import GestureHold
+from metrics_overlay import MetricsOverlay
+from pipeline_metrics import pipeline_metrics
+from recognition_worker import RecognitionWorker
+from sound_bank import INSTRUCTION, sound_bank
 
 # --- IntroScreen class ---
 class IntroScreen(MDScreen):
@@ -33,29 +25,19 @@ class IntroScreen(MDScreen):
         super().__init__(*args, **kwargs)
         self.app = MDApp.get_running_app()
 
-        # Load user's volume setting from account data
-        self.load_volume_setting()
-
         # Consolidate all SFX into a dictionary
         self.sfx = {
-            'button_click': SoundLoader.load('assets/sounds/select2.mp3'),
-            'success': SoundLoader.load('assets/sounds/levelwin2.mp3'),
-            'achievement': SoundLoader.load("assets/sounds/achievementunlock2.mp3"),
-            'thumbs_up': SoundLoader.load('assets/sounds/thumbsup_instruction.mp3')
+            'button_click': sound_bank.acquire('assets/sounds/select2.mp3'),
+            'success': sound_bank.acquire('assets/sounds/levelwin2.mp3'),
+            'achievement': sound_bank.acquire("assets/sounds/achievementunlock2.mp3"),
+            'thumbs_up': sound_bank.acquire('assets/sounds/thumbsup_instruction.mp3', INSTRUCTION)
         }
 
-        # Set volumes according to user setting
-        self.update_sound_volumes()
-
-        # Set thumbs_up to full volume
-        if self.sfx.get('thumbs_up'):
-            self.sfx['thumbs_up'].volume = 1.0
-
         self.dialog_shown = False
-        self.capture = None
+        self.worker = None
         self.event = None
-        self.gesture_timer_event = None
-        self.gesture_hold_time = 0
+        # Thumbs up (class 5) held for 3 seconds; a few misread frames don't start it over
+        self.gesture_hold = GestureHold(5, hold_time=3)
 
         self.layout = MDBoxLayout(
             orientation='vertical',
@@ -189,6 +171,7 @@ class IntroScreen(MDScreen):
 
         # Camera preview
         self.image = Image(size_hint_y=None, height=300)
+        self.presenter = FramePresenter(self.image)
         self.layout.add_widget(self.image)
 
         # Prediction label
@@ -205,119 +188,74 @@ class IntroScreen(MDScreen):
         self.layout.add_widget(self.progress_bar)
         self.gesture_target_time = 3
 
+        if pipeline_metrics.enabled:
+            self.add_widget(MetricsOverlay())
+
     def on_enter(self):
-        self.capture = cv2.VideoCapture(0)
-        self.event = Clock.schedule_interval(self.update, 1.0 / 30.0)
+        self.worker = RecognitionWorker()
+        self.worker.start()
+        self.reset_gesture_hold()
+        self.event = Clock.schedule_interval(self.update, 1.0 / 60.0)
+        gesture_analytics.start_attempt(INTRO, 5)
 
     def on_leave(self):
-        if self.capture:
-            self.capture.release()
-            self.capture = None
+        gesture_analytics.abandon()
+        if self.worker:
+            self.worker.stop()
+            self.worker = None
         if self.event:
             Clock.unschedule(self.event)
             self.event = None
-        self.reset_gesture_timer()
+        self.reset_gesture_hold()
         self.dialog_shown = False
 
     def update(self, dt):
-        if not self.capture:
-            return
-
-        ret, frame = self.capture.read()
-        if not ret:
+        result = self.worker.take() if self.worker else None
+        if result is None:
             return
-
-        data_aux = []
-        x_, y_ = [], []
-        H, W, _ = frame.shape
-
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = hands.process(frame_rgb)
-
-        prediction_text = "No hand detected"
-
-        if results.multi_hand_landmarks:
-            for hand_landmarks in results.multi_hand_landmarks:
-                mp_drawing.draw_landmarks(
-                    frame,
-                    hand_landmarks,
-                    mp_hands.HAND_CONNECTIONS,
-                    mp_drawing_styles.get_default_hand_landmarks_style(),
-                    mp_drawing_styles.get_default_hand_connections_style()
-                )
-
-                for lm in hand_landmarks.landmark:
-                    x_.append(lm.x)
-                    y_.append(lm.y)
-
-                for lm in hand_landmarks.landmark:
-                    data_aux.append(lm.x - min(x_))
-                    data_aux.append(lm.y - min(y_))
-
-                try:
-                    proba = model.predict_proba([np.asarray(data_aux)])
-                    confidence = np.max(proba)
-                    idx = np.argmax(proba)
-
-                    if idx == 5 and confidence >= 0.7:
-                        prediction_text = "Detected! Keep it up!"
-                        if not self.gesture_timer_event:
-                            self.gesture_hold_time = 0
-                            self.gesture_timer_event = Clock.schedule_interval(self.update_gesture_timer, 0.1)
-                    else:
-                        prediction_text = "Gesture incorrect"
-                        self.reset_gesture_timer()
-                except:
-                    prediction_text = "Prediction error"
-                    self.reset_gesture_timer()
-
-        if prediction_text == "No hand detected":
-            self.reset_gesture_timer()
+        confirmed = self.gesture_hold.update_result(result)
+        gesture_analytics.record_result(result, self.gesture_hold.held, self.gesture_hold.matched)
+
+        if not result.hand_detected:
+            prediction_text = "No hand detected"
+        elif result.error is not None:
+            prediction_text = "Prediction error"
+        elif self.gesture_hold.matched:
+            prediction_text = "Detected! Keep it up!"
+        else:
+            prediction_text = "Gesture incorrect"
 
         self.label.text = prediction_text
+        self.progress_bar.value = self.gesture_hold.progress * 100
 
-        frame = cv2.flip(frame, 0)
-        buf = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB).tobytes()
-        texture = Texture.create(size=(frame.shape[1], frame.shape[0]), colorfmt='rgb')
-        texture.blit_buffer(buf, colorfmt='rgb', bufferfmt='ubyte')
-        self.image.texture = texture
-
-    def update_gesture_timer(self, dt):
-        self.gesture_hold_time += dt
-        progress = (self.gesture_hold_time / self.gesture_target_time) * 100  # <------------
-        self.progress_bar.value = progress  # <-------------
-
-        if self.gesture_hold_time >= 3:
+        if confirmed:
+            gesture_analytics.success(self.gesture_hold.held)
             self.label.text = "Gesture confirmed!"
-            self.reset_gesture_timer()
+            self.reset_gesture_hold()
             self.show_success_dialog()
-            # You can add screen change or dialog here
+
+        self.presenter.present(result.frame_rgb)
 
     def show_success_dialog(self):
         if not self.dialog_shown:
-            # Update SFX volume from app settings
-            self.sfx_volume = self.app.sfx_volume
-            self.update_sound_volumes()
-
             # Play success sound with current volume
             if self.sfx.get('success'):
                 self.sfx['success'].stop()
                 self.sfx['success'].play()
 
             self.dialog_shown = True
+            # Nothing to recognize behind the dialog; the camera stays warm
+            if self.worker:
+                self.worker.pause()
 
             #Load account data
-            with open("account_data.pkl", "rb") as file:
-                account = pickle.load(file)
+            account = account_store.get()
 
             #Check if this is the first completion
             show_achievement = not getattr(account, "introStatus", False)
 
             #Mark introStatus as complete
-            account.introStatus = True
-
-            with open("account_data.pkl", "wb") as file:
-                pickle.dump(account, file)
+            account_store.update(introStatus=True)
 
             # ⛳ Define the button behavior
             def on_lets_go(instance_btn):
@@ -345,10 +283,6 @@ class IntroScreen(MDScreen):
             self.dialog.open()
 
     def show_achievement_popup(self):
-        # Update SFX volume from app settings
-        self.sfx_volume = self.app.sfx_volume
-        self.update_sound_volumes()
-
         # Play achievement sound with current volume
         if self.sfx.get('achievement'):
             self.sfx['achievement'].stop()
@@ -373,17 +307,13 @@ class IntroScreen(MDScreen):
         app = MDApp.get_running_app()
         app.openMain()
 
-    def reset_gesture_timer(self):
-        self.gesture_hold_time = 0
-        if self.gesture_timer_event:
-            Clock.unschedule(self.gesture_timer_event)
-            self.gesture_timer_event = None
+    def reset_gesture_hold(self):
+        self.gesture_hold.reset()
         self.progress_bar.value = 0
 
     def play_thumbs_up_instruction(self):
         """Play the thumbs up instruction at full volume"""
         if self.sfx.get('thumbs_up'):
-            self.sfx['thumbs_up'].volume = 1.0  # Always play at full volume
             self.sfx['thumbs_up'].play()
 
     def check_scroll_position(self, instance, *args):
@@ -397,20 +327,3 @@ class IntroScreen(MDScreen):
         if scroll_position <= 0.01:  # Near the bottom
             self.play_thumbs_up_instruction()
 
-    def load_volume_setting(self):
-        """Load the user's saved volume setting"""
-        try:
-            if os.path.exists("account_data.pkl"):
-                with open("account_data.pkl", "rb") as file:
-                    account = pickle.load(file)
-                    self.sfx_volume = getattr(account, 'sfx_volume', 0.5)
-            else:
-                self.sfx_volume = 0.5  # Default if no account exists yet
-        except Exception as e:
-            print(f"Error loading volume setting: {e}")
-
-    def update_sound_volumes(self):
-        """Update all sound volumes to current setting (except thumbs_up instruction)"""
-        for key, sound in self.sfx.items():
-            if sound and key != 'thumbs_up':  # Skip the thumbs_up sound
-                sound.volume = self.sfx_volume
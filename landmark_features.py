@@ -0,0 +1,116 @@
+import time
+from itertools import chain
+from operator import attrgetter
+
+import numpy as np
+
+NUM_LANDMARKS = 21
+NUM_FEATURES = NUM_LANDMARKS * 2
+
+_landmark_xy = attrgetter('x', 'y')
+
+
+class LandmarkFeatureExtractor:
+    """Turns MediaPipe hand landmarks into the 42-value vector the classifier was trained on.
+
+    Every landmark contributes (x - min x, y - min y), in landmark order. The
+    buffers are allocated once, so the array returned by extract() is
+    overwritten on the next call; copy it if it has to outlive the frame.
+    """
+
+    def __init__(self):
+        self.points = np.empty((NUM_LANDMARKS, 2), dtype=np.float32)
+        self._flat_points = self.points.reshape(-1)
+        self._minimum = np.empty(2, dtype=np.float32)
+        self._features = np.empty((NUM_LANDMARKS, 2), dtype=np.float32)
+        self.features = self._features.reshape(-1)
+
+    def load_landmarks(self, hand_landmarks):
+        """Copy the x/y coordinates of a MediaPipe hand into the (21, 2) points buffer."""
+        # map() and chain() walk the landmark list in C, there is no Python loop body per landmark
+        self._flat_points[:] = list(chain.from_iterable(map(_landmark_xy, hand_landmarks.landmark)))
+        return self.points
+
+    def extract(self, hand_landmarks):
+        """Return the (42,) float32 feature vector for one MediaPipe hand."""
+        self.load_landmarks(hand_landmarks)
+        np.min(self.points, axis=0, out=self._minimum)
+        np.subtract(self.points, self._minimum, out=self._features)
+        return self.features
+
+
+def extract_features_batch(points):
+    """Return the (N, 42) feature matrix for an (N, 21, 2) array of hands or frames.
+
+    Meant for offline work such as re-scoring recorded sessions or training data.
+    """
+    points = np.asarray(points, dtype=np.float32)
+    if points.ndim != 3 or points.shape[1:] != (NUM_LANDMARKS, 2):
+        raise ValueError(f"Expected an (N, {NUM_LANDMARKS}, 2) array, got {points.shape}")
+
+    features = points - points.min(axis=1, keepdims=True)
+    return features.reshape(len(points), NUM_FEATURES)
+
+
+def _legacy_features(hand_landmarks):
+    """The list based feature code the camera screens used to run on every frame."""
+    data_aux = []
+    x_, y_ = [], []
+    for lm in hand_landmarks.landmark:
+        x_.append(lm.x)
+        y_.append(lm.y)
+
+    for lm in hand_landmarks.landmark:
+        data_aux.append(lm.x - min(x_))
+        data_aux.append(lm.y - min(y_))
+    return np.asarray(data_aux)
+
+
+class _Landmark:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class _HandLandmarks:
+    def __init__(self, points):
+        self.landmark = [_Landmark(float(x), float(y)) for x, y in points]
+
+
+def benchmark(iterations=20000, batch_size=1000):
+    """Time the legacy loops against the vectorized extractor and print the results."""
+    rng = np.random.default_rng(0)
+    points = rng.random((batch_size, NUM_LANDMARKS, 2), dtype=np.float32)
+    hand = _HandLandmarks(points[0])
+    extractor = LandmarkFeatureExtractor()
+
+    assert np.array_equal(_legacy_features(hand).astype(np.float32), extractor.extract(hand))
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        _legacy_features(hand)
+    legacy = (time.perf_counter() - start) / iterations
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        extractor.extract(hand)
+    vectorized = (time.perf_counter() - start) / iterations
+
+    hands = [_HandLandmarks(p) for p in points]
+    start = time.perf_counter()
+    for h in hands:
+        _legacy_features(h)
+    legacy_batch = time.perf_counter() - start
+
+    start = time.perf_counter()
+    extract_features_batch(points)
+    vectorized_batch = time.perf_counter() - start
+
+    print(f"Single hand:  legacy {legacy * 1e6:.1f} us, vectorized {vectorized * 1e6:.1f} us "
+          f"({legacy / vectorized:.1f}x)")
+    print(f"Batch of {batch_size}: legacy {legacy_batch * 1e3:.2f} ms, vectorized {vectorized_batch * 1e3:.2f} ms "
+          f"({legacy_batch / vectorized_batch:.1f}x)")
+
+
+if __name__ == '__main__':
+    benchmark()
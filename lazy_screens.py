@@ -0,0 +1,126 @@
+import gc
+import time
+
+from kivy.properties import AliasProperty
+from kivy.uix.screenmanager import ScreenManager
+
+from gesture_recognizer import resident_memory
+from sound_bank import sound_bank
+
+
+class LazyScreenManager(ScreenManager):
+    """ScreenManager that builds each screen the first time it is shown.
+
+    Screens are registered by name with a factory (usually the screen
+    class), which is called with name=... when `current` first targets that
+    name or get_screen() asks for it. has_screen() and screen_names answer
+    for registered screens too, so code that checks for a screen before
+    switching to it keeps working.
+
+    Screens that aren't pinned can be evicted: removed and dropped, to be
+    built again on the next visit. After every switch the least recently
+    shown ones are evicted while more than max_screens are built, or while
+    the resident memory is above memory_limit bytes; in that case sounds no
+    screen holds any more are unloaded as well. Where the current resident
+    memory can't be read (no psutil and no /proc), memory_limit is ignored
+    and only max_screens causes evictions.
+    """
+
+    def __init__(self, max_screens=None, memory_limit=None, **kwargs):
+        self._factories = {}
+        self._pinned = set()
+        self._last_shown = {}
+        super().__init__(**kwargs)
+        self.max_screens = max_screens
+        self.memory_limit = memory_limit
+
+        # Counters
+        self.build_times = {}  # name -> seconds its last construction took
+        self.evictions = 0
+
+    def register(self, name, factory, pinned=False):
+        """Make screen `name` available, built by factory(name=name) when first needed."""
+        self._factories[name] = factory
+        if pinned:
+            self._pinned.add(name)
+        self.property('screen_names').dispatch(self)
+
+    def _get_screen_names(self):
+        names = [screen.name for screen in self.screens]
+        return names + [name for name in self._factories if name not in names]
+
+    screen_names = AliasProperty(_get_screen_names, bind=('screens',))
+
+    def is_built(self, name):
+        return any(screen.name == name for screen in self.screens)
+
+    def has_screen(self, name):
+        return name in self._factories or self.is_built(name)
+
+    def get_screen(self, name):
+        if not self.is_built(name) and name in self._factories:
+            self._build(name)
+        return super().get_screen(name)
+
+    def _build(self, name):
+        start = time.perf_counter()
+        screen = self._factories[name](name=name)
+        self.build_times[name] = time.perf_counter() - start
+        self.add_widget(screen)
+        return screen
+
+    def on_current(self, instance, value):
+        super().on_current(instance, value)
+        if value is not None:
+            self._last_shown[value] = time.monotonic()
+            self.trim()
+
+    def _evictable(self):
+        """Built screens that may be evicted, least recently shown first."""
+        busy = {self.current_screen, self.transition.screen_in, self.transition.screen_out}
+        screens = [screen for screen in self.screens
+                   if screen.name in self._factories and screen.name not in self._pinned and screen not in busy]
+        return sorted(screens, key=lambda screen: self._last_shown.get(screen.name, 0))
+
+    def _over_memory_limit(self):
+        if not self.memory_limit:
+            return False
+        rss = resident_memory()
+        return rss is not None and rss > self.memory_limit
+
+    def trim(self):
+        """Evict screens until the limits are met or nothing else can go."""
+        for screen in self._evictable():
+            too_many = self.max_screens is not None and len(self.screens) > self.max_screens
+            if not too_many and not self._over_memory_limit():
+                break
+            self.evict(screen.name)
+            if self._over_memory_limit():
+                sound_bank.evict_unused()
+            gc.collect()
+
+    def evict(self, name):
+        """Drop a built screen; it is built again on the next visit. Returns False if it can't go."""
+        if name not in self._factories or name in self._pinned:
+            return False
+        for screen in self.screens:
+            if screen.name == name:
+                if screen is self.current_screen:
+                    return False
+                if screen.parent is not None:
+                    screen.parent.real_remove_widget(screen)
+                self.remove_widget(screen)
+                for sound in getattr(screen, 'sfx', {}).values():
+                    sound_bank.release(sound)
+                self.evictions += 1
+                print(f"Evicted screen '{name}'")
+                return True
+        return False
+
+    def stats(self):
+        return {
+            'registered': len(self._factories),
+            'built': len(self.screens),
+            'evictions': self.evictions,
+            'build_ms': {name: round(seconds * 1000, 1) for name, seconds in self.build_times.items()},
+        }
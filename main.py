@@ -1,13 +1,25 @@
 import os
 import subprocess
 import sys
-
-from kivy.uix.screenmanager import ScreenManager
+import time
+import weakref
+
+# For the time-to-first-frame report
+LAUNCH_TIME = time.perf_counter()
+
+from kivy.core.window import Window
+from account_store import account_store
+from asset_preloader import asset_preloader
+from camera_manager import camera_manager
+from gesture_analytics import gesture_analytics
+from lazy_screens import LazyScreenManager
+from pipeline_metrics import pipeline_metrics
 from challenges_screen import ChallengesScreen
 from helpers import *
 from intro_screen import IntroScreen
 from navigation_screen import BottomNavScreen
 from register import RegisterScreen
+from sound_bank import MUSIC, SFX, sound_bank
 from vowels_easy_screen import *
 from vowels_hard_screen import *
 from vowels_intermediate_screen import *
@@ -32,6 +44,7 @@ class SignItUp(MDApp):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._button_sound_callback = self._make_click_callback()
+        self._sfx_screens = weakref.WeakSet()  # screens whose buttons have the click sound
 
         # Initialize with defaults (will be overwritten by load)
         self.music_volume = 0.5
@@ -44,32 +57,17 @@ class SignItUp(MDApp):
 
     def load_volume_settings(self):
         """Load and immediately apply volume settings"""
-        try:
-            if os.path.exists("account_data.pkl"):
-                with open("account_data.pkl", "rb") as f:
-                    account = pickle.load(f)
-
-                self.music_volume = getattr(account, 'music_volume', 0.5)
-                self.sfx_volume = getattr(account, 'sfx_volume', 0.5)
-
-        except Exception as e:
-            print(f"Error loading volume settings: {e}")
+        account = account_store.get()
+        if account:
+            self.music_volume = getattr(account, 'music_volume', 0.5)
+            self.sfx_volume = getattr(account, 'sfx_volume', 0.5)
+        sound_bank.set_volume(MUSIC, self.music_volume)
+        sound_bank.set_volume(SFX, self.sfx_volume)
 
     def save_volume_settings(self):
         """Save current volume settings to account data"""
-        try:
-            if os.path.exists("account_data.pkl"):
-                with open("account_data.pkl", "rb") as f:
-                    account = pickle.load(f)
-
-                account.music_volume = self.music_volume
-                account.sfx_volume = self.sfx_volume
-
-                with open("account_data.pkl", "wb") as f:
-                    pickle.dump(account, f)
-
-        except Exception as e:
-            print(f"Error saving volume settings: {e}")
+        # Deferred, so a whole slider drag ends up in one journal entry
+        account_store.update(defer=True, music_volume=self.music_volume, sfx_volume=self.sfx_volume)
 
     def _make_click_callback(self):
         def callback(instance):
@@ -89,103 +87,112 @@ class SignItUp(MDApp):
         self.theme_cls.primary_palette="Gray"
         self.theme_cls.theme_style="Dark"
 
-        self.sm = ScreenManager()
-        self.register_screen = RegisterScreen(name='register')
-        self.bottom_nav_screen = BottomNavScreen(name='bottom_nav')
-        self.vowels_menu_screen = VowelMenuScreen(name='vowels_menu')
-        self.intro_screen = IntroScreen(name='intro')
-        self.challenges_screen = ChallengesScreen(name='challenges_menu')
+        # Screens are built the first time they are shown; see LazyScreenManager
+        # SIGNITUP_EAGER_SCREENS=1 builds them all up front, to compare startup times
+        eager = os.environ.get('SIGNITUP_EAGER_SCREENS') == '1'
+        memory_limit = int(os.environ.get('SIGNITUP_MEMORY_LIMIT_MB', 0)) * 2 ** 20 or None
+        self.sm = LazyScreenManager(max_screens=None if eager else 12, memory_limit=memory_limit)
+        self.sm.register('register', RegisterScreen, pinned=True)
+        self.sm.register('bottom_nav', BottomNavScreen, pinned=True)
+        self.sm.register('vowels_menu', VowelMenuScreen, pinned=True)
+        self.sm.register('intro', IntroScreen)
+        self.sm.register('challenges_menu', ChallengesScreen, pinned=True)
 
         ##vowels easy challenges
-        self.vowels_easy_screen = VowelsEasyChallengeScreen(name='vowels_easy')
-        self.vowels_easy_instruction = EasyInstructionScreen(name='vowels_easy_instruction')
-        self.first_screen = FirstScreen(name='first_screen_easy')
-        self.second_screen = SecondScreen(name='second_screen_easy')
-        self.third_screen = ThirdScreen(name='third_screen_easy')
-        self.fourth_screen = FourthScreen(name='fourth_screen_easy')
-        self.fifth_screen = FifthScreen(name='fifth_screen_easy')
+        self.sm.register('vowels_easy', VowelsEasyChallengeScreen)
+        self.sm.register('vowels_easy_instruction', EasyInstructionScreen)
+        self.sm.register('first_screen_easy', FirstScreen)
+        self.sm.register('second_screen_easy', SecondScreen)
+        self.sm.register('third_screen_easy', ThirdScreen)
+        self.sm.register('fourth_screen_easy', FourthScreen)
+        self.sm.register('fifth_screen_easy', FifthScreen)
 
         ##vowels intermediate challenges
-        self.vowels_intermediate_screen = VowelsIntermediateChallengeScreen(name='vowels_intermediate')
-        self.vowels_intermediate_instruction = VowelsIntermediateInstructionScreen(name='vowels_intermediate_instruction')
-        self.vowels_intermediate_first_screen = FirstScreenVowelIntermediate(name='vowel_first_intermediate_screen')
-        self.vowels_intermediate_second_screen = SecondScreenVowelIntermediate(name='vowel_second_intermediate_screen')
-        self.vowels_intermediate_third_screen = ThirdScreenVowelIntermediate(name='vowel_third_intermediate_screen')
-        self.vowels_intermediate_fourth_screen = FourthScreenVowelIntermediate(name='vowel_fourth_intermediate_screen')
-        self.vowels_intermediate_fifth_screen = FifthScreenVowelIntermediate(name='vowel_fifth_intermediate_screen')
+        self.sm.register('vowels_intermediate', VowelsIntermediateChallengeScreen)
+        self.sm.register('vowels_intermediate_instruction', VowelsIntermediateInstructionScreen)
+        self.sm.register('vowel_first_intermediate_screen', FirstScreenVowelIntermediate)
+        self.sm.register('vowel_second_intermediate_screen', SecondScreenVowelIntermediate)
+        self.sm.register('vowel_third_intermediate_screen', ThirdScreenVowelIntermediate)
+        self.sm.register('vowel_fourth_intermediate_screen', FourthScreenVowelIntermediate)
+        self.sm.register('vowel_fifth_intermediate_screen', FifthScreenVowelIntermediate)
 
         ## vowels hard challenges
-        self.vowels_hard_screen = VowelsHardChallengeScreen(name='vowels_hard')
-        self.vowels_hard_instruction = VowelsHardInstructionScreen(name='vowels_hard_instruction')
-        self.vowels_hard_first_screen = FirstScreenVowelHard(name='vowel_first_hard_screen')
-        self.vowels_hard_second_screen = SecondScreenVowelHard(name='vowel_second_hard_screen')
-        self.vowels_hard_third_screen = ThirdScreenVowelHard(name='vowel_third_hard_screen')
-        self.vowels_hard_fourth_screen = FourthScreenVowelHard(name='vowel_fourth_hard_screen')
-        self.vowels_hard_fifth_screen = FifthScreenVowelHard(name='vowel_fifth_hard_screen')
+        self.sm.register('vowels_hard', VowelsHardChallengeScreen)
+        self.sm.register('vowels_hard_instruction', VowelsHardInstructionScreen)
+        self.sm.register('vowel_first_hard_screen', FirstScreenVowelHard)
+        self.sm.register('vowel_second_hard_screen', SecondScreenVowelHard)
+        self.sm.register('vowel_third_hard_screen', ThirdScreenVowelHard)
+        self.sm.register('vowel_fourth_hard_screen', FourthScreenVowelHard)
+        self.sm.register('vowel_fifth_hard_screen', FifthScreenVowelHard)
 
         #vowels screen
-        self.letter_a_screen = LetterAScreen(name='a_screen')
-        self.letter_e_screen = LetterEScreen(name='e_screen')
-        self.letter_i_screen = LetterIScreen(name='i_screen')
-        self.letter_o_screen = LetterOScreen(name='o_screen')
-        self.letter_u_screen = LetterUScreen(name='u_screen')
-
-        self.sm.add_widget(self.register_screen)
-        self.sm.add_widget(self.bottom_nav_screen)
-        self.sm.add_widget(self.vowels_menu_screen)
-        self.sm.add_widget(self.intro_screen)
-        self.sm.add_widget(self.challenges_screen)
-
-        ### vowel easy chal
-        self.sm.add_widget(self.vowels_easy_screen)
-        self.sm.add_widget(self.vowels_easy_instruction)
-        self.sm.add_widget(self.first_screen)
-        self.sm.add_widget(self.second_screen)
-        self.sm.add_widget(self.third_screen)
-        self.sm.add_widget(self.fourth_screen)
-        self.sm.add_widget(self.fifth_screen)
-
-        ### vowel inter chal
-        self.sm.add_widget(self.vowels_intermediate_screen)
-        self.sm.add_widget(self.vowels_intermediate_instruction)
-        self.sm.add_widget(self.vowels_intermediate_first_screen)
-        self.sm.add_widget(self.vowels_intermediate_second_screen)
-        self.sm.add_widget(self.vowels_intermediate_third_screen)
-        self.sm.add_widget(self.vowels_intermediate_fourth_screen)
-        self.sm.add_widget(self.vowels_intermediate_fifth_screen)
-
-        ### vowel hard chal
-        self.sm.add_widget(self.vowels_hard_screen)
-        self.sm.add_widget(self.vowels_hard_instruction)
-        self.sm.add_widget(self.vowels_hard_first_screen)
-        self.sm.add_widget(self.vowels_hard_second_screen)
-        self.sm.add_widget(self.vowels_hard_third_screen)
-        self.sm.add_widget(self.vowels_hard_fourth_screen)
-        self.sm.add_widget(self.vowels_hard_fifth_screen)
-        #
-        self.sm.add_widget(self.letter_a_screen)
-        self.sm.add_widget(self.letter_e_screen)
-        self.sm.add_widget(self.letter_i_screen)
-        self.sm.add_widget(self.letter_o_screen)
-        self.sm.add_widget(self.letter_u_screen)
-
+        self.sm.register('a_screen', LetterAScreen)
+        self.sm.register('e_screen', LetterEScreen)
+        self.sm.register('i_screen', LetterIScreen)
+        self.sm.register('o_screen', LetterOScreen)
+        self.sm.register('u_screen', LetterUScreen)
+
+        if eager:
+            for name in self.sm.screen_names:
+                self.sm.get_screen(name)
+
+        # The register screen comes up first and checks for an account on enter
+        self.sm.current = "register"
         self.sm.current = "bottom_nav"
         self.sm.bind(current=self.on_screen_change)
-        self.bind_sfx_to_all_buttons(self.sm.get_screen("bottom_nav"))
-
-        # Load button SFX & BGM with correct volumes
-        self.click_sfx = SoundLoader.load('assets/sounds/select2.mp3')
-        if self.click_sfx:
-            self.click_sfx.volume = self.sfx_volume  # Apply loaded volume
-
-        self.idle_music = SoundLoader.load('assets/sounds/idlemusic1.mp3')
+        home = self.sm.get_screen("bottom_nav")
+        self.bind_sfx_to_all_buttons(home)
+        self._sfx_screens.add(home)
+
+        # Button SFX & BGM; the sound bank gives them the saved volumes. The click is
+        # bound to every button, so it gets its own copy: screens stop theirs on leave
+        self.click_sfx = sound_bank.acquire('assets/sounds/select2.mp3', key='app_click')
+        self.idle_music = sound_bank.acquire('assets/sounds/idlemusic1.mp3', MUSIC)
         if self.idle_music:
             self.idle_music.loop = True
-            self.idle_music.volume = self.music_volume  # Apply loaded volume
             self.idle_music.play()
 
+        Window.bind(on_flip=self.report_first_frame)
         return self.sm
 
+    def report_first_frame(self, *args):
+        Window.unbind(on_flip=self.report_first_frame)
+        seconds = time.perf_counter() - LAUNCH_TIME
+        pipeline_metrics.record('first_frame', seconds)
+        stats = self.sm.stats()
+        print(f"Time to first frame: {seconds * 1000:.0f} ms "
+              f"({stats['built']} of {stats['registered']} screens built)")
+        sound_bank.report()
+
+        # The home screen is up; warm what the learner will likely open next
+        asset_preloader.start(self.sm)
+
+    def on_start(self):
+        account = account_store.get()
+        if account:
+            account_store.update(sessions=account.sessions + 1)
+
+    def on_pause(self):
+        # The app went to the background: nobody sees the camera screen
+        worker = getattr(self.sm.current_screen, 'worker', None)
+        if worker:
+            worker.pause()
+        return True
+
+    def on_resume(self):
+        screen = self.sm.current_screen
+        worker = getattr(screen, 'worker', None)
+        if worker and not getattr(screen, 'dialog_shown', False):
+            worker.resume()
+
+    def on_stop(self):
+        asset_preloader.stop()
+        camera_manager.close()
+        account_store.close()
+        gesture_analytics.close()
+        if pipeline_metrics.enabled:
+            pipeline_metrics.dump_json('pipeline_metrics.json')
+
     def openVowelChallenges (self):
         self.sm.current = 'challenges_menu'
         self.stop_idle_music()
@@ -238,7 +245,6 @@ class SignItUp(MDApp):
 
     def play_click_sound(self):
         if self.click_sfx:
-            self.click_sfx.volume = self.sfx_volume
             self.click_sfx.play()
 
     def stop_idle_music(self):
@@ -256,27 +262,30 @@ class SignItUp(MDApp):
                 child.unbind(on_press=self._button_sound_callback)
 
     def on_screen_change(self, instance, value):
-        # Unbind from all screens first (clean slate)
-        for screen in self.sm.screens:
-            self.unbind_sfx_from_all_buttons(screen)
-
-        # Bind only on the current screen if not 'register'
-        if value != 'register':
-            current_screen = self.sm.get_screen(value)
-            self.bind_sfx_to_all_buttons(current_screen)
+        # A button keeps the click sound once it has it, so each screen is only
+        # walked once, when it is first entered and has built its widgets.
+        # Nothing here depends on how many other screens there are.
+        if value == 'register':
+            return
+        screen = self.sm.get_screen(value)
+        if screen not in self._sfx_screens:
+            self._sfx_screens.add(screen)
+            screen.bind(on_enter=self._bind_sfx_on_first_enter)
+
+    def _bind_sfx_on_first_enter(self, screen):
+        screen.unbind(on_enter=self._bind_sfx_on_first_enter)
+        self.bind_sfx_to_all_buttons(screen)
 
     def set_music_volume(self, volume):
         """Set music volume and ensure it's applied immediately"""
         self.music_volume = volume
-        if hasattr(self, 'idle_music') and self.idle_music:
-            self.idle_music.volume = volume
+        sound_bank.set_volume(MUSIC, volume)
         self.save_volume_settings()
 
     def set_sfx_volume(self, volume):
         """Set SFX volume and ensure it's applied immediately"""
         self.sfx_volume = volume
-        if hasattr(self, 'click_sfx') and self.click_sfx:
-            self.click_sfx.volume = volume
+        sound_bank.set_volume(SFX, volume)
         self.save_volume_settings()
 
 #main-run---------------------------------------------------------
@@ -0,0 +1,57 @@
+import gc
+import sys
+
+from kivy.clock import Clock
+from kivy.uix.screenmanager import NoTransition
+
+from gesture_recognizer import resident_memory
+from main import SignItUp
+
+
+class MenuRoundTripApp(SignItUp):
+    """Runs the app and goes home -> vowels menu -> home -> challenges menu -> home, rounds times.
+
+    Prints the number of widgets across all screens and the resident memory
+    every report_every rounds; both should stay flat.
+    """
+
+    route = ('vowels_menu', 'bottom_nav', 'challenges_menu', 'bottom_nav')
+
+    def __init__(self, rounds=1000, report_every=100, **kwargs):
+        super().__init__(**kwargs)
+        self.rounds = rounds
+        self.report_every = report_every
+        self.round = 0
+        self.step_index = 0
+
+    def on_start(self):
+        super().on_start()
+        self.sm.transition = NoTransition()
+        self.report()
+        Clock.schedule_once(self.step, 0)
+
+    def widget_count(self):
+        return sum(1 for screen in self.sm.screens for _ in screen.walk(restrict=True))
+
+    def report(self):
+        gc.collect()
+        rss = resident_memory()
+        rss_text = f"{rss / 2 ** 20:.1f} MiB" if rss else "unknown"
+        print(f"Round {self.round}: {self.widget_count()} widgets, resident memory {rss_text}")
+
+    def step(self, dt):
+        self.sm.current = self.route[self.step_index]
+        self.step_index = (self.step_index + 1) % len(self.route)
+        if self.step_index == 0:
+            self.round += 1
+            if self.round % self.report_every == 0:
+                self.report()
+            if self.round >= self.rounds:
+                self.stop()
+                return
+        Clock.schedule_once(self.step, 0)
+
+
+if __name__ == '__main__':
+    # python menu_roundtrip.py [rounds]
+    MenuRoundTripApp(rounds=int(sys.argv[1]) if len(sys.argv) > 1 else 1000).run()
@@ -0,0 +1,55 @@
+from kivy.clock import Clock
+from kivy.metrics import dp
+from kivy.uix.screenmanager import Screen
+from kivymd.uix.label import MDLabel
+
+from pipeline_metrics import pipeline_metrics
+
+
+class MetricsOverlay(MDLabel):
+    """Debug label showing p50/p95/p99 stage timings and frame counters.
+
+    Camera screens only add it when pipeline metrics are enabled. It only
+    refreshes while its screen is shown, and stops for good once removed.
+    """
+
+    def __init__(self, metrics=pipeline_metrics, **kwargs):
+        kwargs.setdefault('font_style', 'Caption')
+        kwargs.setdefault('theme_text_color', 'Custom')
+        kwargs.setdefault('text_color', (0, 1, 0, 1))
+        kwargs.setdefault('halign', 'left')
+        kwargs.setdefault('valign', 'top')
+        kwargs.setdefault('size_hint', (None, None))
+        kwargs.setdefault('size', (dp(260), dp(220)))
+        kwargs.setdefault('pos_hint', {'x': 0, 'top': 1})
+        super().__init__(**kwargs)
+        self.metrics = metrics
+        self.bind(size=self.setter('text_size'))
+        self._event = None
+        self._screen = None
+
+    def on_parent(self, instance, parent):
+        if self._screen is not None:
+            self._screen.unbind(on_enter=self.start, on_leave=self.stop)
+            self._screen = None
+        self.stop()
+        if parent is None:
+            return
+
+        if isinstance(parent, Screen):
+            self._screen = parent
+            parent.bind(on_enter=self.start, on_leave=self.stop)
+        if parent.get_root_window() is not None:
+            self.start()
+
+    def start(self, *args):
+        if self._event is None:
+            self._event = Clock.schedule_interval(self.refresh, 0.5)
+
+    def stop(self, *args):
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+
+    def refresh(self, dt):
+        self.text = self.metrics.overlay_text()
@@ -0,0 +1,88 @@
+import time
+
+import cv2
+import numpy as np
+
+
+class MotionGate:
+    """Decides whether a camera frame changed enough to be worth running MediaPipe on.
+
+    Each frame is shrunk to a thumbnail_width grayscale thumbnail and
+    compared with the thumbnail of the last frame that was let through.
+    A pixel counts as changed when it differs by more than pixel_threshold
+    gray levels; the frame passes when more than min_changed of the pixels
+    (a fraction) did. Comparing against the last processed frame rather
+    than the previous one means slow movement still adds up and gets
+    through eventually.
+
+    Even in a still scene a frame is let through every refresh_interval
+    seconds, so lighting changes and a missed hand can't go unnoticed for
+    long. All buffers are allocated once per frame size.
+    """
+
+    def __init__(self, thumbnail_width=32, pixel_threshold=12, min_changed=0.01, refresh_interval=1.0):
+        self.thumbnail_width = thumbnail_width
+        self.pixel_threshold = pixel_threshold
+        self.min_changed = min_changed
+        self.refresh_interval = refresh_interval
+        self._frame_size = None
+        self._small = None
+        self._gray = None
+        self._reference = None
+        self._diff = None
+        self._last_passed = None
+
+        # Counters
+        self.processed_frames = 0
+        self.skipped_frames = 0
+        self.refreshes = 0
+        self.changed = 0.0  # fraction of changed pixels in the last frame checked
+
+    def _allocate(self, frame):
+        height, width = frame.shape[:2]
+        thumbnail_height = max(1, round(height * self.thumbnail_width / width))
+        self._frame_size = (width, height)
+        self._small = np.empty((thumbnail_height, self.thumbnail_width, 3), dtype=np.uint8)
+        self._gray = np.empty((thumbnail_height, self.thumbnail_width), dtype=np.uint8)
+        self._reference = np.empty_like(self._gray)
+        self._diff = np.empty_like(self._gray)
+        self._last_passed = None
+
+    def reset(self):
+        """Let the next frame through, e.g. when a new camera stream starts."""
+        self._last_passed = None
+
+    def check(self, frame, now=None):
+        """Return True if the BGR frame should be processed, False if the last result can be reused."""
+        if now is None:
+            now = time.perf_counter()
+        if self._frame_size != (frame.shape[1], frame.shape[0]):
+            self._allocate(frame)
+
+        cv2.resize(frame, (self.thumbnail_width, self._gray.shape[0]), dst=self._small,
+                   interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(self._small, cv2.COLOR_BGR2GRAY, dst=self._gray)
+
+        if self._last_passed is not None:
+            cv2.absdiff(self._gray, self._reference, dst=self._diff)
+            cv2.threshold(self._diff, self.pixel_threshold, 255, cv2.THRESH_BINARY, dst=self._diff)
+            self.changed = cv2.countNonZero(self._diff) / self._diff.size
+            if self.changed <= self.min_changed:
+                if now - self._last_passed < self.refresh_interval:
+                    self.skipped_frames += 1
+                    return False
+                self.refreshes += 1
+
+        self._reference[:] = self._gray
+        self._last_passed = now
+        self.processed_frames += 1
+        return True
+
+    def stats(self):
+        total = self.processed_frames + self.skipped_frames
+        return {
+            'processed_frames': self.processed_frames,
+            'skipped_frames': self.skipped_frames,
+            'refreshes': self.refreshes,
+            'skipped_share': self.skipped_frames / total if total else 0.0,
+        }
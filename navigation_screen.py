@@ -1,6 +1,3 @@
-import os
-import pickle
-
 from kivy.app import App
 from kivy.uix.behaviors import ButtonBehavior
 from kivy.uix.gridlayout import GridLayout
@@ -16,7 +13,10 @@ from kivymd.uix.progressbar import MDProgressBar
 from kivymd.uix.screen import MDScreen
 from kivymd.uix.slider import MDSlider
 
-from register import Account
+from account import Account
+from account_store import account_store
+from asset_resolver import asset_resolver
+from progress import progress
 class ImageButton(ButtonBehavior, Image):
     pass
 
@@ -27,32 +27,30 @@ class BottomNavScreen(MDScreen):
         self.welcome_label = None
         self.home_tab = None
         self.home_layout = None
+        self.bottom_nav = None
 
     def on_pre_enter(self):
-        """Updates account data before the screen is displayed."""
-        self.update_account_data()
-        if self.home_layout:
-            self.refresh_home_tab()
+        """Builds the GUI on the first visit; after that the widgets follow the progress model."""
+        if self.bottom_nav is None:
+            self.update_account_data()
+        else:
+            self.refresh_settings()
 
     def update_account_data(self):
-        """Loads account data from file and updates the welcome label."""
+        """Loads account data and builds the GUI for it."""
         try:
             account = self.load_account_data()
             if account:
                 self.update_welcome_label(account.username)
                 self.create_gui(account.username)
+                progress.bind(username=lambda instance, username: self.update_welcome_label(username))
         except Exception as e:
             print(f"Failed to load account in BottomNavScreen: {e}")
 
     def load_account_data(self):
-        """Loads the account data from the pickle file."""
-        try:
-            with open('account_data.pkl', 'rb') as file:
-                account: Account = pickle.load(file)
-                return account
-        except Exception as e:
-            print(f"Error loading account data: {e}")
-            return None
+        """Returns the account held by the account store."""
+        account: Account = account_store.get()
+        return account
 
     def update_welcome_label(self, username):
         """Updates the text of the welcome label if it exists."""
@@ -74,7 +72,7 @@ class BottomNavScreen(MDScreen):
     def create_gui(self, username):
         """Creates the GUI components after account data is loaded."""
 
-        bottom_nav = MDBottomNavigation()
+        bottom_nav = self.bottom_nav = MDBottomNavigation()
 
         # Home Tab
         home_tab = self.create_home_tab(username)
@@ -115,9 +113,9 @@ class BottomNavScreen(MDScreen):
         )
 
         # Buttons
-        vowels_button = self.create_image_button('assets/vowels.png', self.open_vowels_menu)
-        intro_button = self.create_image_button('assets/intro.png', self.open_intro)
-        vowels_challenge_button = self.create_image_button('assets/vowelsChallengeClick.png', self.open_vowels_challenge)
+        self.vowels_button = self.create_image_button('assets/vowels.png', self.open_vowels_menu)
+        self.intro_button = self.create_image_button('assets/intro.png', self.open_intro)
+        self.vowels_challenge_button = self.create_image_button('assets/vowelsChallengeClick.png', self.open_vowels_challenge)
 
 
         # Button row centered horizontally
@@ -129,9 +127,9 @@ class BottomNavScreen(MDScreen):
             pos_hint={'center_x': 0.5}
         )
 
-        self.home_layout.add_widget(intro_button)
-        self.home_layout.add_widget(vowels_button)
-        self.home_layout.add_widget(vowels_challenge_button)
+        self.home_layout.add_widget(self.intro_button)
+        self.home_layout.add_widget(self.vowels_button)
+        self.home_layout.add_widget(self.vowels_challenge_button)
 
         # Remove from previous parent if needed
         if self.welcome_label.parent:
@@ -141,101 +139,45 @@ class BottomNavScreen(MDScreen):
         content_layout.add_widget(self.welcome_label)
         content_layout.add_widget(self.home_layout)
 
-        # Refresh actual buttons with logic (check progress)
+        # Refresh actual buttons with logic (check progress), and again whenever it changes
         self.refresh_home_tab()
+        progress.bind(introStatus=self.refresh_home_tab, aStatus=self.refresh_home_tab,
+                      eStatus=self.refresh_home_tab, iStatus=self.refresh_home_tab,
+                      oStatus=self.refresh_home_tab, uStatus=self.refresh_home_tab,
+                      vowelScreen=self.refresh_home_tab, easyChallenge=self.refresh_home_tab,
+                      intermediateChallenge=self.refresh_home_tab, hardChallenge=self.refresh_home_tab)
 
         # Add content to tab
         home_tab.add_widget(content_layout)
         return home_tab
 
-    def refresh_home_tab(self):
-        """Refreshes the button icons and states in the home tab."""
-        self.home_layout.clear_widgets()
-
-        if not os.path.exists("account_data.pkl"):
-            print("No account_data.pkl found. Creating new account.")
-            return
-
-        with open("account_data.pkl", "rb") as file:
-            account: Account = pickle.load(file)
-
+    def refresh_home_tab(self, *args):
+        """Updates the button icons and states in the home tab from the progress model."""
         # Vowels Button
-        if not account.introStatus:
-            vowels_button = self.create_image_button('assets/lockVowels.png', self.open_vowels_menu)
-            vowels_button.disabled = True
-        elif account.aStatus and account.eStatus and account.iStatus and account.oStatus and account.uStatus:
-            vowels_button = self.create_image_button('assets/checkVowels.png', self.open_vowels_menu)
+        self.vowels_button.disabled = not progress.introStatus
+        if not progress.introStatus:
+            self.vowels_button.source = asset_resolver.resolve('assets/lockVowels.png')
+        elif progress.vowels_complete:
+            self.vowels_button.source = asset_resolver.resolve('assets/checkVowels.png')
         else:
-            vowels_button = self.create_image_button('assets/vowels.png', self.open_vowels_menu)
+            self.vowels_button.source = asset_resolver.resolve('assets/vowels.png')
 
         # Intro Button
-        if account.introStatus:
-            intro_button = self.create_image_button('assets/checkIntro.png', self.open_intro)
+        if progress.introStatus:
+            self.intro_button.source = asset_resolver.resolve('assets/checkIntro.png')
         else:
-            intro_button = self.create_image_button('assets/intro.png', self.open_intro)
+            self.intro_button.source = asset_resolver.resolve('assets/intro.png')
 
         ##vowels chalneghes butotn
-        if not account.vowelScreen:
-            vowels_challenge_button = self.create_image_button('assets/vowelsChallengeLocked.png', self.open_vowels_challenge)
-            vowels_challenge_button.disabled = True
-        elif account.easyChallenge and account.intermediateChallenge and account.hardChallenge:
-            vowels_challenge_button = self.create_image_button('assets/vowelsChallengeCheck.png', self.open_vowels_challenge)
+        self.vowels_challenge_button.disabled = not progress.vowelScreen
+        if not progress.vowelScreen:
+            self.vowels_challenge_button.source = asset_resolver.resolve('assets/vowelsChallengeLocked.png')
+        elif progress.challenges_complete:
+            self.vowels_challenge_button.source = asset_resolver.resolve('assets/vowelsChallengeCheck.png')
         else:
-            vowels_challenge_button = self.create_image_button('assets/vowelsChallengeClick.png', self.open_vowels_challenge)
-
-        self.home_layout.add_widget(intro_button)
-        self.home_layout.add_widget(vowels_button)
-        self.home_layout.add_widget(vowels_challenge_button)
+            self.vowels_challenge_button.source = asset_resolver.resolve('assets/vowelsChallengeClick.png')
 
     def create_profile_section(self, username):
-        try:
-            with open("account_data.pkl", "rb") as file:
-                account = pickle.load(file)
-
-            #Lesson Progress (5 lessons only: A, E, I, O, U)
-            lesson_flags = [
-                account.aStatus,
-                account.eStatus,
-                account.iStatus,
-                account.oStatus,
-                account.uStatus
-            ]
-            lesson_progress = sum(lesson_flags)
-            progress_percent = int((lesson_progress / len(lesson_flags)) * 100)
-
-            # Achievement Progress (now includes introStatus too)
-            achievement_flags = [
-                account.introStatus,
-                account.aStatus,
-                account.eStatus,
-                account.iStatus,
-                account.oStatus,
-                account.uStatus,
-                account.easyChallenge,
-                account.intermediateChallenge,
-                account.hardChallenge,
-                account.finalAchievement
-            ]
-            achievement_progress = sum(achievement_flags)
-            achievement_percent = int((achievement_progress / len(achievement_flags)) * 100)
-
-            # Individual achievement statuses for badges
-            badge_statuses = [
-                account.introStatus,        # 1. Welcome badge
-                account.aStatus,            # 2. A lesson
-                account.eStatus,            # 3. E lesson
-                account.iStatus,            # 4. I lesson
-                account.oStatus,            # 5. O lesson
-                account.uStatus,            # 6. U lesson
-                account.easyChallenge,      # 7. Easy challenge
-                account.intermediateChallenge,  # 8. Intermediate challenge
-                account.hardChallenge,      # 9. Hard challenge
-                account.finalAchievement    # 10. Master badge
-            ]
-
-        except Exception as e:
-            print(f"Failed to load account data: {e}")
-
         # Outer layout with top padding
         outer_layout = MDBoxLayout(
             orientation="vertical",
@@ -258,7 +200,7 @@ class BottomNavScreen(MDScreen):
             size_hint_y=None,
             height=40
         )
-        user_label = MDLabel(
+        self.user_label = user_label = MDLabel(
             text=f"Hello, {username}",
             font_style='H5',
             valign='middle'
@@ -277,24 +219,28 @@ class BottomNavScreen(MDScreen):
 
         # Progress: Lesson
         lesson_box = MDBoxLayout(orientation='vertical', size_hint_y=None, height=45, spacing=3)
-        lesson_box.add_widget(MDLabel(
-            text=f"Lesson Progress - {progress_percent}%",
+        self.lesson_label = MDLabel(
+            text="Lesson Progress - 0%",
             theme_text_color="Primary",
             size_hint_y=None,
             height=20
-        ))
-        lesson_box.add_widget(MDProgressBar(value=progress_percent, size_hint_y=None, height=15))
+        )
+        self.lesson_bar = MDProgressBar(value=0, size_hint_y=None, height=15)
+        lesson_box.add_widget(self.lesson_label)
+        lesson_box.add_widget(self.lesson_bar)
         layout.add_widget(lesson_box)
 
         # Progress: Achievement
         achievement_box = MDBoxLayout(orientation='vertical', size_hint_y=None, height=45, spacing=3)
-        achievement_box.add_widget(MDLabel(
-            text=f"Achievement Progress - {achievement_percent}%",
+        self.achievement_label = MDLabel(
+            text="Achievement Progress - 0%",
             theme_text_color="Primary",
             size_hint_y=None,
             height=20
-        ))
-        achievement_box.add_widget(MDProgressBar(value=achievement_percent, size_hint_y=None, height=15))
+        )
+        self.achievement_bar = MDProgressBar(value=0, size_hint_y=None, height=15)
+        achievement_box.add_widget(self.achievement_label)
+        achievement_box.add_widget(self.achievement_bar)
         layout.add_widget(achievement_box)
 
         # Spacer before Achievement Badges
@@ -327,7 +273,7 @@ class BottomNavScreen(MDScreen):
         ]
 
         # Achievement badge descriptions
-        badge_descriptions = [
+        self.badge_descriptions = [
             "Start of a Journey!",
             "A-mazing!",
             "E-xcellent!",
@@ -340,10 +286,8 @@ class BottomNavScreen(MDScreen):
             "The Completionist"
         ]
 
+        self.badge_labels = []
         for i, icon in enumerate(badge_icons):
-            unlocked = achievement_flags[i]
-            description = badge_descriptions[i] if unlocked else "Locked"
-
             # Create the icon button for the badge
             badge_button = MDIconButton(
                 icon=icon,
@@ -355,7 +299,7 @@ class BottomNavScreen(MDScreen):
 
             # Create a label for the badge description
             badge_label = MDLabel(
-                text=description,
+                text="Locked",
                 halign="center",
                 theme_text_color="Custom",
                 text_color=(1, 1, 1, 1),
@@ -376,6 +320,7 @@ class BottomNavScreen(MDScreen):
             )
             badge_layout.add_widget(badge_button)
             badge_layout.add_widget(badge_label)
+            self.badge_labels.append(badge_label)
 
             # Add the badge layout to the grid
             badges_grid.add_widget(badge_layout)
@@ -385,8 +330,57 @@ class BottomNavScreen(MDScreen):
         # Add inner layout to outer layout
         outer_layout.add_widget(layout)
 
+        # Fill in the progress now and whenever it changes
+        self.refresh_profile_section()
+        progress.bind(introStatus=self.refresh_profile_section, aStatus=self.refresh_profile_section,
+                      eStatus=self.refresh_profile_section, iStatus=self.refresh_profile_section,
+                      oStatus=self.refresh_profile_section, uStatus=self.refresh_profile_section,
+                      easyChallenge=self.refresh_profile_section,
+                      intermediateChallenge=self.refresh_profile_section,
+                      hardChallenge=self.refresh_profile_section,
+                      finalAchievement=self.refresh_profile_section,
+                      username=self.refresh_profile_section)
+
         return outer_layout
 
+    def refresh_profile_section(self, *args):
+        """Updates the progress bars and badge labels from the progress model."""
+        self.user_label.text = f"Hello, {progress.username}"
+
+        #Lesson Progress (5 lessons only: A, E, I, O, U)
+        lesson_flags = [
+            progress.aStatus,
+            progress.eStatus,
+            progress.iStatus,
+            progress.oStatus,
+            progress.uStatus
+        ]
+        lesson_progress = sum(lesson_flags)
+        progress_percent = int((lesson_progress / len(lesson_flags)) * 100)
+        self.lesson_label.text = f"Lesson Progress - {progress_percent}%"
+        self.lesson_bar.value = progress_percent
+
+        # Achievement Progress (now includes introStatus too), also the badge order
+        achievement_flags = [
+            progress.introStatus,
+            progress.aStatus,
+            progress.eStatus,
+            progress.iStatus,
+            progress.oStatus,
+            progress.uStatus,
+            progress.easyChallenge,
+            progress.intermediateChallenge,
+            progress.hardChallenge,
+            progress.finalAchievement
+        ]
+        achievement_progress = sum(achievement_flags)
+        achievement_percent = int((achievement_progress / len(achievement_flags)) * 100)
+        self.achievement_label.text = f"Achievement Progress - {achievement_percent}%"
+        self.achievement_bar.value = achievement_percent
+
+        for badge_label, unlocked, description in zip(self.badge_labels, achievement_flags, self.badge_descriptions):
+            badge_label.text = description if unlocked else "Locked"
+
     def create_settings_ui(self):
         from kivy.metrics import dp
         app = App.get_running_app()
@@ -500,9 +494,15 @@ class BottomNavScreen(MDScreen):
 
         return main_layout
 
+    def refresh_settings(self):
+        """Moves the sliders to the current volumes, e.g. after switching learners."""
+        app = App.get_running_app()
+        self.main_music_slider.value = app.music_volume * 100
+        self.sfx_slider.value = app.sfx_volume * 100
+
     def create_image_button(self, source, on_press_callback):
         """Creates a reusable image button."""
-        button = ImageButton(source=source, size_hint=(None, None), size=(150, 150))
+        button = ImageButton(source=asset_resolver.resolve(source), size_hint=(None, None), size=(150, 150))
         button.bind(on_press=on_press_callback)
         return button
 
@@ -550,33 +550,27 @@ class BottomNavScreen(MDScreen):
         """Reset the account progress and save."""
         self.dialog.dismiss()
         try:
-            account = self.load_account_data()
+            # Reset progress flags
+            account = account_store.update(
+                introStatus=False,
+                aStatus=False,
+                eStatus=False,
+                iStatus=False,
+                oStatus=False,
+                uStatus=False,
+
+                achievementOne=False,
+                achievementTwo=False,
+                achievementThree=False,
+                achievementFour=False,
+
+                vowelScreen=False,
+                easyChallenge=False,
+                intermediateChallenge=False,
+                hardChallenge=False,
+            )
             if account:
-                # Reset progress flags
-                account.introStatus = False
-                account.aStatus = False
-                account.eStatus = False
-                account.iStatus = False
-                account.oStatus = False
-                account.uStatus = False
-
-                account.achievementOne = False
-                account.achievementTwo = False
-                account.achievementThree = False
-                account.achievementFour = False
-
-                account.vowelScreen = False
-                account.easyChallenge = False
-                account.intermediateChallenge = False
-                account.hardChallenge = False
-
-                # Save back to file
-                with open('account_data.pkl', 'wb') as file:
-                    pickle.dump(account, file)
-
-                # Refresh UI to reflect changes
-                self.refresh_home_tab()
-
+                # The progress model refreshes the home and profile tabs
                 # Show success dialog
                 self.show_reset_success_dialog()
 
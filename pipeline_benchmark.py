@@ -0,0 +1,68 @@
+import json
+import sys
+import time
+
+from frame_sources import make_frame_source
+from gesture_recognizer import GestureRecognizer
+from pipeline_metrics import PipelineMetrics
+
+
+def run(source_spec, frames=300, realtime=False, json_path=None, inference_stride=1):
+    """Run the recognizer over a recorded source without a window or a webcam.
+
+    Prints per-stage percentiles and the throughput, and writes them to
+    json_path if given. Fast pacing by default, so the numbers show how quickly
+    the pipeline itself can go. With an inference_stride above 1, the
+    frames in between reuse the last prediction, as in the app.
+    """
+    metrics = PipelineMetrics(enabled=True, window=frames)
+    recognizer = GestureRecognizer(inference_stride=inference_stride, metrics=metrics)
+    recognizer.load()
+    print(recognizer.report())
+
+    source = make_frame_source(source_spec, realtime=realtime)
+    source.open()
+    print(f"Source: {source!r}, {source.effective_size}")
+
+    detections = 0
+    processed = 0
+    start = time.perf_counter()
+    try:
+        for seq in range(1, frames + 1):
+            with metrics.stage('capture'):
+                ret, frame = source.read()
+            if not ret:
+                break
+            with metrics.stage('frame'):
+                result = recognizer.process(frame, seq)
+            processed += 1
+            detections += result.hand_detected
+    finally:
+        source.release()
+        recognizer.close()
+    elapsed = time.perf_counter() - start
+
+    summary = metrics.summary()
+    summary['frames'] = processed
+    summary['hands_detected'] = detections
+    summary['fps'] = processed / elapsed if elapsed > 0 else 0.0
+    summary['recognizer'] = recognizer.stats()
+
+    print(metrics.overlay_text())
+    print(f"{processed} frames in {elapsed:.2f} s ({summary['fps']:.1f} fps), hand in {detections}, "
+          f"{recognizer.reused_frames} reused")
+    if json_path:
+        with open(json_path, 'w') as file:
+            json.dump(summary, file, indent=2, default=str)
+        print(f"Wrote {json_path}")
+    return summary
+
+
+if __name__ == '__main__':
+    # python pipeline_benchmark.py <video file | image directory | camera index> [frames] [json path] [stride]
+    if len(sys.argv) < 2:
+        sys.exit("usage: python pipeline_benchmark.py SOURCE [FRAMES] [JSON|-] [STRIDE]")
+    run(sys.argv[1],
+        frames=int(sys.argv[2]) if len(sys.argv) > 2 else 300,
+        json_path=sys.argv[3] if len(sys.argv) > 3 and sys.argv[3] != '-' else None,
+        inference_stride=int(sys.argv[4]) if len(sys.argv) > 4 else 1)
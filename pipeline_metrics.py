@@ -0,0 +1,116 @@
+import json
+import os
+import threading
+import time
+
+import numpy as np
+
+
+class _NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _StageTimer:
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.metrics.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class PipelineMetrics:
+    """Per-stage timings and frame counters for the gesture pipeline.
+
+    Each stage keeps its last `window` durations in a preallocated ring
+    buffer, so percentiles describe recent behaviour rather than the whole
+    session. When disabled, stage() hands back a shared no-op context manager
+    and record()/count() return immediately.
+    """
+
+    def __init__(self, enabled=False, window=600):
+        self.enabled = enabled
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples = {}
+        self._positions = {}
+        self._totals = {}
+        self.counters = {}
+
+    def stage(self, name):
+        """Context manager that records how long its block took under name."""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _StageTimer(self, name)
+
+    def record(self, name, seconds):
+        if not self.enabled:
+            return
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = np.zeros(self.window)
+                self._positions[name] = 0
+                self._totals[name] = 0
+            samples[self._positions[name]] = seconds
+            self._positions[name] = (self._positions[name] + 1) % self.window
+            self._totals[name] += 1
+
+    def count(self, name, amount=1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._positions.clear()
+            self._totals.clear()
+            self.counters.clear()
+
+    def summary(self):
+        """Return {'stages': {name: p50/p95/p99/mean in ms and count}, 'counters': {...}}."""
+        with self._lock:
+            stages = {}
+            for name, samples in self._samples.items():
+                total = self._totals[name]
+                recent = samples[:min(total, self.window)] * 1000.0
+                p50, p95, p99 = np.percentile(recent, [50, 95, 99])
+                stages[name] = {
+                    'count': total,
+                    'mean_ms': float(recent.mean()),
+                    'p50_ms': float(p50),
+                    'p95_ms': float(p95),
+                    'p99_ms': float(p99),
+                }
+            return {'stages': stages, 'counters': dict(self.counters)}
+
+    def overlay_text(self):
+        """Short multi-line summary for the on-screen debug overlay."""
+        summary = self.summary()
+        lines = [f"{name}: {s['p50_ms']:.1f}/{s['p95_ms']:.1f}/{s['p99_ms']:.1f} ms"
+                 for name, s in summary['stages'].items()]
+        lines.extend(f"{name}: {value}" for name, value in summary['counters'].items())
+        return "\n".join(lines)
+
+    def dump_json(self, path):
+        with open(path, 'w') as file:
+            json.dump(self.summary(), file, indent=2)
+
+
+# Enable with SIGNITUP_METRICS=1; shared by the worker threads and the camera screens
+pipeline_metrics = PipelineMetrics(enabled=os.environ.get('SIGNITUP_METRICS') == '1')
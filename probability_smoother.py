@@ -0,0 +1,108 @@
+import numpy as np
+
+# Smoothing modes
+EMA = 'ema'
+WINDOW = 'window'
+
+
+class ProbabilitySmoother:
+    """Smooths the classifier's per-frame class probabilities over time.
+
+    update() takes one probability vector per frame. In EMA mode the
+    smoothed vector is an exponential moving average with weight alpha on
+    the newest frame; in WINDOW mode it's the mean of the last `window`
+    frames. Either way the buffers are allocated up front and updated in
+    place, so a frame costs no allocations beyond a few scalars.
+
+    After each update:
+      class_idx, confidence - argmax and max of the smoothed vector
+      margin                - confidence minus the runner-up's probability
+      stability             - share of the last `window` frames whose own
+                              argmax agrees with class_idx (1.0 = steady)
+      switches              - how often class_idx changed since reset()
+
+    The buffers are overwritten on the next update; copy smoothed if it has
+    to outlive the frame.
+    """
+
+    def __init__(self, num_classes=6, mode=EMA, alpha=0.5, window=5):
+        if mode not in (EMA, WINDOW):
+            raise ValueError(f"Unknown smoothing mode: {mode}")
+        self.mode = mode
+        self.alpha = alpha
+        self.window = window
+        self._allocate(num_classes)
+
+    def _allocate(self, num_classes):
+        self.num_classes = num_classes
+        self.smoothed = np.zeros(num_classes)
+        self._scratch = np.zeros(num_classes)
+        self._history = np.zeros((self.window, num_classes))  # WINDOW mode only
+        self._sum = np.zeros(num_classes)
+        self._votes = np.full(self.window, -1, dtype=np.int16)  # raw argmax of recent frames
+        self.reset()
+
+    def reset(self):
+        """Forget every frame seen so far, e.g. when the hand leaves the picture."""
+        self.count = 0
+        self._position = 0
+        self.smoothed.fill(0.0)
+        self._history.fill(0.0)
+        self._sum.fill(0.0)
+        self._votes.fill(-1)
+        self.class_idx = None
+        self.confidence = 0.0
+        self.margin = 0.0
+        self.stability = 0.0
+        self.switches = 0
+
+    def update(self, proba):
+        """Add one frame's probabilities (shape (n,) or predict_proba's (1, n)) and return the smoothed vector."""
+        proba = np.ravel(proba)
+        if proba.size != self.num_classes:
+            # The model has a different number of classes than expected; happens once at most
+            self._allocate(proba.size)
+
+        if self.mode == EMA:
+            if self.count == 0:
+                self.smoothed[:] = proba
+            else:
+                self.smoothed *= 1.0 - self.alpha
+                np.multiply(proba, self.alpha, out=self._scratch)
+                self.smoothed += self._scratch
+        else:
+            row = self._history[self._position]
+            self._sum -= row
+            row[:] = proba
+            self._sum += row
+            np.multiply(self._sum, 1.0 / min(self.count + 1, self.window), out=self.smoothed)
+
+        self._votes[self._position] = proba.argmax()
+        self._position = (self._position + 1) % self.window
+        self.count += 1
+
+        class_idx = int(self.smoothed.argmax())
+        if self.class_idx is not None and class_idx != self.class_idx:
+            self.switches += 1
+        self.class_idx = class_idx
+        self.confidence = float(self.smoothed[class_idx])
+        if self.num_classes > 1:
+            self._scratch[:] = self.smoothed
+            self._scratch[class_idx] = -1.0
+            self.margin = self.confidence - float(self._scratch.max())
+        else:
+            self.margin = self.confidence
+        frames = min(self.count, self.window)
+        self.stability = float(np.count_nonzero(self._votes[:frames] == class_idx)) / frames
+        return self.smoothed
+
+    def stats(self):
+        return {
+            'mode': self.mode,
+            'frames': self.count,
+            'class_idx': self.class_idx,
+            'confidence': self.confidence,
+            'margin': self.margin,
+            'stability': self.stability,
+            'switches': self.switches,
+        }
@@ -0,0 +1,207 @@
+import os
+import sqlite3
+import threading
+import time
+
+from account import FLAG_BITS, SETTING_FIELDS, STAT_FIELDS, Account
+
+# PRAGMA user_version says how many of these have been applied
+_MIGRATIONS = (
+    """
+    CREATE TABLE IF NOT EXISTS profiles (
+        id INTEGER PRIMARY KEY,
+        username TEXT NOT NULL COLLATE NOCASE,
+        flags INTEGER NOT NULL DEFAULT 0,
+        music_volume REAL NOT NULL DEFAULT 0.5,
+        sfx_volume REAL NOT NULL DEFAULT 0.5,
+        extra TEXT NOT NULL DEFAULT '{}',
+        updated_at REAL NOT NULL DEFAULT 0
+    );
+    CREATE UNIQUE INDEX IF NOT EXISTS profiles_username ON profiles (username);
+    CREATE TABLE IF NOT EXISTS state (
+        key TEXT PRIMARY KEY,
+        value TEXT
+    );
+    """,
+    # Stats; extra is no longer used since Account only has declared fields
+    """
+    ALTER TABLE profiles ADD COLUMN created_at REAL NOT NULL DEFAULT 0;
+    ALTER TABLE profiles ADD COLUMN sessions INTEGER NOT NULL DEFAULT 0;
+    """,
+)
+_COLUMNS = ('username', 'flags') + SETTING_FIELDS + STAT_FIELDS
+
+
+class ProfileDatabase:
+    """All learner profiles on this machine, in one SQLite file.
+
+    Profiles are looked up through a unique, case-insensitive index on
+    username. The progress flags of a profile are packed into a single
+    integer column, so a change is one small UPDATE. The profile in use is
+    remembered in the state table; switching learners just points that at
+    another row.
+
+    It has the same load/append/save interface as JournalBackend, so
+    the AccountStore can use it as its backend. The first time the database
+    is created, an existing account_data.pkl is imported into it.
+    """
+
+    def __init__(self, path='profiles.db', legacy_path='account_data.pkl'):
+        self.path = path
+        self.legacy_path = legacy_path
+        self.current_username = None
+        self._lock = threading.RLock()
+        self._connection = None
+
+        # The AccountStore compacts its backend by these; a database never needs it
+        self.journal_entries = 0
+        self.snapshots = 0
+
+    @property
+    def connection(self):
+        if self._connection is None:
+            is_new = not os.path.exists(self.path)
+            # The store writes from its timer thread too; _lock serializes access
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._migrate()
+            if is_new and self.legacy_path and os.path.exists(self.legacy_path):
+                self.import_pickle(self.legacy_path)
+        return self._connection
+
+    def _migrate(self):
+        connection = self._connection
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+        for version in range(version, len(_MIGRATIONS)):
+            # executescript() commits on its own, so the migration and the version bump
+            # go in one explicit transaction: after a crash either both happened or neither
+            try:
+                connection.executescript(
+                    f"BEGIN; {_MIGRATIONS[version]} PRAGMA user_version = {version + 1}; COMMIT;")
+            except sqlite3.Error:
+                if connection.in_transaction:
+                    connection.rollback()
+                raise
+
+    def exists(self):
+        return self.load() is not None
+
+    def _split_fields(self, fields, flags=0):
+        """Sort attribute changes into flag bits and plain columns."""
+        columns = {}
+        for name, value in fields.items():
+            bit = FLAG_BITS.get(name)
+            if bit is not None:
+                flags = flags | bit if value else flags & ~bit
+            elif name in SETTING_FIELDS or name in STAT_FIELDS:
+                columns[name] = value
+            else:
+                raise AttributeError(f"Account has no field {name!r}")
+        return flags, columns
+
+    def get(self, username):
+        """Return the Account for username, or None."""
+        with self._lock:
+            row = self.connection.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM profiles WHERE username = ?", (username,)).fetchone()
+        return Account(*row) if row else None
+
+    def usernames(self):
+        with self._lock:
+            return [row[0] for row in self.connection.execute(
+                "SELECT username FROM profiles ORDER BY updated_at DESC")]
+
+    def switch(self, username):
+        """Make username the current profile. Returns its Account, or None if it doesn't exist."""
+        account = self.get(username)
+        if account is not None:
+            with self._lock, self.connection:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO state (key, value) VALUES ('current', ?)", (account.username,))
+            self.current_username = account.username
+        return account
+
+    def load(self):
+        """Return the current profile's Account, or None if no profile is selected."""
+        with self._lock:
+            row = self.connection.execute("SELECT value FROM state WHERE key = 'current'").fetchone()
+        self.current_username = row[0] if row else None
+        if self.current_username is None:
+            return None
+        return self.get(self.current_username)
+
+    def save(self, account):
+        """Insert or overwrite account's profile and make it the current one."""
+        values = (account.username, account.pack_flags()) + tuple(
+            getattr(account, name) for name in SETTING_FIELDS + STAT_FIELDS)
+        updates = ", ".join(f"{name} = excluded.{name}" for name in _COLUMNS[1:])
+        with self._lock, self.connection:
+            self.connection.execute(
+                f"INSERT INTO profiles ({', '.join(_COLUMNS)}, updated_at) "
+                f"VALUES ({', '.join('?' * len(_COLUMNS))}, ?) "
+                f"ON CONFLICT (username) DO UPDATE SET {updates}, updated_at = excluded.updated_at",
+                values + (time.time(),))
+            self.connection.execute(
+                "INSERT OR REPLACE INTO state (key, value) VALUES ('current', ?)", (account.username,))
+        self.current_username = account.username
+
+    def append(self, fields):
+        """Apply changed fields to the current profile."""
+        if self.current_username is not None:
+            self.update_many({self.current_username: fields})
+
+    def update_many(self, changes):
+        """Apply {username: {field: value}} to several profiles in one transaction."""
+        with self._lock, self.connection:
+            for username, fields in changes.items():
+                row = self.connection.execute(
+                    "SELECT flags FROM profiles WHERE username = ?", (username,)).fetchone()
+                if row is None:
+                    continue
+                flags, columns = self._split_fields(fields, row[0])
+                assignments = "".join(f", {name} = ?" for name in columns)
+                self.connection.execute(
+                    f"UPDATE profiles SET flags = ?, updated_at = ?{assignments} WHERE username = ?",
+                    (flags, time.time(), *columns.values(), username))
+
+    def import_pickle(self, path):
+        """Add the account in an account_data.pkl (and its journal) as a profile.
+
+        The default placeholder account named 'user' is skipped. The files
+        are only read; nothing is renamed if they turn out to be damaged.
+        Returns the imported Account, or None.
+        """
+        from account_store import JournalBackend
+
+        try:
+            account = JournalBackend(path, legacy_path=None).read()
+        except Exception as e:
+            print(f"Could not import {path}: {e}")
+            return None
+        if not isinstance(account, Account):
+            print(f"Could not import {path}: no account found")
+            return None
+        if account.username.lower() == 'user':
+            return None
+
+        self.save(account)
+        print(f"Imported profile '{account.username}' from {path}")
+        return account
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+if __name__ == '__main__':
+    # python profile_db.py import <account_data.pkl>...   or   python profile_db.py list
+    import sys
+
+    database = ProfileDatabase(legacy_path=None)
+    if len(sys.argv) > 2 and sys.argv[1] == 'import':
+        for pickle_path in sys.argv[2:]:
+            database.import_pickle(pickle_path)
+    for name in database.usernames():
+        print(name)
+    database.close()
@@ -0,0 +1,69 @@
+from kivy.event import EventDispatcher
+from kivy.properties import BooleanProperty, StringProperty
+
+from account import FLAG_FIELDS
+from account_store import account_store
+
+
+class Progress(EventDispatcher):
+    """The current learner's progress flags as observable Kivy properties.
+
+    Mirrors the account held by the AccountStore. Screens bind to the flags
+    they show, e.g. progress.bind(aStatus=self.refresh_vowel_buttons), and
+    only hear about the flags that actually changed; Kivy properties don't
+    dispatch when a value is set to what it already was.
+    """
+
+    username = StringProperty('')
+
+    # Vowels status
+    aStatus = BooleanProperty(False)
+    eStatus = BooleanProperty(False)
+    iStatus = BooleanProperty(False)
+    oStatus = BooleanProperty(False)
+    uStatus = BooleanProperty(False)
+
+    # Intro screen status
+    introStatus = BooleanProperty(False)
+
+    # vowels screen, if true all vowels are cleared
+    vowelScreen = BooleanProperty(False)
+
+    # challenge
+    easyChallenge = BooleanProperty(False)
+    intermediateChallenge = BooleanProperty(False)
+    hardChallenge = BooleanProperty(False)
+
+    finalAchievement = BooleanProperty(False)
+    achievementOne = BooleanProperty(False)
+    achievementTwo = BooleanProperty(False)
+    achievementThree = BooleanProperty(False)
+    achievementFour = BooleanProperty(False)
+
+    def __init__(self, store=account_store, **kwargs):
+        super().__init__(**kwargs)
+        self.store = store
+        store.add_listener(self.sync)
+        account = store.get()
+        if account is not None:
+            self.sync(account)
+
+    def sync(self, account, fields=None):
+        """Copy changed flags (all of them if fields is None) from account."""
+        names = FLAG_FIELDS if fields is None else [name for name in fields if name in FLAG_FIELDS]
+        for name in names:
+            setattr(self, name, bool(getattr(account, name)))
+        if fields is None or 'username' in fields:
+            self.username = account.username
+
+    @property
+    def vowels_complete(self):
+        return self.aStatus and self.eStatus and self.iStatus and self.oStatus and self.uStatus
+
+    @property
+    def challenges_complete(self):
+        return self.easyChallenge and self.intermediateChallenge and self.hardChallenge
+
+
+# Shared by every screen that shows progress
+progress = Progress()
@@ -0,0 +1,188 @@
+import threading
+import time
+import weakref
+
+from camera_manager import camera_manager
+from gesture_recognizer import gesture_recognizer
+from pipeline_metrics import pipeline_metrics
+
+# Pipeline states
+RUNNING = 'running'
+PAUSED = 'paused'
+STOPPED = 'stopped'
+
+# One lock per recognizer, held by the worker that is using it
+_recognizer_locks = weakref.WeakKeyDictionary()
+_recognizer_locks_guard = threading.Lock()
+
+
+def _lock_for(recognizer):
+    with _recognizer_locks_guard:
+        lock = _recognizer_locks.get(recognizer)
+        if lock is None:
+            lock = _recognizer_locks[recognizer] = threading.Lock()
+        return lock
+
+
+class RecognitionWorker(threading.Thread):
+    """Reads camera frames and runs gesture recognition off the UI thread.
+
+    Only the newest result is kept. Camera screens call take() from their
+    Clock callback, so a slow frame never blocks the UI. The camera itself
+    belongs to the CameraManager and stays open between screens; the
+    worker hands it back when its thread exits. stop() doesn't wait for
+    that; workers sharing a recognizer take turns instead, a new one
+    waiting on its own thread until the previous one has finished.
+
+    pause() stops recognition while a screen has nothing to recognize, e.g.
+    while a result dialog is open: the worker keeps grabbing frames so the
+    camera stays warm, but doesn't decode, classify or publish them, so
+    take() returns None and nothing is uploaded. resume() starts over with
+    fresh tracking; the time until the first new result is published is
+    kept as last_resume_latency.
+    """
+
+    def __init__(self, camera=camera_manager, recognizer=gesture_recognizer, metrics=pipeline_metrics,
+                 late_after=0.1):
+        super().__init__(daemon=True)
+        self.camera = camera
+        self.recognizer = recognizer
+        self.metrics = metrics
+        self.late_after = late_after  # seconds from capture to display before a frame counts as late
+        self._stop_event = threading.Event()
+        self._paused = threading.Event()
+        self._resumed_at = None
+        self._latest = None
+        self._seq = 0
+        self._taken_seq = 0
+
+        # Throughput statistics
+        self.frames_processed = 0
+        self.frames_grabbed_paused = 0
+        self.inference_fps = 0.0
+        self.last_resume_latency = None
+
+    @property
+    def state(self):
+        if self._stop_event.is_set():
+            return STOPPED
+        return PAUSED if self._paused.is_set() else RUNNING
+
+    def start(self):
+        self.camera.acquire()
+        super().start()
+
+    def run(self):
+        try:
+            with _lock_for(self.recognizer):
+                if not self._stop_event.is_set():
+                    self._run()
+        finally:
+            self.camera.release()
+
+    def _run(self):
+        self.recognizer.load()
+        self.recognizer.reset_tracking()
+        last_time = time.perf_counter()
+
+        was_paused = False
+
+        while not self._stop_event.is_set():
+            if self._paused.is_set():
+                was_paused = True
+                if self.camera.grab():
+                    self.frames_grabbed_paused += 1
+                else:
+                    time.sleep(0.01)
+                continue
+            if was_paused:
+                # The hand has moved on since the pause; don't track or smooth across it
+                was_paused = False
+                self.recognizer.reset_tracking()
+
+            with self.metrics.stage('capture'):
+                ret, frame = self.camera.read()
+            if not ret:
+                time.sleep(0.01)
+                continue
+            captured_at = time.perf_counter()
+
+            result = self.recognizer.process(frame, self._seq + 1)
+            result.captured_at = captured_at
+            if self._stop_event.is_set():
+                break
+            resumed_at = self._resumed_at
+            if self._paused.is_set() or (resumed_at is not None and captured_at < resumed_at):
+                # Captured before or during a pause; it's not wanted any more
+                continue
+
+            # Numbered only once published, so take() doesn't count discarded frames as dropped
+            self._seq += 1
+            result.seq = self._seq
+            # Replacing the reference is atomic, so readers never see a partial result
+            self._latest = result
+            self.frames_processed += 1
+
+            now = time.perf_counter()
+            if resumed_at is not None:
+                # The pause isn't frame time
+                self._resumed_at = None
+                self.last_resume_latency = now - resumed_at
+                self.metrics.record('resume', self.last_resume_latency)
+                last_time = now
+                continue
+            frame_time = now - last_time
+            last_time = now
+            self.metrics.record('frame', frame_time)
+            if frame_time > 0:
+                # Smoothed so the figure doesn't jump around with every frame
+                self.inference_fps = 0.9 * self.inference_fps + 0.1 / frame_time
+
+    def latest(self):
+        """Return the newest RecognitionResult, or None if no frame was processed yet."""
+        return self._latest
+
+    def take(self):
+        """Return the newest result if it hasn't been taken yet, otherwise None.
+
+        Results that were replaced before anyone took them are counted as
+        dropped, and results older than late_after when taken as late.
+        Always None while paused.
+        """
+        result = self._latest
+        if result is None or result.seq == self._taken_seq or self._paused.is_set():
+            return None
+
+        if result.seq > self._taken_seq + 1:
+            self.metrics.count('dropped', result.seq - self._taken_seq - 1)
+        self._taken_seq = result.seq
+
+        if self.metrics.enabled:
+            latency = time.perf_counter() - result.captured_at
+            self.metrics.record('latency', latency)
+            if latency > self.late_after:
+                self.metrics.count('late')
+        return result
+
+    def pause(self):
+        """Stop recognizing and publishing frames, but keep the camera streaming."""
+        if self.state != RUNNING:
+            return
+        self._resumed_at = None
+        self._paused.set()
+        # A result published just before the pause is stale by the time anyone could show it
+        self._taken_seq = self._seq
+
+    def resume(self):
+        """Go back to recognizing after pause()."""
+        if self.state != PAUSED:
+            return
+        self._resumed_at = time.perf_counter()
+        self._paused.clear()
+
+    def stop(self):
+        """Ask the worker to finish; its thread hands the camera back to the CameraManager on exit.
+
+        Doesn't wait for it: the next worker on the same recognizer does.
+        """
+        self._stop_event.set()
@@ -2,42 +2,15 @@ from kivymd.uix.screen import MDScreen
 from kivymd.uix.boxlayout import MDBoxLayout
 from kivymd.uix.button import MDRaisedButton
 from kivymd.uix.dialog import MDDialog
+from kivymd.app import MDApp
 from kivy.lang import Builder
 from kivy.core.window import Window
 from kivy.clock import Clock
-import os
-import pickle
+# Account moved to account.py; still importable from here
+from account import Account
+from account_store import account_store
 from helpers import *
 
-class Account:
-    def __init__(self, username: str = "user"):
-        self.username = username
-
-        # Vowels status
-        self.aStatus = False
-        self.eStatus = False
-        self.iStatus = False
-        self.oStatus = False
-        self.uStatus = False
-
-        # Intro screen status
-        self.introStatus = False
-
-        ## vowels screen, if true all vowels are cleared
-        self.vowelScreen = False
-
-        # challenge
-        self.easyChallenge = False
-        self.intermediateChallenge = False
-        self.hardChallenge = False
-
-        self.finalAchievement = False
-
-        # User Preference Settings
-        self.music_volume = 0.5
-        self.sfx_volume = 0.5
-
-
 class RegisterScreen(MDScreen):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -79,37 +52,32 @@ class RegisterScreen(MDScreen):
 
     def check_existing_account(self, dt):
         """Load existing account and redirect if valid."""
-        if os.path.exists("account_data.pkl"):
-            try:
-                with open("account_data.pkl", "rb") as file:
-                    account = pickle.load(file)
-
-                if isinstance(account, Account):  # Ensure it's an Account object
-                    # Case-insensitive check for 'user' username
-                    if account.username.lower() == 'user':
-                        self.parent.current = 'register'
-                        self.create_default_account()
-                    else:
-                        # Redirect to bottom_nav screen
-                        if self.manager and "bottom_nav" in self.manager.screen_names:
-                            self.manager.current = "bottom_nav"
-                        else:
-                            print("Error: 'bottom_nav' screen not found.")
-                else:
-                    print("Invalid account data. Creating a new default account.")
-                    self.create_default_account()
-            except (pickle.UnpicklingError, EOFError):
+        account = account_store.get()
+        if account is None:
+            if account_store.load_error:
                 print("Corrupted account file. Creating a new default account.")
+            else:
+                print("No account_data.pkl found. Creating new account file.")
+            self.create_default_account()
+        elif isinstance(account, Account):  # Ensure it's an Account object
+            # Case-insensitive check for 'user' username
+            if account.username.lower() == 'user':
+                self.parent.current = 'register'
                 self.create_default_account()
+            else:
+                # Redirect to bottom_nav screen
+                if self.manager and self.manager.has_screen("bottom_nav"):
+                    self.manager.current = "bottom_nav"
+                else:
+                    print("Error: 'bottom_nav' screen not found.")
         else:
-            print("No account_data.pkl found. Creating new account file.")
+            print("Invalid account data. Creating a new default account.")
             self.create_default_account()
 
     def create_default_account(self):
         """Create a default account and save it."""
         default_account = Account()
-        with open("account_data.pkl", "wb") as file:
-            pickle.dump(default_account, file)
+        account_store.set(default_account)
 
         self.parent.current = 'register'
 
@@ -134,9 +102,15 @@ class RegisterScreen(MDScreen):
         self.fields[self.current_field_index].focus = True
 
     def save_account(self):
-        self.account = Account(self.userName.text)
-        with open("account_data.pkl", "wb") as file:
-            pickle.dump(self.account, file)
+        # A learner who already has a profile on this machine continues where they left off
+        self.account = account_store.switch(self.userName.text)
+        if self.account is None:
+            self.account = Account(self.userName.text)
+            account_store.set(self.account)
+        else:
+            app = MDApp.get_running_app()
+            app.set_music_volume(self.account.music_volume)
+            app.set_sfx_volume(self.account.sfx_volume)
 
     def register(self, obj):
         """Triggered when user presses 'Login'."""
@@ -158,7 +132,7 @@ class RegisterScreen(MDScreen):
         # Proceed if the username is not 'user'
         if username_input != "":
             self.save_account()
-            if self.manager and "bottom_nav" in self.manager.screen_names:
+            if self.manager and self.manager.has_screen("bottom_nav"):
                 self.manager.current = "bottom_nav"
             else:
                 print("Error: 'bottom_nav' screen not found in ScreenManager.")
@@ -0,0 +1,85 @@
+import sys
+import time
+
+import numpy as np
+from kivy.clock import Clock
+from kivy.uix.button import Button
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.screenmanager import NoTransition, Screen
+
+from main import SignItUp
+
+
+class FillerScreen(Screen):
+    """A screen with `buttons` buttons, standing in for the real screens."""
+
+    def __init__(self, buttons=40, **kwargs):
+        super().__init__(**kwargs)
+        layout = BoxLayout(orientation='vertical')
+        for i in range(buttons):
+            layout.add_widget(Button(text=str(i)))
+        self.add_widget(layout)
+
+
+class ScreenSwitchBenchmarkApp(SignItUp):
+    """Times switching between the home screen and the vowels menu as screens are added.
+
+    For each count in screen_counts, that many extra screens are built,
+    then `switches` switches are timed: setting sm.current, which runs
+    on_screen_change. With walk_all=True the handler does what it used to,
+    unbinding the click sound from every screen and binding it to the new
+    one, for comparison.
+    """
+
+    def __init__(self, screen_counts=(0, 10, 20, 40, 80), switches=200, walk_all=False, **kwargs):
+        super().__init__(**kwargs)
+        self.screen_counts = screen_counts
+        self.switches = switches
+        self.walk_all = walk_all
+        self.fillers = 0
+        self.results = []
+
+    def on_screen_change(self, instance, value):
+        if not self.walk_all:
+            return super().on_screen_change(instance, value)
+        for screen in self.sm.screens:
+            self.unbind_sfx_from_all_buttons(screen)
+        if value != 'register':
+            self.bind_sfx_to_all_buttons(self.sm.get_screen(value))
+
+    def on_start(self):
+        super().on_start()
+        self.sm.transition = NoTransition()
+        Clock.schedule_once(self.run_benchmark, 1)
+
+    def add_fillers(self, count):
+        while self.fillers < count:
+            name = f'filler_{self.fillers}'
+            # Pinned, so the screen manager doesn't evict them again
+            self.sm.register(name, FillerScreen, pinned=True)
+            self.sm.get_screen(name)
+            self.fillers += 1
+
+    def run_benchmark(self, dt):
+        route = ('vowels_menu', 'bottom_nav')
+        for count in self.screen_counts:
+            self.add_fillers(count)
+            # Visit both once so first-visit work isn't timed
+            for name in route:
+                self.sm.current = name
+            times = np.zeros(self.switches)
+            for i in range(self.switches):
+                start = time.perf_counter()
+                self.sm.current = route[i % 2]
+                times[i] = time.perf_counter() - start
+            widgets = sum(1 for screen in self.sm.screens for _ in screen.walk(restrict=True))
+            p50, p95 = np.percentile(times * 1000, [50, 95])
+            self.results.append((len(self.sm.screens), widgets, p50, p95))
+            print(f"{len(self.sm.screens):3d} screens, {widgets:5d} widgets: "
+                  f"switch p50 {p50:.2f} ms, p95 {p95:.2f} ms")
+        self.stop()
+
+
+if __name__ == '__main__':
+    # python screen_switch_benchmark.py [--walk-all]
+    ScreenSwitchBenchmarkApp(walk_all='--walk-all' in sys.argv).run()
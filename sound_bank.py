@@ -0,0 +1,133 @@
+import os
+import time
+
+from kivy.core.audio import SoundLoader
+
+# Volume categories
+MUSIC = 'music'
+SFX = 'sfx'
+INSTRUCTION = 'instruction'  # spoken instructions always play at full volume
+
+
+class SoundBank:
+    """Loads each sound file once and shares it between the screens that use it.
+
+    acquire(path) returns the shared Sound for path, decoding it on the first
+    request, and counts the reference; release(sound) gives it back. A sound
+    nobody holds stays loaded, so coming back to a screen costs nothing,
+    until evict_unused() unloads it.
+
+    A caller that must not share its Sound with the screens, because they
+    stop() theirs while it may still be playing, passes its own key and
+    gets a separate copy.
+
+    Every sound belongs to a volume category. set_volume() applies a
+    category's volume to all of its sounds at once; the app calls it with
+    the learner's music and SFX settings.
+    """
+
+    def __init__(self):
+        self._sounds = {}  # key -> Sound, or None if it couldn't be loaded
+        self._paths = {}  # key -> file
+        self._references = {}  # key -> number of holders
+        self._categories = {}  # key -> volume category
+        self.volumes = {MUSIC: 0.5, SFX: 0.5, INSTRUCTION: 1.0}
+
+        # Counters
+        self.requests = 0
+        self.decodes = 0
+        self.decode_time = 0.0
+        self.evictions = 0
+
+    def acquire(self, path, category=SFX, key=None):
+        """Return the shared Sound for path (None if it can't be loaded) and hold a reference to it.
+
+        Callers passing the same key share a Sound; the default key is path.
+        """
+        key = path if key is None else key
+        self.requests += 1
+        if key not in self._sounds:
+            start = time.perf_counter()
+            sound = SoundLoader.load(path)
+            self.decode_time += time.perf_counter() - start
+            self.decodes += 1
+            if sound is None:
+                print(f"Could not load sound {path}")
+            else:
+                sound.volume = self.volumes[category]
+            self._sounds[key] = sound
+            self._paths[key] = path
+            self._categories[key] = category
+        self._references[key] = self._references.get(key, 0) + 1
+        return self._sounds[key]
+
+    def release(self, sound):
+        """Drop a reference taken with acquire(). The sound stays loaded until evict_unused()."""
+        if sound is None:
+            return
+        for key, loaded in self._sounds.items():
+            if loaded is sound:
+                if self._references[key] > 0:
+                    self._references[key] -= 1
+                return
+
+    def evict_unused(self):
+        """Unload every sound nobody holds. Returns how many were unloaded."""
+        unused = [key for key, count in self._references.items() if count == 0]
+        for key in unused:
+            sound = self._sounds.pop(key)
+            del self._paths[key]
+            del self._references[key]
+            del self._categories[key]
+            if sound is not None:
+                sound.stop()
+                sound.unload()
+            self.evictions += 1
+        return len(unused)
+
+    def set_volume(self, category, volume):
+        self.volumes[category] = volume
+        for key, sound in self._sounds.items():
+            if sound is not None and self._categories[key] == category:
+                sound.volume = volume
+
+    def stop_all(self, category=None):
+        for key, sound in self._sounds.items():
+            if sound is not None and category in (None, self._categories[key]):
+                sound.stop()
+
+    def _estimated_bytes(self, key):
+        # Decoded 16-bit stereo at 44.1 kHz; the file size if the length isn't known
+        sound = self._sounds.get(key)
+        length = sound.length if sound is not None else 0
+        if length and length > 0:
+            return int(length * 44100 * 2 * 2)
+        path = self._paths[key]
+        return os.path.getsize(path) if os.path.exists(path) else 0
+
+    def stats(self):
+        """Loaded sounds and how much decoding and memory sharing them saved."""
+        resident = sum(self._estimated_bytes(key) for key in self._sounds)
+        # What every acquire() would have cost if each had decoded its own copy
+        unshared = sum(self._estimated_bytes(key) * count for key, count in self._references.items())
+        return {
+            'loaded': len(self._sounds),
+            'held': sum(self._references.values()),
+            'requests': self.requests,
+            'decodes': self.decodes,
+            'decode_ms': round(self.decode_time * 1000, 1),
+            'estimated_bytes': resident,
+            'estimated_unshared_bytes': max(unshared, resident),
+            'evictions': self.evictions,
+        }
+
+    def report(self):
+        stats = self.stats()
+        print(f"Sounds: {stats['loaded']} loaded for {stats['requests']} requests, "
+              f"{stats['decode_ms']:.0f} ms decoding, "
+              f"~{stats['estimated_bytes'] / 2 ** 20:.1f} MiB "
+              f"(~{stats['estimated_unshared_bytes'] / 2 ** 20:.1f} MiB if each screen had its own copy)")
+
+
+# Shared by the app and every screen
+sound_bank = SoundBank()
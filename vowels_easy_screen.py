@@ -1,7 +1,4 @@
-import pickle
-
 from flatbuffers import Builder
-from kivy.core.audio import SoundLoader
 from kivy.metrics import dp
 from kivy.uix.image import Image, AsyncImage
 from kivymd.uix.boxlayout import MDBoxLayout
@@ -12,7 +9,10 @@ from kivymd.uix.screen import MDScreen
 from kivy.lang import Builder
 from kivymd.app import MDApp
 
+from account_store import account_store
+from asset_resolver import asset_resolver
 from helpers import vowels_easy_input
+from sound_bank import sound_bank
 
 
 # --- class ---
@@ -83,9 +83,9 @@ class FirstScreen(MDScreen):
 
         # Initialize sound effects
         self.sfx = {
-            'button_click': SoundLoader.load('assets/sounds/select2.mp3'),
-            'correct_answer': SoundLoader.load('assets/sounds/correct.mp3'),
-            'wrong_answer': SoundLoader.load('assets/sounds/wrong.mp3')
+            'button_click': sound_bank.acquire('assets/sounds/select2.mp3'),
+            'correct_answer': sound_bank.acquire('assets/sounds/correct.mp3'),
+            'wrong_answer': sound_bank.acquire('assets/sounds/wrong.mp3')
         }
 
         # Main container for vertical centering
@@ -115,7 +115,7 @@ class FirstScreen(MDScreen):
         self.answerInput = Builder.load_string(vowels_easy_input)
 
         self.gif_image = AsyncImage(
-            source='assets/hands/letterE.PNG',
+            source=asset_resolver.resolve('assets/hands/letterE.PNG', dp(200)),
             allow_stretch=True,
             size_hint=(None, None),
             width=dp(200),
@@ -157,16 +157,9 @@ class FirstScreen(MDScreen):
 
         self.add_widget(main_layout)
 
-    def on_enter(self):
-        """Update sound volumes when screen becomes active"""
-        for sound in self.sfx.values():
-            if sound:
-                sound.volume = self.app.sfx_volume
-
     def play_sfx(self, sound_name):
         """Helper method to play SFX with current volume"""
         if sound_name in self.sfx and self.sfx[sound_name]:
-            self.sfx[sound_name].volume = self.app.sfx_volume
             self.sfx[sound_name].play()
 
     def submit_first(self, obj):
@@ -225,9 +218,9 @@ class SecondScreen(MDScreen):
 
         # Initialize sound effects
         self.sfx = {
-            'button_click': SoundLoader.load('assets/sounds/select2.mp3'),
-            'correct_answer': SoundLoader.load('assets/sounds/correct.mp3'),
-            'wrong_answer': SoundLoader.load('assets/sounds/wrong.mp3')
+            'button_click': sound_bank.acquire('assets/sounds/select2.mp3'),
+            'correct_answer': sound_bank.acquire('assets/sounds/correct.mp3'),
+            'wrong_answer': sound_bank.acquire('assets/sounds/wrong.mp3')
         }
 
         # Main container for vertical centering
@@ -257,7 +250,7 @@ class SecondScreen(MDScreen):
         self.answerInput = Builder.load_string(vowels_easy_input)
 
         self.gif_image = AsyncImage(
-            source='assets/hands/letterU.png',
+            source=asset_resolver.resolve('assets/hands/letterU.png', dp(200)),
             allow_stretch=True,
             size_hint=(None, None),
             width=dp(200),
@@ -299,16 +292,9 @@ class SecondScreen(MDScreen):
 
         self.add_widget(main_layout)
 
-    def on_enter(self):
-        """Update sound volumes when screen becomes active"""
-        for sound in self.sfx.values():
-            if sound:
-                sound.volume = self.app.sfx_volume
-
     def play_sfx(self, sound_name):
         """Helper method to play SFX with current volume"""
         if sound_name in self.sfx and self.sfx[sound_name]:
-            self.sfx[sound_name].volume = self.app.sfx_volume
             self.sfx[sound_name].play()
 
     def submit_first(self, obj):
@@ -367,9 +353,9 @@ class ThirdScreen(MDScreen):
 
         # Initialize sound effects
         self.sfx = {
-            'button_click': SoundLoader.load('assets/sounds/select2.mp3'),
-            'correct_answer': SoundLoader.load('assets/sounds/correct.mp3'),
-            'wrong_answer': SoundLoader.load('assets/sounds/wrong.mp3')
+            'button_click': sound_bank.acquire('assets/sounds/select2.mp3'),
+            'correct_answer': sound_bank.acquire('assets/sounds/correct.mp3'),
+            'wrong_answer': sound_bank.acquire('assets/sounds/wrong.mp3')
         }
 
         # Main container for vertical centering
@@ -399,7 +385,7 @@ class ThirdScreen(MDScreen):
         self.answerInput = Builder.load_string(vowels_easy_input)
 
         self.gif_image = AsyncImage(
-            source='assets/hands/letterA.png',
+            source=asset_resolver.resolve('assets/hands/letterA.png', dp(200)),
             allow_stretch=True,
             size_hint=(None, None),
             width=dp(200),
@@ -441,16 +427,9 @@ class ThirdScreen(MDScreen):
 
         self.add_widget(main_layout)
 
-    def on_enter(self):
-        """Update sound volumes when screen becomes active"""
-        for sound in self.sfx.values():
-            if sound:
-                sound.volume = self.app.sfx_volume
-
     def play_sfx(self, sound_name):
         """Helper method to play SFX with current volume"""
         if sound_name in self.sfx and self.sfx[sound_name]:
-            self.sfx[sound_name].volume = self.app.sfx_volume
             self.sfx[sound_name].play()
 
     def submit_first(self, obj):
@@ -509,9 +488,9 @@ class FourthScreen(MDScreen):
 
         # Initialize sound effects
         self.sfx = {
-            'button_click': SoundLoader.load('assets/sounds/select2.mp3'),
-            'correct_answer': SoundLoader.load('assets/sounds/correct.mp3'),
-            'wrong_answer': SoundLoader.load('assets/sounds/wrong.mp3')
+            'button_click': sound_bank.acquire('assets/sounds/select2.mp3'),
+            'correct_answer': sound_bank.acquire('assets/sounds/correct.mp3'),
+            'wrong_answer': sound_bank.acquire('assets/sounds/wrong.mp3')
         }
 
         # Main container for vertical centering
@@ -541,7 +520,7 @@ class FourthScreen(MDScreen):
         self.answerInput = Builder.load_string(vowels_easy_input)
 
         self.gif_image = AsyncImage(
-            source='assets/hands/letterI.png',
+            source=asset_resolver.resolve('assets/hands/letterI.png', dp(200)),
             allow_stretch=True,
             size_hint=(None, None),
             width=dp(200),
@@ -583,16 +562,9 @@ class FourthScreen(MDScreen):
 
         self.add_widget(main_layout)
 
-    def on_enter(self):
-        """Update sound volumes when screen becomes active"""
-        for sound in self.sfx.values():
-            if sound:
-                sound.volume = self.app.sfx_volume
-
     def play_sfx(self, sound_name):
         """Helper method to play SFX with current volume"""
         if sound_name in self.sfx and self.sfx[sound_name]:
-            self.sfx[sound_name].volume = self.app.sfx_volume
             self.sfx[sound_name].play()
 
     def submit_first(self, obj):
@@ -651,11 +623,11 @@ class FifthScreen(MDScreen):
 
         # Initialize sound effects
         self.sfx = {
-            'button_click': SoundLoader.load('assets/sounds/select2.mp3'),
-            'correct_answer': SoundLoader.load('assets/sounds/correct.mp3'),
-            'wrong_answer': SoundLoader.load('assets/sounds/wrong.mp3'),
-            'completion': SoundLoader.load('assets/sounds/levelwin2.mp3'),
-            'achievement': SoundLoader.load('assets/sounds/achievementunlock2.mp3')
+            'button_click': sound_bank.acquire('assets/sounds/select2.mp3'),
+            'correct_answer': sound_bank.acquire('assets/sounds/correct.mp3'),
+            'wrong_answer': sound_bank.acquire('assets/sounds/wrong.mp3'),
+            'completion': sound_bank.acquire('assets/sounds/levelwin2.mp3'),
+            'achievement': sound_bank.acquire('assets/sounds/achievementunlock2.mp3')
         }
 
         # Main container for vertical centering
@@ -683,7 +655,7 @@ class FifthScreen(MDScreen):
         self.answerInput = Builder.load_string(vowels_easy_input)
 
         self.gif_image = AsyncImage(
-            source='assets/hands/letterO.png',
+            source=asset_resolver.resolve('assets/hands/letterO.png', dp(200)),
             allow_stretch=True,
             size_hint=(None, None),
             width=dp(200),
@@ -723,16 +695,9 @@ class FifthScreen(MDScreen):
 
         self.add_widget(main_layout)
 
-    def on_enter(self):
-        """Update sound volumes when screen becomes active"""
-        for sound in self.sfx.values():
-            if sound:
-                sound.volume = self.app.sfx_volume
-
     def play_sfx(self, sound_name):
         """Helper method to play SFX with current volume"""
         if sound_name in self.sfx and self.sfx[sound_name]:
-            self.sfx[sound_name].volume = self.app.sfx_volume
             self.sfx[sound_name].play()
 
     def submit_first(self, obj):
@@ -750,14 +715,11 @@ class FifthScreen(MDScreen):
                 correct_dialog.dismiss()
 
                 # Load account data and check if first completion
-                with open("account_data.pkl", "rb") as file:
-                    account = pickle.load(file)
+                account = account_store.get()
                 first_completion = not account.easyChallenge
-                account.easyChallenge = True
 
                 # Save updated account data
-                with open("account_data.pkl", "wb") as file:
-                    pickle.dump(account, file)
+                account_store.update(easyChallenge=True)
 
                 # Play completion sound
                 self.play_sfx('completion')
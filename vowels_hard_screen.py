@@ -1,8 +1,3 @@
-import pickle
-import cv2
-import numpy as np
-import mediapipe as mp
-from kivy.core.audio import SoundLoader
 from kivy.metrics import dp
 from kivy.uix.image import Image, AsyncImage
 from kivymd.uix.boxlayout import MDBoxLayout
@@ -13,18 +8,17 @@ from kivymd.uix.screen import MDScreen
 from kivy.lang import Builder
 from kivymd.app import MDApp
 from kivy.clock import Clock
-from kivy.graphics.texture import Texture
 from kivymd.uix.progressbar import MDProgressBar
 
-# Load model once (moved to top level)
-model_dict = pickle.load(open('./model.p', 'rb'))
-model = model_dict['model']
-
-# Setup MediaPipe once
-mp_hands = mp.solutions.hands
-mp_drawing = mp.solutions.drawing_utils
-mp_drawing_styles = mp.solutions.drawing_styles
-hands = mp_hands.Hands(static_image_mode=True, min_detection_confidence=0.3)
+from account_store import account_store
+from asset_resolver import asset_resolver
+from frame_presenter import FramePresenter
+from gesture_analytics import HARD, gesture_analytics
+from gesture_state import GestureHold
+from metrics_overlay import MetricsOverlay
+from pipeline_metrics import pipeline_metrics
+from recognition_worker import RecognitionWorker
+from sound_bank import sound_bank
 
 
 class VowelsHardChallengeScreen(MDScreen):
@@ -45,7 +39,7 @@ class VowelsHardInstructionScreen(MDScreen):
         super().__init__(*args, **kwargs)
 
         self.sfx = {
-            'button_click': SoundLoader.load('assets/sounds/select2.mp3')
+            'button_click': sound_bank.acquire('assets/sounds/select2.mp3')
         }
 
         layout = MDBoxLayout(
@@ -88,9 +82,7 @@ class VowelsHardInstructionScreen(MDScreen):
 
     def play_sfx(self, sound_name):
         """Helper method to play SFX with current volume"""
-        app = MDApp.get_running_app()
         if sound_name in self.sfx and self.sfx[sound_name]:
-            self.sfx[sound_name].volume = app.sfx_volume
             self.sfx[sound_name].play()
 
     def go_to_next_screen(self, *args):
@@ -115,15 +107,17 @@ class BaseHardScreen(MDScreen):
         self.failed = False
         self.countdown = 3
         self.countdown_event = None
-        self.capture = None
+        self.worker = None
+        # Against the clock, so the first confident frame of the letter counts
+        self.gesture_hold = GestureHold(target_letter_idx, hold_time=0)
         self.event = None
 
         # Sound effects
         self.sfx = {
-            'button_click': SoundLoader.load('assets/sounds/select2.mp3'),
-            'correct_answer': SoundLoader.load('assets/sounds/correct.mp3'),
-            'wrong_answer': SoundLoader.load('assets/sounds/wrong.mp3'),
-            'countdown_tick': SoundLoader.load('assets/sounds/counter3.mp3')
+            'button_click': sound_bank.acquire('assets/sounds/select2.mp3'),
+            'correct_answer': sound_bank.acquire('assets/sounds/correct.mp3'),
+            'wrong_answer': sound_bank.acquire('assets/sounds/wrong.mp3'),
+            'countdown_tick': sound_bank.acquire('assets/sounds/counter3.mp3')
         }
 
         self.setup_ui()
@@ -163,10 +157,11 @@ class BaseHardScreen(MDScreen):
             height=dp(200),
             allow_stretch=True
         )
+        self.presenter = FramePresenter(self.camera_image)
 
         # Example image
         self.example_image = AsyncImage(
-            source=self.image_source,
+            source=asset_resolver.resolve(self.image_source, dp(200)),
             allow_stretch=True,
             size_hint=(None, None),
             width=dp(200),
@@ -237,30 +232,30 @@ class BaseHardScreen(MDScreen):
 
         self.add_widget(main_layout)
 
+        if pipeline_metrics.enabled:
+            self.add_widget(MetricsOverlay())
+
     def on_enter(self, *args):
         """Start camera and timers when screen becomes active"""
-        app = MDApp.get_running_app()
         self.reset_state()
-        self.capture = cv2.VideoCapture(0)
-        self.event = Clock.schedule_interval(self.update, 1.0 / 30.0)
+        self.worker = RecognitionWorker()
+        self.worker.start()
+        self.event = Clock.schedule_interval(self.update, 1.0 / 60.0)
+        gesture_analytics.start_attempt(HARD, self.target_letter_idx)
         self.countdown_event = Clock.schedule_interval(self.update_countdown, 1)
 
-        # Update sound volumes
-        for sound in self.sfx.values():
-            if sound:
-                sound.volume = app.sfx_volume
-
     def on_leave(self, *args):
         """Ensure all resources are cleaned up when leaving screen"""
+        gesture_analytics.abandon()
         # Remove self.go_back()
         self.stop_all_sounds()
 
         if self.countdown_event:
             Clock.unschedule(self.countdown_event)
             self.countdown_event = None
-        if self.capture:
-            self.capture.release()
-            self.capture = None
+        if self.worker:
+            self.worker.stop()
+            self.worker = None
         if self.event:
             Clock.unschedule(self.event)
             self.event = None
@@ -269,6 +264,7 @@ class BaseHardScreen(MDScreen):
         """Reset all state variables"""
         self.dialog_shown = False
         self.failed = False
+        self.gesture_hold.reset()
         self.countdown = 3
 
         # Reset UI elements
@@ -282,79 +278,45 @@ class BaseHardScreen(MDScreen):
             self.dialog = None
 
     def play_sfx(self, sound_name):
-        """Enhanced SFX playback with volume control and error handling"""
-        app = MDApp.get_running_app()
+        """Enhanced SFX playback with error handling; volume comes from the sound bank"""
         try:
             if sound_name in self.sfx and self.sfx[sound_name]:
                 # Stop sound if already playing
                 self.sfx[sound_name].stop()
-                # Set current volume
-                self.sfx[sound_name].volume = app.sfx_volume
                 # Play sound
                 self.sfx[sound_name].play()
         except Exception as e:
             print(f"Error playing sound {sound_name}: {e}")
 
     def update(self, dt):
-        """Process camera frame and detect gestures"""
-        if not self.capture:
-            return
-
-        ret, frame = self.capture.read()
-        if not ret:
+        """Show the newest recognition result from the worker thread"""
+        result = self.worker.take() if self.worker else None
+        if result is None:
             return
+        confirmed = self.gesture_hold.update_result(result)
+        gesture_analytics.record_result(result, matched=self.gesture_hold.matched)
+
+        if not result.hand_detected:
+            prediction_text = "No hand detected"
+        elif result.error is not None:
+            prediction_text = "Prediction error"
+        elif self.gesture_hold.matched:
+            prediction_text = "Correct gesture detected!"
+        else:
+            prediction_text = "Gesture incorrect"
 
-        data_aux = []
-        x_, y_ = [], []
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = hands.process(frame_rgb)
-
-        prediction_text = "No hand detected"
-
-        if results.multi_hand_landmarks:
-            for hand_landmarks in results.multi_hand_landmarks:
-                mp_drawing.draw_landmarks(
-                    frame,
-                    hand_landmarks,
-                    mp_hands.HAND_CONNECTIONS,
-                    mp_drawing_styles.get_default_hand_landmarks_style(),
-                    mp_drawing_styles.get_default_hand_connections_style()
-                )
-
-                for lm in hand_landmarks.landmark:
-                    x_.append(lm.x)
-                    y_.append(lm.y)
-
-                for lm in hand_landmarks.landmark:
-                    data_aux.append(lm.x - min(x_))
-                    data_aux.append(lm.y - min(y_))
-
-                try:
-                    proba = model.predict_proba([np.asarray(data_aux)])
-                    confidence = np.max(proba)
-                    idx = np.argmax(proba)
-
-                    if idx == self.target_letter_idx and confidence >= 0.7:
-                        prediction_text = "Correct gesture detected!"
-                        if not self.dialog_shown:
-                            self.play_sfx('correct_answer')
-                            if self.countdown_event:
-                                Clock.unschedule(self.countdown_event)
-                                self.countdown_event = None
-                            self.show_success_dialog()
-                    else:
-                        prediction_text = "Gesture incorrect"
-                except Exception as e:
-                    prediction_text = "Prediction error"
+        if confirmed and not self.dialog_shown:
+            gesture_analytics.success()
+            self.play_sfx('correct_answer')
+            if self.countdown_event:
+                Clock.unschedule(self.countdown_event)
+                self.countdown_event = None
+            self.show_success_dialog()
 
         self.detection_label.text = prediction_text
 
         # Update camera texture
-        frame = cv2.flip(frame, 0)
-        buf = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB).tobytes()
-        img_texture = Texture.create(size=(frame.shape[1], frame.shape[0]), colorfmt='rgb')
-        img_texture.blit_buffer(buf, colorfmt='rgb', bufferfmt='ubyte')
-        self.camera_image.texture = img_texture
+        self.presenter.present(result.frame_rgb)
 
     def stop_all_sounds(self):
         """Stop all currently playing sound effects"""
@@ -372,6 +334,7 @@ class BaseHardScreen(MDScreen):
             self.countdown_label.text = "Time left: 0s"
             if not self.dialog_shown and not self.failed:
                 self.failed = True
+                gesture_analytics.failure()
                 self.play_sfx('wrong_answer')
                 self.show_failure_dialog()
             return
@@ -395,6 +358,9 @@ class BaseHardScreen(MDScreen):
             self.countdown_event = None
 
         self.dialog_shown = True
+        # Nothing to recognize behind the dialog; the camera stays warm
+        if self.worker:
+            self.worker.pause()
         self.play_sfx('correct_answer')
 
         def go_to_next_screen(*args):
@@ -419,6 +385,8 @@ class BaseHardScreen(MDScreen):
     def show_failure_dialog(self):
         """Show failure dialog with proper countdown stopping"""
         self.dialog_shown = True
+        if self.worker:
+            self.worker.pause()
 
         # Stop countdown if it wasn't already stopped
         if self.countdown_event:
@@ -458,9 +426,9 @@ class BaseHardScreen(MDScreen):
         if self.countdown_event:
             Clock.unschedule(self.countdown_event)
             self.countdown_event = None
-        if self.capture:
-            self.capture.release()
-            self.capture = None
+        if self.worker:
+            self.worker.stop()
+            self.worker = None
         if self.event:
             Clock.unschedule(self.event)
             self.event = None
@@ -520,9 +488,9 @@ class FifthScreenVowelHard(BaseHardScreen):
         )
 
         # Add completion sound effects
-        self.sfx['completion'] = SoundLoader.load('assets/sounds/levelwin2.mp3')
-        self.sfx['achievement'] = SoundLoader.load('assets/sounds/achievementunlock2.mp3')
-        self.sfx['completionist'] = SoundLoader.load('assets/sounds/achievementunlock2.mp3')
+        self.sfx['completion'] = sound_bank.acquire('assets/sounds/levelwin2.mp3')
+        self.sfx['achievement'] = sound_bank.acquire('assets/sounds/achievementunlock2.mp3')
+        self.sfx['completionist'] = sound_bank.acquire('assets/sounds/achievementunlock2.mp3')
 
     def show_success_dialog(self):
         """Override to show completion dialog and handle achievements"""
@@ -530,17 +498,17 @@ class FifthScreenVowelHard(BaseHardScreen):
             return
 
         self.dialog_shown = True
+        if self.worker:
+            self.worker.pause()
 
         def show_challenge_complete(*args):
             self.dialog.dismiss()
 
             # Load account data
-            with open("account_data.pkl", "rb") as file:
-                account = pickle.load(file)
+            account = account_store.get()
 
             # Check if first completion of hard challenge
             first_completion = not account.hardChallenge
-            account.hardChallenge = True
 
             # Check if all requirements for completionist are met
             completionist_requirements_met = (
@@ -552,16 +520,13 @@ class FifthScreenVowelHard(BaseHardScreen):
                 account.introStatus and
                 account.easyChallenge and
                 account.intermediateChallenge and
-                account.hardChallenge and
                 not account.finalAchievement
             )
 
-            if completionist_requirements_met:
-                account.finalAchievement = True  # This is your completionist achievement
-
             # Save updated account data
-            with open("account_data.pkl", "wb") as file:
-                pickle.dump(account, file)
+            account_store.update(hardChallenge=True)
+            if completionist_requirements_met:
+                account_store.update(finalAchievement=True)  # This is your completionist achievement
 
             # Play completion sound
             self.play_sfx('completion')
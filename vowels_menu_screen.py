@@ -1,7 +1,3 @@
-import os
-import pickle
-
-from kivy.core.audio import SoundLoader
 from kivy.core.window import Window
 from kivy.uix.boxlayout import BoxLayout
 from kivymd.uix.boxlayout import MDBoxLayout
@@ -13,7 +9,10 @@ from kivy.uix.gridlayout import GridLayout
 from kivy.uix.behaviors import ButtonBehavior
 from kivy.uix.image import Image
 from kivy.metrics import dp
+from asset_resolver import asset_resolver
 from helpers import *
+from progress import progress
+from sound_bank import sound_bank
 from status import status_tracker
 
 class ImageButton(ButtonBehavior, Image):
@@ -26,8 +25,8 @@ class VowelMenuScreen(MDScreen):
 
         # Initialize sounds
         self.sfx = {
-            'button_click': SoundLoader.load('assets/sounds/select2.mp3'),
-            'vowel_select': SoundLoader.load('assets/sounds/select2.mp3')
+            'button_click': sound_bank.acquire('assets/sounds/select2.mp3'),
+            'vowel_select': sound_bank.acquire('assets/sounds/select2.mp3')
         }
 
         # Main container to center content vertically
@@ -89,18 +88,11 @@ class VowelMenuScreen(MDScreen):
         update_spacers()
 
         self.add_widget(main_box)
-
-    def on_enter(self):
-        """Update volumes when screen becomes active"""
-        for sound in self.sfx.values():
-            if sound:
-                sound.volume = self.app.sfx_volume
-        self.add_vowel_buttons()
+        self.add_widget(self.back_button)
 
     def play_sfx(self, sound_name):
         """Helper method to play SFX with current volume"""
         if sound_name in self.sfx and self.sfx[sound_name]:
-            self.sfx[sound_name].volume = self.app.sfx_volume
             self.sfx[sound_name].play()
 
     def open_letter_a(self, *args):
@@ -129,178 +121,87 @@ class VowelMenuScreen(MDScreen):
         app.openLetterU()
 
     def add_vowel_buttons(self):
-        # Clear existing widgets first
-        self.layout.clear_widgets()
-
-        if not os.path.exists("account_data.pkl"):
-            print("No account_data.pkl found. Creating new account.")
-            self.create_default_account()
-        else:
-            with open("account_data.pkl", "rb") as file:
-                account = pickle.load(file)
-
-            # Create buttons
-            buttons = []
-
-            # a button
-            if account.aStatus:
-                aBtn = ImageButton(
-                    source='assets/checkAa.png',
-                    size_hint=(None, None),
-                    size=(dp(150), dp(150))
-                )
-            else:
-                aBtn = ImageButton(
-                    source='assets/aA.png',
-                    size_hint=(None, None),
-                    size=(dp(150), dp(150)),
-                )
-            buttons.append(aBtn)
+        """Creates the vowel buttons and the back button once; refresh_vowel_buttons keeps them current."""
+        # Create buttons
+        self.vowel_buttons = buttons = [
+            ImageButton(source=asset_resolver.resolve(source), size_hint=(None, None), size=(dp(150), dp(150)))
+            for source in ('assets/aA.png', 'assets/eE.png', 'assets/Ii.png', 'assets/Oo.png', 'assets/Uu.png')
+        ]
+
+        # Bind buttons with sound effects
+        buttons[0].bind(on_press=lambda x: (self.play_sfx('button_click'), self.open_letter_a()))
+        buttons[1].bind(on_press=lambda x: (self.play_sfx('button_click'), self.open_letter_e()))
+        buttons[2].bind(on_press=lambda x: (self.play_sfx('button_click'), self.open_letter_i()))
+        buttons[3].bind(on_press=lambda x: (self.play_sfx('button_click'), self.open_letter_o()))
+        buttons[4].bind(on_press=lambda x: (self.play_sfx('button_click'), self.open_letter_u()))
+
+        # Calculate required space and adjust button sizes if needed
+        button_width = dp(150)
+        num_buttons = len(buttons)
+        screen_width = Window.width
+        total_button_width = num_buttons * button_width
+        min_spacing = dp(5)  # Minimum spacing between buttons
+
+        # Check if buttons fit with minimum spacing
+        if total_button_width + (num_buttons - 1) * min_spacing > screen_width:
+            # Calculate maximum possible button width that fits
+            max_button_width = (screen_width - (num_buttons - 1) * min_spacing) / num_buttons
+            button_width = min(button_width, max_button_width)
+            # Update all button sizes
+            for btn in buttons:
+                btn.size = (button_width, button_width)
 
-            # e button
-            if not account.aStatus:
-                eBtn = ImageButton(
-                    source='assets/lockEe.png',
-                    size_hint=(None, None),
-                    size=(dp(150), dp(150)),
-                    disabled=True
-                )
-            elif account.eStatus:
-                eBtn = ImageButton(
-                    source='assets/checkEe.png',
-                    size_hint=(None, None),
-                    size=(dp(150), dp(150))
-                )
-            else:
-                eBtn = ImageButton(
-                    source='assets/eE.png',
-                    size_hint=(None, None),
-                    size=(dp(150), dp(150)),
-                )
-            buttons.append(eBtn)
+        # Calculate total width including spacing
+        total_width = num_buttons * button_width + (num_buttons - 1) * min_spacing
 
-            # i button
-            if not account.eStatus:
-                iBtn = ImageButton(
-                    source='assets/lockIi.png',
-                    size_hint=(None, None),
-                    size=(dp(150), dp(150)),
-                    disabled=True
-                )
-            elif account.iStatus:
-                iBtn = ImageButton(
-                    source='assets/checkIi.png',
-                    size_hint=(None, None),
-                    size=(dp(150), dp(150))
-                )
-            else:
-                iBtn = ImageButton(
-                    source='assets/Ii.png',
-                    size_hint=(None, None),
-                    size=(dp(150), dp(150)),
-                )
-            buttons.append(iBtn)
+        # Create a horizontal box layout for the buttons
+        button_layout = BoxLayout(
+            size_hint=(None, None),
+            size=(total_width, button_width),
+            spacing=min_spacing,
+            pos_hint={'center_x': 0.5, 'top': 0.9}
+        )
 
-            # o button
-            if not account.iStatus:
-                oBtn = ImageButton(
-                    source='assets/lockOo.png',
-                    size_hint=(None, None),
-                    size=(dp(150), dp(150)),
-                    disabled=True
-                )
-            elif account.oStatus:
-                oBtn = ImageButton(
-                    source='assets/checkOo.png',
-                    size_hint=(None, None),
-                    size=(dp(150), dp(150))
-                )
-            else:
-                oBtn = ImageButton(
-                    source='assets/Oo.png',
-                    size_hint=(None, None),
-                    size=(dp(150), dp(150)),
-                )
-            buttons.append(oBtn)
+        # Add buttons to the button layout
+        for btn in buttons:
+            button_layout.add_widget(btn)
+
+        # Add the button layout to the main layout
+        self.layout.add_widget(button_layout)
+
+        # Back button
+        self.back_button = MDRaisedButton(
+            text='Back to Menu',
+            md_bg_color='gray',
+            on_release=lambda x: (self.play_sfx('button_click'), self.go_back()),
+            size_hint=(0.5, None),
+            height=dp(50),
+            pos_hint={'center_x': 0.5, 'center_y': 0.3}
+        )
 
-            # u button
-            if not account.oStatus:
-                uBtn = ImageButton(
-                    source='assets/lockUu.png',
-                    size_hint=(None, None),
-                    size=(dp(150), dp(150)),
-                    disabled=True
-                )
-            elif account.uStatus:
-                uBtn = ImageButton(
-                    source='assets/checkUu.png',
-                    size_hint=(None, None),
-                    size=(dp(150), dp(150))
-                )
+        self.refresh_vowel_buttons()
+        progress.bind(aStatus=self.refresh_vowel_buttons, eStatus=self.refresh_vowel_buttons,
+                      iStatus=self.refresh_vowel_buttons, oStatus=self.refresh_vowel_buttons,
+                      uStatus=self.refresh_vowel_buttons)
+
+    def refresh_vowel_buttons(self, *args):
+        """Updates the vowel button images and locks from the progress model."""
+        # Each vowel unlocks once the one before it is done: (image, done image, locked image, unlocked, done)
+        states = [
+            ('assets/aA.png', 'assets/checkAa.png', None, True, progress.aStatus),
+            ('assets/eE.png', 'assets/checkEe.png', 'assets/lockEe.png', progress.aStatus, progress.eStatus),
+            ('assets/Ii.png', 'assets/checkIi.png', 'assets/lockIi.png', progress.eStatus, progress.iStatus),
+            ('assets/Oo.png', 'assets/checkOo.png', 'assets/lockOo.png', progress.iStatus, progress.oStatus),
+            ('assets/Uu.png', 'assets/checkUu.png', 'assets/lockUu.png', progress.oStatus, progress.uStatus),
+        ]
+        for button, (image, check_image, lock_image, unlocked, done) in zip(self.vowel_buttons, states):
+            button.disabled = not unlocked
+            if not unlocked:
+                button.source = asset_resolver.resolve(lock_image)
+            elif done:
+                button.source = asset_resolver.resolve(check_image)
             else:
-                uBtn = ImageButton(
-                    source='assets/Uu.png',
-                    size_hint=(None, None),
-                    size=(dp(150), dp(150)),
-                )
-            buttons.append(uBtn)
-
-            # Bind buttons with sound effects
-            buttons[0].bind(on_press=lambda x: (self.play_sfx('button_click'), self.open_letter_a()))
-            buttons[1].bind(on_press=lambda x: (self.play_sfx('button_click'), self.open_letter_e()))
-            buttons[2].bind(on_press=lambda x: (self.play_sfx('button_click'), self.open_letter_i()))
-            buttons[3].bind(on_press=lambda x: (self.play_sfx('button_click'), self.open_letter_o()))
-            buttons[4].bind(on_press=lambda x: (self.play_sfx('button_click'), self.open_letter_u()))
-
-            # Calculate required space and adjust button sizes if needed
-            button_width = dp(150)
-            num_buttons = len(buttons)
-            screen_width = Window.width
-            total_button_width = num_buttons * button_width
-            min_spacing = dp(5)  # Minimum spacing between buttons
-
-            # Check if buttons fit with minimum spacing
-            if total_button_width + (num_buttons - 1) * min_spacing > screen_width:
-                # Calculate maximum possible button width that fits
-                max_button_width = (screen_width - (num_buttons - 1) * min_spacing) / num_buttons
-                button_width = min(button_width, max_button_width)
-                # Update all button sizes
-                for btn in buttons:
-                    btn.size = (button_width, button_width)
-
-            # Calculate total width including spacing
-            total_width = num_buttons * button_width + (num_buttons - 1) * min_spacing
-            # Calculate side padding
-            side_padding = max(0, (screen_width - total_width) / 2)
-
-            # Create a horizontal box layout for the buttons
-            button_layout = BoxLayout(
-                size_hint=(None, None),
-                size=(total_width, button_width),
-                spacing=min_spacing,
-                pos_hint={'center_x': 0.5, 'top': 0.9}
-            )
-
-            # Add buttons to the button layout
-            for btn in buttons:
-                button_layout.add_widget(btn)
-
-            # Add the button layout to the main layout
-            self.layout.add_widget(button_layout)
-
-            # Back button
-            back_button = MDRaisedButton(
-                text='Back to Menu',
-                md_bg_color='gray',
-                on_release=lambda x: (self.play_sfx('button_click'), self.go_back()),
-                size_hint=(0.5, None),
-                height=dp(50),
-                pos_hint={'center_x': 0.5, 'center_y': 0.3}
-            )
-            self.add_widget(back_button)
-
-    def create_default_account(self):
-        print('Creating default account')
+                button.source = asset_resolver.resolve(image)
 
     def go_back(self, *args):
         self.play_sfx('button_click')
@@ -1,11 +1,4 @@
-import os
-import pickle
-
-import cv2
-import mediapipe as mp
-import numpy as np
 from kivy.clock import Clock
-from kivy.graphics.texture import Texture
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.image import Image, AsyncImage
 from kivy.uix.label import Label
@@ -14,19 +7,18 @@ from kivymd.uix.boxlayout import MDBoxLayout
 from kivymd.uix.button import MDRaisedButton
 from kivymd.uix.dialog import MDDialog
 from kivymd.uix.screen import MDScreen
-from kivy.core.audio import SoundLoader
+from asset_resolver import asset_resolver
 from status import status_tracker
 from kivymd.uix.progressbar import MDProgressBar
 
-# Load model once
-model_dict = pickle.load(open('./model.p', 'rb'))
-model = model_dict['model']
-
-# Setup MediaPipe once
-mp_hands = mp.solutions.hands
-mp_drawing = mp.solutions.drawing_utils
-mp_drawing_styles = mp.solutions.drawing_styles
-hands = mp_hands.Hands(static_image_mode=True, min_detection_confidence=0.3)
+from account_store import account_store
+from frame_presenter import FramePresenter
+from gesture_analytics import LETTER, gesture_analytics
+from gesture_state import GestureHold
+from metrics_overlay import MetricsOverlay
+from pipeline_metrics import pipeline_metrics
+from recognition_worker import RecognitionWorker
+from sound_bank import INSTRUCTION, sound_bank
 
 #LetterA --------------------------------------------------------------------
 class LetterAScreen(MDScreen):
@@ -34,28 +26,18 @@ class LetterAScreen(MDScreen):
         super().__init__(*args, **kwargs)
         self.app = MDApp.get_running_app()
 
-        # Load user's volume setting from account data
-        self.load_volume_setting()
-
         # Consolidate all SFX into a dictionary
         self.sfx = {
-            'button_click': SoundLoader.load('assets/sounds/select2.mp3'),
-            'success': SoundLoader.load('assets/sounds/levelwin2.mp3'),
-            'achievement': SoundLoader.load("assets/sounds/achievementunlock2.mp3"),
-            'instruction': SoundLoader.load('assets/sounds/copyinstruction.mp3')
+            'button_click': sound_bank.acquire('assets/sounds/select2.mp3'),
+            'success': sound_bank.acquire('assets/sounds/levelwin2.mp3'),
+            'achievement': sound_bank.acquire("assets/sounds/achievementunlock2.mp3"),
+            'instruction': sound_bank.acquire('assets/sounds/copyinstruction.mp3', INSTRUCTION)
         }
 
-        # Set volumes according to user setting (excluding instruction)
-        self.update_sound_volumes()
-        # Set instruction sound to full volume
-        if self.sfx.get('instruction'):
-            self.sfx['instruction'].volume = 1.0
-
-        self.gesture_hold_time = 0
-        self.gesture_target_time = 3
-        self.gesture_timer_event = None
+        # Hold the letter for 3 seconds; a few misread frames don't start it over
+        self.gesture_hold = GestureHold(0, hold_time=3)
         self.dialog_shown = False
-        self.capture = None
+        self.worker = None
         self.event = None
 
         self.layout = MDBoxLayout(orientation='vertical',
@@ -70,9 +52,10 @@ class LetterAScreen(MDScreen):
             width=200,
             height=200
         )
+        self.presenter = FramePresenter(self.image)
 
         self.gif_image = AsyncImage(
-            source='assets/hands/letterA.PNG',
+            source=asset_resolver.resolve('assets/hands/letterA.PNG', 200),
             allow_stretch=True,
             size_hint=(None, None),
             width=200,
@@ -107,10 +90,16 @@ class LetterAScreen(MDScreen):
 
         self.add_widget(self.layout)
 
+        if pipeline_metrics.enabled:
+            self.add_widget(MetricsOverlay())
+
     def on_enter(self, *args):
-        # Start camera capture immediately
-        self.capture = cv2.VideoCapture(0)
-        self.event = Clock.schedule_interval(self.update, 1.0 / 30.0)
+        # Start camera capture and recognition on a worker thread
+        self.worker = RecognitionWorker()
+        self.worker.start()
+        self.reset_gesture_hold()
+        self.event = Clock.schedule_interval(self.update, 1.0 / 60.0)
+        gesture_analytics.start_attempt(LETTER, 0)
 
         # Set up sound control
         self.sound_allowed = True
@@ -124,36 +113,18 @@ class LetterAScreen(MDScreen):
         if 'instruction' in self.sfx and self.sfx['instruction']:
             self.sfx['instruction'].stop()
 
+        gesture_analytics.abandon()
+
         # Cleanup camera and events
-        if self.capture:
-            self.capture.release()
+        if self.worker:
+            self.worker.stop()
+            self.worker = None
         if self.event:
             Clock.unschedule(self.event)
 
-    def load_volume_setting(self):
-        """Load the user's saved volume setting"""
-        try:
-            if os.path.exists("account_data.pkl"):
-                with open("account_data.pkl", "rb") as file:
-                    account = pickle.load(file)
-                    self.sfx_volume = getattr(account, 'sfx_volume', 0.5)
-            else:
-                self.sfx_volume = 0.5  # Default if no account exists yet
-        except Exception as e:
-            print(f"Error loading volume setting: {e}")
-
-    def update_sound_volumes(self):
-        """Update all sound volumes to current setting (except instruction sound)"""
-        for key, sound in self.sfx.items():
-            if sound and key != 'instruction':  # Skip the instruction sound
-                sound.volume = self.sfx_volume
-
     def play_sound(self, sound_name):
-        """Play a sound effect with current volume (instruction always at full volume)"""
+        """Play a sound effect; the sound bank sets its volume by category"""
         if sound_name in self.sfx and self.sfx[sound_name]:
-            # Instruction sound always plays at full volume
-            volume = 1.0 if sound_name == 'instruction' else self.sfx_volume
-            self.sfx[sound_name].volume = volume
             self.sfx[sound_name].stop()
             self.sfx[sound_name].play()
 
@@ -167,116 +138,60 @@ class LetterAScreen(MDScreen):
         self.go_back(*args)
 
     def update(self, dt):
-        if not self.capture:
+        result = self.worker.take() if self.worker else None
+        if result is None:
             return
-
-        ret, frame = self.capture.read()
-        if not ret:
-            return
-
-        data_aux = []
-        x_, y_ = [], []
-        H, W, _ = frame.shape
-
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = hands.process(frame_rgb)
-
-        prediction_text = "No hand detected"
-
-        if results.multi_hand_landmarks:
-            for hand_landmarks in results.multi_hand_landmarks:
-                mp_drawing.draw_landmarks(
-                    frame,
-                    hand_landmarks,
-                    mp_hands.HAND_CONNECTIONS,
-                    mp_drawing_styles.get_default_hand_landmarks_style(),
-                    mp_drawing_styles.get_default_hand_connections_style()
-                )
-
-                for lm in hand_landmarks.landmark:
-                    x_.append(lm.x)
-                    y_.append(lm.y)
-
-                for lm in hand_landmarks.landmark:
-                    data_aux.append(lm.x - min(x_))
-                    data_aux.append(lm.y - min(y_))
-
-                try:
-                    proba = model.predict_proba([np.asarray(data_aux)])
-                    confidence = np.max(proba)
-                    idx = np.argmax(proba)
-
-                    if idx == 0 and confidence >= 0.7:
-                        prediction_text = "You have successfully done the Letter A -- hold for 3 seconds"
-                        if not self.gesture_timer_event:
-                            self.gesture_hold_time = 0
-                            self.gesture_timer_event = Clock.schedule_interval(self.update_gesture_timer, 0.1)
-                    else:
-                        prediction_text = "Gesture incorrect"
-                        self.reset_gesture_timer()
-                except:
-                    prediction_text = "Prediction error"
-                    self.reset_gesture_timer()
-
-        if prediction_text == "No hand detected":
-            self.reset_gesture_timer()
+        confirmed = self.gesture_hold.update_result(result)
+        gesture_analytics.record_result(result, self.gesture_hold.held, self.gesture_hold.matched)
+
+        if not result.hand_detected:
+            prediction_text = "No hand detected"
+        elif result.error is not None:
+            prediction_text = "Prediction error"
+        elif self.gesture_hold.matched:
+            prediction_text = "You have successfully done the Letter A -- hold for 3 seconds"
+        else:
+            prediction_text = "Gesture incorrect"
 
         self.label.text = prediction_text
+        self.progress_bar.value = self.gesture_hold.progress * 100
+
+        if confirmed:
+            gesture_analytics.success(self.gesture_hold.held)
+            self.reset_gesture_hold()
+            self.show_success_dialog()
 
         # Display camera feed
-        frame = cv2.flip(frame, 0)
-        buf = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB).tobytes()
-        img_texture = Texture.create(size=(frame.shape[1], frame.shape[0]), colorfmt='rgb')
-        img_texture.blit_buffer(buf, colorfmt='rgb', bufferfmt='ubyte')
-        self.image.texture = img_texture
+        self.presenter.present(result.frame_rgb)
 
     def go_back(self, *args):
         app = MDApp.get_running_app()
         app.openVowelsMenu()
 
-    ##timer
-    def update_gesture_timer(self, dt):
-        self.gesture_hold_time += dt
-        # Update progress bar value based on the gesture hold time
-        progress = (self.gesture_hold_time / self.gesture_target_time) * 100
-        self.progress_bar.value = progress  # Update progress bar
-
-        if self.gesture_hold_time >= self.gesture_target_time:
-            self.reset_gesture_timer()
-            self.show_success_dialog()
-
-    def reset_gesture_timer(self):
-        if self.gesture_timer_event:
-            self.gesture_timer_event.cancel()
-            self.gesture_timer_event = None
-        self.gesture_hold_time = 0
-        self.progress_bar.value = 0  # Reset progress bar when timer is reset
+    def reset_gesture_hold(self):
+        self.gesture_hold.reset()
+        self.progress_bar.value = 0
 
     def show_success_dialog(self):
         if not self.dialog_shown:
-            # Update SFX volume from app settings
-            self.sfx_volume = self.app.sfx_volume
-            self.update_sound_volumes()
-
             # Play success sound with current volume
             if self.sfx.get('success'):
                 self.sfx['success'].stop()
                 self.sfx['success'].play()
 
             self.dialog_shown = True
+            # Nothing to recognize behind the dialog; the camera stays warm
+            if self.worker:
+                self.worker.pause()
 
             # Load account data
-            with open("account_data.pkl", "rb") as file:
-                account = pickle.load(file)
+            account = account_store.get()
 
             # Check if this is the first completion
             show_achievement = not getattr(account, "aStatus", False)
 
             # Mark aStatus as complete
-            account.aStatus = True
-
-            with open("account_data.pkl", "wb") as file:
-                pickle.dump(account, file)
+            account_store.update(aStatus=True)
 
             # Define the button behavior
             def on_thank_you(instance_btn):
@@ -304,10 +219,6 @@ class LetterAScreen(MDScreen):
             self.dialog.open()
 
     def show_achievement_popup(self):
-        # Update SFX volume from app settings
-        self.sfx_volume = self.app.sfx_volume
-        self.update_sound_volumes()
-
         # Play achievement sound with current volume
         if self.sfx.get('achievement'):
             self.sfx['achievement'].stop()
@@ -336,28 +247,18 @@ class LetterEScreen(MDScreen):
         super().__init__(*args, **kwargs)
         self.app = MDApp.get_running_app()
 
-        # Load user's volume setting from account data
-        self.load_volume_setting()
-
         # Consolidate all SFX into a dictionary
         self.sfx = {
-            'button_click': SoundLoader.load('assets/sounds/select2.mp3'),
-            'success': SoundLoader.load('assets/sounds/levelwin2.mp3'),
-            'achievement': SoundLoader.load("assets/sounds/achievementunlock2.mp3"),
-            'instruction': SoundLoader.load('assets/sounds/copyinstruction.mp3')
+            'button_click': sound_bank.acquire('assets/sounds/select2.mp3'),
+            'success': sound_bank.acquire('assets/sounds/levelwin2.mp3'),
+            'achievement': sound_bank.acquire("assets/sounds/achievementunlock2.mp3"),
+            'instruction': sound_bank.acquire('assets/sounds/copyinstruction.mp3', INSTRUCTION)
         }
 
-        # Set volumes according to user setting (excluding instruction)
-        self.update_sound_volumes()
-        # Set instruction sound to full volume
-        if self.sfx.get('instruction'):
-            self.sfx['instruction'].volume = 1.0
-
-        self.gesture_hold_time = 0
-        self.gesture_target_time = 3
-        self.gesture_timer_event = None
+        # Hold the letter for 3 seconds; a few misread frames don't start it over
+        self.gesture_hold = GestureHold(1, hold_time=3)
         self.dialog_shown = False
-        self.capture = None
+        self.worker = None
         self.event = None
 
         self.layout = MDBoxLayout(orientation='vertical',
@@ -372,9 +273,10 @@ class LetterEScreen(MDScreen):
             width=200,
             height=200
         )
+        self.presenter = FramePresenter(self.image)
 
         self.gif_image = AsyncImage(
-            source='assets/hands/letterE.PNG',
+            source=asset_resolver.resolve('assets/hands/letterE.PNG', 200),
             allow_stretch=True,
             size_hint=(None, None),
             width=200,
@@ -409,10 +311,16 @@ class LetterEScreen(MDScreen):
 
         self.add_widget(self.layout)
 
+        if pipeline_metrics.enabled:
+            self.add_widget(MetricsOverlay())
+
     def on_enter(self, *args):
-        # Start camera capture immediately
-        self.capture = cv2.VideoCapture(0)
-        self.event = Clock.schedule_interval(self.update, 1.0/30.0)
+        # Start camera capture and recognition on a worker thread
+        self.worker = RecognitionWorker()
+        self.worker.start()
+        self.reset_gesture_hold()
+        self.event = Clock.schedule_interval(self.update, 1.0 / 60.0)
+        gesture_analytics.start_attempt(LETTER, 1)
 
         # Set up sound control
         self.sound_allowed = True
@@ -426,36 +334,18 @@ class LetterEScreen(MDScreen):
         if 'instruction' in self.sfx and self.sfx['instruction']:
             self.sfx['instruction'].stop()
 
+        gesture_analytics.abandon()
+
         # Cleanup camera and events
-        if self.capture:
-            self.capture.release()
+        if self.worker:
+            self.worker.stop()
+            self.worker = None
         if self.event:
             Clock.unschedule(self.event)
 
-    def load_volume_setting(self):
-        """Load the user's saved volume setting"""
-        try:
-            if os.path.exists("account_data.pkl"):
-                with open("account_data.pkl", "rb") as file:
-                    account = pickle.load(file)
-                    self.sfx_volume = getattr(account, 'sfx_volume', 0.5)
-            else:
-                self.sfx_volume = 0.5  # Default if no account exists yet
-        except Exception as e:
-            print(f"Error loading volume setting: {e}")
-
-    def update_sound_volumes(self):
-        """Update all sound volumes to current setting (except instruction sound)"""
-        for key, sound in self.sfx.items():
-            if sound and key != 'instruction':  # Skip the instruction sound
-                sound.volume = self.sfx_volume
-
     def play_sound(self, sound_name):
-        """Play a sound effect with current volume (instruction always at full volume)"""
+        """Play a sound effect; the sound bank sets its volume by category"""
         if sound_name in self.sfx and self.sfx[sound_name]:
-            # Instruction sound always plays at full volume
-            volume = 1.0 if sound_name == 'instruction' else self.sfx_volume
-            self.sfx[sound_name].volume = volume
             self.sfx[sound_name].stop()
             self.sfx[sound_name].play()
 
@@ -469,115 +359,60 @@ class LetterEScreen(MDScreen):
         self.go_back(*args)
 
     def update(self, dt):
-        if not self.capture:
-            return
-
-        ret, frame = self.capture.read()
-        if not ret:
+        result = self.worker.take() if self.worker else None
+        if result is None:
             return
-
-        data_aux = []
-        x_, y_ = [], []
-        H, W, _ = frame.shape
-
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = hands.process(frame_rgb)
-
-        prediction_text = "No hand detected"
-
-        if results.multi_hand_landmarks:
-            for hand_landmarks in results.multi_hand_landmarks:
-                mp_drawing.draw_landmarks(
-                    frame,
-                    hand_landmarks,
-                    mp_hands.HAND_CONNECTIONS,
-                    mp_drawing_styles.get_default_hand_landmarks_style(),
-                    mp_drawing_styles.get_default_hand_connections_style()
-                )
-
-                for lm in hand_landmarks.landmark:
-                    x_.append(lm.x)
-                    y_.append(lm.y)
-
-                for lm in hand_landmarks.landmark:
-                    data_aux.append(lm.x - min(x_))
-                    data_aux.append(lm.y - min(y_))
-
-                try:
-                    proba = model.predict_proba([np.asarray(data_aux)])
-                    confidence = np.max(proba)
-                    idx = np.argmax(proba)
-
-                    if idx == 1 and confidence >= 0.7:  # Index 1 for Letter E
-                        prediction_text = "You have successfully done the Letter E -- hold for 3 seconds"
-                        if not self.gesture_timer_event:
-                            self.gesture_hold_time = 0
-                            self.gesture_timer_event = Clock.schedule_interval(self.update_gesture_timer, 0.1)
-                    else:
-                        prediction_text = "Gesture incorrect"
-                        self.reset_gesture_timer()
-                except:
-                    prediction_text = "Prediction error"
-                    self.reset_gesture_timer()
-
-        if prediction_text == "No hand detected":
-            self.reset_gesture_timer()
+        confirmed = self.gesture_hold.update_result(result)
+        gesture_analytics.record_result(result, self.gesture_hold.held, self.gesture_hold.matched)
+
+        if not result.hand_detected:
+            prediction_text = "No hand detected"
+        elif result.error is not None:
+            prediction_text = "Prediction error"
+        elif self.gesture_hold.matched:
+            prediction_text = "You have successfully done the Letter E -- hold for 3 seconds"
+        else:
+            prediction_text = "Gesture incorrect"
 
         self.label.text = prediction_text
+        self.progress_bar.value = self.gesture_hold.progress * 100
+
+        if confirmed:
+            gesture_analytics.success(self.gesture_hold.held)
+            self.reset_gesture_hold()
+            self.show_success_dialog()
 
         # Display camera feed
-        frame = cv2.flip(frame, 0)
-        buf = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB).tobytes()
-        img_texture = Texture.create(size=(frame.shape[1], frame.shape[0]), colorfmt='rgb')
-        img_texture.blit_buffer(buf, colorfmt='rgb', bufferfmt='ubyte')
-        self.image.texture = img_texture
+        self.presenter.present(result.frame_rgb)
 
     def go_back(self, *args):
         app = MDApp.get_running_app()
         app.openVowelsMenu()
 
-    def update_gesture_timer(self, dt):
-        self.gesture_hold_time += dt
-        # Update progress bar value based on the gesture hold time
-        progress = (self.gesture_hold_time / self.gesture_target_time) * 100
-        self.progress_bar.value = progress  # Update progress bar
-
-        if self.gesture_hold_time >= self.gesture_target_time:
-            self.reset_gesture_timer()
-            self.show_success_dialog()
-
-    def reset_gesture_timer(self):
-        if self.gesture_timer_event:
-            self.gesture_timer_event.cancel()
-            self.gesture_timer_event = None
-        self.gesture_hold_time = 0
-        self.progress_bar.value = 0  # Reset progress bar when timer is reset
+    def reset_gesture_hold(self):
+        self.gesture_hold.reset()
+        self.progress_bar.value = 0
 
     def show_success_dialog(self):
         if not self.dialog_shown:
-            # Update SFX volume from app settings
-            self.sfx_volume = self.app.sfx_volume
-            self.update_sound_volumes()
-
             # Play success sound with current volume
             if self.sfx.get('success'):
                 self.sfx['success'].stop()
                 self.sfx['success'].play()
 
             self.dialog_shown = True
+            # Nothing to recognize behind the dialog; the camera stays warm
+            if self.worker:
+                self.worker.pause()
 
             # Load account data
-            with open("account_data.pkl", "rb") as file:
-                account = pickle.load(file)
+            account = account_store.get()
 
             # Check if this is the first completion
             show_achievement = not getattr(account, "eStatus", False)
 
             # Mark eStatus as complete
-            account.eStatus = True
-
-            with open("account_data.pkl", "wb") as file:
-                pickle.dump(account, file)
+            account_store.update(eStatus=True)
 
             # Define the button behavior
             def on_thank_you(instance_btn):
@@ -605,10 +440,6 @@ class LetterEScreen(MDScreen):
             self.dialog.open()
 
     def show_achievement_popup(self):
-        # Update SFX volume from app settings
-        self.sfx_volume = self.app.sfx_volume
-        self.update_sound_volumes()
-
         # Play achievement sound with current volume
         if self.sfx.get('achievement'):
             self.sfx['achievement'].stop()
@@ -638,28 +469,18 @@ class LetterIScreen(MDScreen):
         super().__init__(*args, **kwargs)
         self.app = MDApp.get_running_app()
 
-        # Load user's volume setting from account data
-        self.load_volume_setting()
-
         # Consolidate all SFX into a dictionary
         self.sfx = {
-            'button_click': SoundLoader.load('assets/sounds/select2.mp3'),
-            'success': SoundLoader.load('assets/sounds/levelwin2.mp3'),
-            'achievement': SoundLoader.load("assets/sounds/achievementunlock2.mp3"),
-            'instruction': SoundLoader.load('assets/sounds/copyinstruction.mp3')
+            'button_click': sound_bank.acquire('assets/sounds/select2.mp3'),
+            'success': sound_bank.acquire('assets/sounds/levelwin2.mp3'),
+            'achievement': sound_bank.acquire("assets/sounds/achievementunlock2.mp3"),
+            'instruction': sound_bank.acquire('assets/sounds/copyinstruction.mp3', INSTRUCTION)
         }
 
-        # Set volumes according to user setting (excluding instruction)
-        self.update_sound_volumes()
-        # Set instruction sound to full volume
-        if self.sfx.get('instruction'):
-            self.sfx['instruction'].volume = 1.0
-
-        self.gesture_hold_time = 0
-        self.gesture_target_time = 3
-        self.gesture_timer_event = None
+        # Hold the letter for 3 seconds; a few misread frames don't start it over
+        self.gesture_hold = GestureHold(2, hold_time=3)
         self.dialog_shown = False
-        self.capture = None
+        self.worker = None
         self.event = None
 
         self.layout = MDBoxLayout(orientation='vertical',
@@ -674,9 +495,10 @@ class LetterIScreen(MDScreen):
             width=200,
             height=200
         )
+        self.presenter = FramePresenter(self.image)
 
         self.gif_image = AsyncImage(
-            source='assets/hands/letterI.PNG',
+            source=asset_resolver.resolve('assets/hands/letterI.PNG', 200),
             allow_stretch=True,
             size_hint=(None, None),
             width=200,
@@ -711,10 +533,16 @@ class LetterIScreen(MDScreen):
 
         self.add_widget(self.layout)
 
+        if pipeline_metrics.enabled:
+            self.add_widget(MetricsOverlay())
+
     def on_enter(self, *args):
-        # Start camera capture immediately
-        self.capture = cv2.VideoCapture(0)
-        self.event = Clock.schedule_interval(self.update, 1.0/30.0)
+        # Start camera capture and recognition on a worker thread
+        self.worker = RecognitionWorker()
+        self.worker.start()
+        self.reset_gesture_hold()
+        self.event = Clock.schedule_interval(self.update, 1.0 / 60.0)
+        gesture_analytics.start_attempt(LETTER, 2)
 
         # Set up sound control
         self.sound_allowed = True
@@ -728,36 +556,18 @@ class LetterIScreen(MDScreen):
         if 'instruction' in self.sfx and self.sfx['instruction']:
             self.sfx['instruction'].stop()
 
+        gesture_analytics.abandon()
+
         # Cleanup camera and events
-        if self.capture:
-            self.capture.release()
+        if self.worker:
+            self.worker.stop()
+            self.worker = None
         if self.event:
             Clock.unschedule(self.event)
 
-    def load_volume_setting(self):
-        """Load the user's saved volume setting"""
-        try:
-            if os.path.exists("account_data.pkl"):
-                with open("account_data.pkl", "rb") as file:
-                    account = pickle.load(file)
-                    self.sfx_volume = getattr(account, 'sfx_volume', 0.5)
-            else:
-                self.sfx_volume = 0.5  # Default if no account exists yet
-        except Exception as e:
-            print(f"Error loading volume setting: {e}")
-
-    def update_sound_volumes(self):
-        """Update all sound volumes to current setting (except instruction sound)"""
-        for key, sound in self.sfx.items():
-            if sound and key != 'instruction':  # Skip the instruction sound
-                sound.volume = self.sfx_volume
-
     def play_sound(self, sound_name):
-        """Play a sound effect with current volume (instruction always at full volume)"""
+        """Play a sound effect; the sound bank sets its volume by category"""
         if sound_name in self.sfx and self.sfx[sound_name]:
-            # Instruction sound always plays at full volume
-            volume = 1.0 if sound_name == 'instruction' else self.sfx_volume
-            self.sfx[sound_name].volume = volume
             self.sfx[sound_name].stop()
             self.sfx[sound_name].play()
 
@@ -771,115 +581,60 @@ class LetterIScreen(MDScreen):
         self.go_back(*args)
 
     def update(self, dt):
-        if not self.capture:
-            return
-
-        ret, frame = self.capture.read()
-        if not ret:
+        result = self.worker.take() if self.worker else None
+        if result is None:
             return
-
-        data_aux = []
-        x_, y_ = [], []
-        H, W, _ = frame.shape
-
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = hands.process(frame_rgb)
-
-        prediction_text = "No hand detected"
-
-        if results.multi_hand_landmarks:
-            for hand_landmarks in results.multi_hand_landmarks:
-                mp_drawing.draw_landmarks(
-                    frame,
-                    hand_landmarks,
-                    mp_hands.HAND_CONNECTIONS,
-                    mp_drawing_styles.get_default_hand_landmarks_style(),
-                    mp_drawing_styles.get_default_hand_connections_style()
-                )
-
-                for lm in hand_landmarks.landmark:
-                    x_.append(lm.x)
-                    y_.append(lm.y)
-
-                for lm in hand_landmarks.landmark:
-                    data_aux.append(lm.x - min(x_))
-                    data_aux.append(lm.y - min(y_))
-
-                try:
-                    proba = model.predict_proba([np.asarray(data_aux)])
-                    confidence = np.max(proba)
-                    idx = np.argmax(proba)
-
-                    if idx == 2 and confidence >= 0.7:  # Index 2 for Letter I
-                        prediction_text = "You have successfully done the Letter I -- hold for 3 seconds"
-                        if not self.gesture_timer_event:
-                            self.gesture_hold_time = 0
-                            self.gesture_timer_event = Clock.schedule_interval(self.update_gesture_timer, 0.1)
-                    else:
-                        prediction_text = "Gesture incorrect"
-                        self.reset_gesture_timer()
-                except:
-                    prediction_text = "Prediction error"
-                    self.reset_gesture_timer()
-
-        if prediction_text == "No hand detected":
-            self.reset_gesture_timer()
+        confirmed = self.gesture_hold.update_result(result)
+        gesture_analytics.record_result(result, self.gesture_hold.held, self.gesture_hold.matched)
+
+        if not result.hand_detected:
+            prediction_text = "No hand detected"
+        elif result.error is not None:
+            prediction_text = "Prediction error"
+        elif self.gesture_hold.matched:
+            prediction_text = "You have successfully done the Letter I -- hold for 3 seconds"
+        else:
+            prediction_text = "Gesture incorrect"
 
         self.label.text = prediction_text
+        self.progress_bar.value = self.gesture_hold.progress * 100
+
+        if confirmed:
+            gesture_analytics.success(self.gesture_hold.held)
+            self.reset_gesture_hold()
+            self.show_success_dialog()
 
         # Display camera feed
-        frame = cv2.flip(frame, 0)
-        buf = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB).tobytes()
-        img_texture = Texture.create(size=(frame.shape[1], frame.shape[0]), colorfmt='rgb')
-        img_texture.blit_buffer(buf, colorfmt='rgb', bufferfmt='ubyte')
-        self.image.texture = img_texture
+        self.presenter.present(result.frame_rgb)
 
     def go_back(self, *args):
         app = MDApp.get_running_app()
         app.openVowelsMenu()
 
-    def update_gesture_timer(self, dt):
-        self.gesture_hold_time += dt
-        # Update progress bar value based on the gesture hold time
-        progress = (self.gesture_hold_time / self.gesture_target_time) * 100
-        self.progress_bar.value = progress  # Update progress bar
-
-        if self.gesture_hold_time >= self.gesture_target_time:
-            self.reset_gesture_timer()
-            self.show_success_dialog()
-
-    def reset_gesture_timer(self):
-        if self.gesture_timer_event:
-            self.gesture_timer_event.cancel()
-            self.gesture_timer_event = None
-        self.gesture_hold_time = 0
-        self.progress_bar.value = 0  # Reset progress bar when timer is reset
+    def reset_gesture_hold(self):
+        self.gesture_hold.reset()
+        self.progress_bar.value = 0
 
     def show_success_dialog(self):
         if not self.dialog_shown:
-            # Update SFX volume from app settings
-            self.sfx_volume = self.app.sfx_volume
-            self.update_sound_volumes()
-
             # Play success sound with current volume
             if self.sfx.get('success'):
                 self.sfx['success'].stop()
                 self.sfx['success'].play()
 
             self.dialog_shown = True
+            # Nothing to recognize behind the dialog; the camera stays warm
+            if self.worker:
+                self.worker.pause()
 
             # Load account data
-            with open("account_data.pkl", "rb") as file:
-                account = pickle.load(file)
+            account = account_store.get()
 
             # Check if this is the first completion
             show_achievement = not getattr(account, "iStatus", False)
 
             # Mark iStatus as complete
-            account.iStatus = True
-
-            with open("account_data.pkl", "wb") as file:
-                pickle.dump(account, file)
+            account_store.update(iStatus=True)
 
             # Define the button behavior
             def on_thank_you(instance_btn):
@@ -907,10 +662,6 @@ class LetterIScreen(MDScreen):
             self.dialog.open()
 
     def show_achievement_popup(self):
-        # Update SFX volume from app settings
-        self.sfx_volume = self.app.sfx_volume
-        self.update_sound_volumes()
-
         # Play achievement sound with current volume
         if self.sfx.get('achievement'):
             self.sfx['achievement'].stop()
@@ -940,28 +691,18 @@ class LetterOScreen(MDScreen):
         super().__init__(*args, **kwargs)
         self.app = MDApp.get_running_app()
 
-        # Load user's volume setting from account data
-        self.load_volume_setting()
-
         # Consolidate all SFX into a dictionary
         self.sfx = {
-            'button_click': SoundLoader.load('assets/sounds/select2.mp3'),
-            'success': SoundLoader.load('assets/sounds/levelwin2.mp3'),
-            'achievement': SoundLoader.load("assets/sounds/achievementunlock2.mp3"),
-            'instruction': SoundLoader.load('assets/sounds/copyinstruction.mp3')
+            'button_click': sound_bank.acquire('assets/sounds/select2.mp3'),
+            'success': sound_bank.acquire('assets/sounds/levelwin2.mp3'),
+            'achievement': sound_bank.acquire("assets/sounds/achievementunlock2.mp3"),
+            'instruction': sound_bank.acquire('assets/sounds/copyinstruction.mp3', INSTRUCTION)
         }
 
-        # Set volumes according to user setting (excluding instruction)
-        self.update_sound_volumes()
-        # Set instruction sound to full volume
-        if self.sfx.get('instruction'):
-            self.sfx['instruction'].volume = 1.0
-
-        self.gesture_hold_time = 0
-        self.gesture_target_time = 3
-        self.gesture_timer_event = None
+        # Hold the letter for 3 seconds; a few misread frames don't start it over
+        self.gesture_hold = GestureHold(3, hold_time=3)
         self.dialog_shown = False
-        self.capture = None
+        self.worker = None
         self.event = None
 
         self.layout = MDBoxLayout(orientation='vertical',
@@ -976,9 +717,10 @@ class LetterOScreen(MDScreen):
             width=200,
             height=200
         )
+        self.presenter = FramePresenter(self.image)
 
         self.gif_image = AsyncImage(
-            source='assets/hands/letterO.PNG',
+            source=asset_resolver.resolve('assets/hands/letterO.PNG', 200),
             allow_stretch=True,
             size_hint=(None, None),
             width=200,
@@ -1013,10 +755,16 @@ class LetterOScreen(MDScreen):
 
         self.add_widget(self.layout)
 
+        if pipeline_metrics.enabled:
+            self.add_widget(MetricsOverlay())
+
     def on_enter(self, *args):
-        # Start camera capture immediately
-        self.capture = cv2.VideoCapture(0)
-        self.event = Clock.schedule_interval(self.update, 1.0/30.0)
+        # Start camera capture and recognition on a worker thread
+        self.worker = RecognitionWorker()
+        self.worker.start()
+        self.reset_gesture_hold()
+        self.event = Clock.schedule_interval(self.update, 1.0 / 60.0)
+        gesture_analytics.start_attempt(LETTER, 3)
 
         # Set up sound control
         self.sound_allowed = True
@@ -1030,36 +778,18 @@ class LetterOScreen(MDScreen):
         if 'instruction' in self.sfx and self.sfx['instruction']:
             self.sfx['instruction'].stop()
 
+        gesture_analytics.abandon()
+
         # Cleanup camera and events
-        if self.capture:
-            self.capture.release()
+        if self.worker:
+            self.worker.stop()
+            self.worker = None
         if self.event:
             Clock.unschedule(self.event)
 
-    def load_volume_setting(self):
-        """Load the user's saved volume setting"""
-        try:
-            if os.path.exists("account_data.pkl"):
-                with open("account_data.pkl", "rb") as file:
-                    account = pickle.load(file)
-                    self.sfx_volume = getattr(account, 'sfx_volume', 0.5)
-            else:
-                self.sfx_volume = 0.5  # Default if no account exists yet
-        except Exception as e:
-            print(f"Error loading volume setting: {e}")
-
-    def update_sound_volumes(self):
-        """Update all sound volumes to current setting (except instruction sound)"""
-        for key, sound in self.sfx.items():
-            if sound and key != 'instruction':  # Skip the instruction sound
-                sound.volume = self.sfx_volume
-
     def play_sound(self, sound_name):
-        """Play a sound effect with current volume (instruction always at full volume)"""
+        """Play a sound effect; the sound bank sets its volume by category"""
         if sound_name in self.sfx and self.sfx[sound_name]:
-            # Instruction sound always plays at full volume
-            volume = 1.0 if sound_name == 'instruction' else self.sfx_volume
-            self.sfx[sound_name].volume = volume
             self.sfx[sound_name].stop()
             self.sfx[sound_name].play()
 
@@ -1073,115 +803,60 @@ class LetterOScreen(MDScreen):
         self.go_back(*args)
 
     def update(self, dt):
-        if not self.capture:
-            return
-
-        ret, frame = self.capture.read()
-        if not ret:
+        result = self.worker.take() if self.worker else None
+        if result is None:
             return
-
-        data_aux = []
-        x_, y_ = [], []
-        H, W, _ = frame.shape
-
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = hands.process(frame_rgb)
-
-        prediction_text = "No hand detected"
-
-        if results.multi_hand_landmarks:
-            for hand_landmarks in results.multi_hand_landmarks:
-                mp_drawing.draw_landmarks(
-                    frame,
-                    hand_landmarks,
-                    mp_hands.HAND_CONNECTIONS,
-                    mp_drawing_styles.get_default_hand_landmarks_style(),
-                    mp_drawing_styles.get_default_hand_connections_style()
-                )
-
-                for lm in hand_landmarks.landmark:
-                    x_.append(lm.x)
-                    y_.append(lm.y)
-
-                for lm in hand_landmarks.landmark:
-                    data_aux.append(lm.x - min(x_))
-                    data_aux.append(lm.y - min(y_))
-
-                try:
-                    proba = model.predict_proba([np.asarray(data_aux)])
-                    confidence = np.max(proba)
-                    idx = np.argmax(proba)
-
-                    if idx == 3 and confidence >= 0.7:  # Index 3 for Letter O
-                        prediction_text = "You have successfully done the Letter O -- hold for 3 seconds"
-                        if not self.gesture_timer_event:
-                            self.gesture_hold_time = 0
-                            self.gesture_timer_event = Clock.schedule_interval(self.update_gesture_timer, 0.1)
-                    else:
-                        prediction_text = "Gesture incorrect"
-                        self.reset_gesture_timer()
-                except:
-                    prediction_text = "Prediction error"
-                    self.reset_gesture_timer()
-
-        if prediction_text == "No hand detected":
-            self.reset_gesture_timer()
+        confirmed = self.gesture_hold.update_result(result)
+        gesture_analytics.record_result(result, self.gesture_hold.held, self.gesture_hold.matched)
+
+        if not result.hand_detected:
+            prediction_text = "No hand detected"
+        elif result.error is not None:
+            prediction_text = "Prediction error"
+        elif self.gesture_hold.matched:
+            prediction_text = "You have successfully done the Letter O -- hold for 3 seconds"
+        else:
+            prediction_text = "Gesture incorrect"
 
         self.label.text = prediction_text
+        self.progress_bar.value = self.gesture_hold.progress * 100
+
+        if confirmed:
+            gesture_analytics.success(self.gesture_hold.held)
+            self.reset_gesture_hold()
+            self.show_success_dialog()
 
         # Display camera feed
-        frame = cv2.flip(frame, 0)
-        buf = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB).tobytes()
-        img_texture = Texture.create(size=(frame.shape[1], frame.shape[0]), colorfmt='rgb')
-        img_texture.blit_buffer(buf, colorfmt='rgb', bufferfmt='ubyte')
-        self.image.texture = img_texture
+        self.presenter.present(result.frame_rgb)
 
     def go_back(self, *args):
         app = MDApp.get_running_app()
         app.openVowelsMenu()
 
-    def update_gesture_timer(self, dt):
-        self.gesture_hold_time += dt
-        # Update progress bar value based on the gesture hold time
-        progress = (self.gesture_hold_time / self.gesture_target_time) * 100
-        self.progress_bar.value = progress  # Update progress bar
-
-        if self.gesture_hold_time >= self.gesture_target_time:
-            self.reset_gesture_timer()
-            self.show_success_dialog()
-
-    def reset_gesture_timer(self):
-        if self.gesture_timer_event:
-            self.gesture_timer_event.cancel()
-            self.gesture_timer_event = None
-        self.gesture_hold_time = 0
-        self.progress_bar.value = 0  # Reset progress bar when timer is reset
+    def reset_gesture_hold(self):
+        self.gesture_hold.reset()
+        self.progress_bar.value = 0
 
     def show_success_dialog(self):
         if not self.dialog_shown:
-            # Update SFX volume from app settings
-            self.sfx_volume = self.app.sfx_volume
-            self.update_sound_volumes()
-
             # Play success sound with current volume
             if self.sfx.get('success'):
                 self.sfx['success'].stop()
                 self.sfx['success'].play()
 
             self.dialog_shown = True
+            # Nothing to recognize behind the dialog; the camera stays warm
+            if self.worker:
+                self.worker.pause()
 
             # Load account data
-            with open("account_data.pkl", "rb") as file:
-                account = pickle.load(file)
+            account = account_store.get()
 
             # Check if this is the first completion
             show_achievement = not getattr(account, "oStatus", False)
 
             # Mark oStatus as complete
-            account.oStatus = True
-
-            with open("account_data.pkl", "wb") as file:
-                pickle.dump(account, file)
+            account_store.update(oStatus=True)
 
             # Define the button behavior
             def on_thank_you(instance_btn):
@@ -1209,10 +884,6 @@ class LetterOScreen(MDScreen):
             self.dialog.open()
 
     def show_achievement_popup(self):
-        # Update SFX volume from app settings
-        self.sfx_volume = self.app.sfx_volume
-        self.update_sound_volumes()
-
         # Play achievement sound with current volume
         if self.sfx.get('achievement'):
             self.sfx['achievement'].stop()
@@ -1242,28 +913,18 @@ class LetterUScreen(MDScreen):
         super().__init__(*args, **kwargs)
         self.app = MDApp.get_running_app()
 
-        # Load user's volume setting from account data
-        self.load_volume_setting()
-
         # Consolidate all SFX into a dictionary
         self.sfx = {
-            'button_click': SoundLoader.load('assets/sounds/select2.mp3'),
-            'success': SoundLoader.load('assets/sounds/levelwin2.mp3'),
-            'achievement': SoundLoader.load("assets/sounds/achievementunlock2.mp3"),
-            'instruction': SoundLoader.load('assets/sounds/copyinstruction.mp3')
+            'button_click': sound_bank.acquire('assets/sounds/select2.mp3'),
+            'success': sound_bank.acquire('assets/sounds/levelwin2.mp3'),
+            'achievement': sound_bank.acquire("assets/sounds/achievementunlock2.mp3"),
+            'instruction': sound_bank.acquire('assets/sounds/copyinstruction.mp3', INSTRUCTION)
         }
 
-        # Set volumes according to user setting (excluding instruction)
-        self.update_sound_volumes()
-        # Set instruction sound to full volume
-        if self.sfx.get('instruction'):
-            self.sfx['instruction'].volume = 1.0
-
-        self.gesture_hold_time = 0
-        self.gesture_target_time = 3
-        self.gesture_timer_event = None
+        # Hold the letter for 3 seconds; a few misread frames don't start it over
+        self.gesture_hold = GestureHold(4, hold_time=3)
         self.dialog_shown = False
-        self.capture = None
+        self.worker = None
         self.event = None
 
         self.layout = MDBoxLayout(orientation='vertical',
@@ -1278,9 +939,10 @@ class LetterUScreen(MDScreen):
             width=200,
             height=200
         )
+        self.presenter = FramePresenter(self.image)
 
         self.gif_image = AsyncImage(
-            source='assets/hands/letterU.PNG',
+            source=asset_resolver.resolve('assets/hands/letterU.PNG', 200),
             allow_stretch=True,
             size_hint=(None, None),
             width=200,
@@ -1315,10 +977,16 @@ class LetterUScreen(MDScreen):
 
         self.add_widget(self.layout)
 
+        if pipeline_metrics.enabled:
+            self.add_widget(MetricsOverlay())
+
     def on_enter(self, *args):
-        # Start camera capture immediately
-        self.capture = cv2.VideoCapture(0)
-        self.event = Clock.schedule_interval(self.update, 1.0/30.0)
+        # Start camera capture and recognition on a worker thread
+        self.worker = RecognitionWorker()
+        self.worker.start()
+        self.reset_gesture_hold()
+        self.event = Clock.schedule_interval(self.update, 1.0 / 60.0)
+        gesture_analytics.start_attempt(LETTER, 4)
 
         # Set up sound control
         self.sound_allowed = True
@@ -1332,36 +1000,18 @@ class LetterUScreen(MDScreen):
         if 'instruction' in self.sfx and self.sfx['instruction']:
             self.sfx['instruction'].stop()
 
+        gesture_analytics.abandon()
+
         # Cleanup camera and events
-        if self.capture:
-            self.capture.release()
+        if self.worker:
+            self.worker.stop()
+            self.worker = None
         if self.event:
             Clock.unschedule(self.event)
 
-    def load_volume_setting(self):
-        """Load the user's saved volume setting"""
-        try:
-            if os.path.exists("account_data.pkl"):
-                with open("account_data.pkl", "rb") as file:
-                    account = pickle.load(file)
-                    self.sfx_volume = getattr(account, 'sfx_volume', 0.5)
-            else:
-                self.sfx_volume = 0.5  # Default if no account exists yet
-        except Exception as e:
-            print(f"Error loading volume setting: {e}")
-
-    def update_sound_volumes(self):
-        """Update all sound volumes to current setting (except instruction sound)"""
-        for key, sound in self.sfx.items():
-            if sound and key != 'instruction':  # Skip the instruction sound
-                sound.volume = self.sfx_volume
-
     def play_sound(self, sound_name):
-        """Play a sound effect with current volume (instruction always at full volume)"""
+        """Play a sound effect; the sound bank sets its volume by category"""
         if sound_name in self.sfx and self.sfx[sound_name]:
-            # Instruction sound always plays at full volume
-            volume = 1.0 if sound_name == 'instruction' else self.sfx_volume
-            self.sfx[sound_name].volume = volume
             self.sfx[sound_name].stop()
             self.sfx[sound_name].play()
 
@@ -1375,116 +1025,60 @@ class LetterUScreen(MDScreen):
         self.go_back(*args)
 
     def update(self, dt):
-        if not self.capture:
+        result = self.worker.take() if self.worker else None
+        if result is None:
             return
-
-        ret, frame = self.capture.read()
-        if not ret:
-            return
-
-        data_aux = []
-        x_, y_ = [], []
-        H, W, _ = frame.shape
-
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = hands.process(frame_rgb)
-
-        prediction_text = "No hand detected"
-
-        if results.multi_hand_landmarks:
-            for hand_landmarks in results.multi_hand_landmarks:
-                mp_drawing.draw_landmarks(
-                    frame,
-                    hand_landmarks,
-                    mp_hands.HAND_CONNECTIONS,
-                    mp_drawing_styles.get_default_hand_landmarks_style(),
-                    mp_drawing_styles.get_default_hand_connections_style()
-                )
-
-                for lm in hand_landmarks.landmark:
-                    x_.append(lm.x)
-                    y_.append(lm.y)
-
-                for lm in hand_landmarks.landmark:
-                    data_aux.append(lm.x - min(x_))
-                    data_aux.append(lm.y - min(y_))
-
-                try:
-                    proba = model.predict_proba([np.asarray(data_aux)])
-                    confidence = np.max(proba)
-                    idx = np.argmax(proba)
-
-                    if idx == 4 and confidence >= 0.7:  # Index 4 for Letter U
-                        prediction_text = "You have successfully done the Letter U -- hold for 3 seconds"
-                        if not self.gesture_timer_event:
-                            self.gesture_hold_time = 0
-                            self.gesture_timer_event = Clock.schedule_interval(self.update_gesture_timer, 0.1)
-                    else:
-                        prediction_text = "Gesture incorrect"
-                        self.reset_gesture_timer()
-                except:
-                    prediction_text = "Prediction error"
-                    self.reset_gesture_timer()
-
-        if prediction_text == "No hand detected":
-            self.reset_gesture_timer()
+        confirmed = self.gesture_hold.update_result(result)
+        gesture_analytics.record_result(result, self.gesture_hold.held, self.gesture_hold.matched)
+
+        if not result.hand_detected:
+            prediction_text = "No hand detected"
+        elif result.error is not None:
+            prediction_text = "Prediction error"
+        elif self.gesture_hold.matched:
+            prediction_text = "You have successfully done the Letter U -- hold for 3 seconds"
+        else:
+            prediction_text = "Gesture incorrect"
 
         self.label.text = prediction_text
+        self.progress_bar.value = self.gesture_hold.progress * 100
+
+        if confirmed:
+            gesture_analytics.success(self.gesture_hold.held)
+            self.reset_gesture_hold()
+            self.show_success_dialog()
 
         # Display camera feed
-        frame = cv2.flip(frame, 0)
-        buf = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB).tobytes()
-        img_texture = Texture.create(size=(frame.shape[1], frame.shape[0]), colorfmt='rgb')
-        img_texture.blit_buffer(buf, colorfmt='rgb', bufferfmt='ubyte')
-        self.image.texture = img_texture
+        self.presenter.present(result.frame_rgb)
 
     def go_back(self, *args):
         app = MDApp.get_running_app()
         app.openVowelsMenu()
 
-    def update_gesture_timer(self, dt):
-        self.gesture_hold_time += dt
-        # Update progress bar value based on the gesture hold time
-        progress = (self.gesture_hold_time / self.gesture_target_time) * 100
-        self.progress_bar.value = progress  # Update progress bar
-
-        if self.gesture_hold_time >= self.gesture_target_time:
-            self.reset_gesture_timer()
-            self.show_success_dialog()
-
-    def reset_gesture_timer(self):
-        if self.gesture_timer_event:
-            self.gesture_timer_event.cancel()
-            self.gesture_timer_event = None
-        self.gesture_hold_time = 0
-        self.progress_bar.value = 0  # Reset progress bar when timer is reset
+    def reset_gesture_hold(self):
+        self.gesture_hold.reset()
+        self.progress_bar.value = 0
 
     def show_success_dialog(self):
         if not self.dialog_shown:
-            # Update SFX volume from app settings
-            self.sfx_volume = self.app.sfx_volume
-            self.update_sound_volumes()
-
             # Play success sound with current volume
             if self.sfx.get('success'):
                 self.sfx['success'].stop()
                 self.sfx['success'].play()
 
             self.dialog_shown = True
+            # Nothing to recognize behind the dialog; the camera stays warm
+            if self.worker:
+                self.worker.pause()
 
             # Load account data
-            with open("account_data.pkl", "rb") as file:
-                account = pickle.load(file)
+            account = account_store.get()
 
             # Check if this is the first completion
             show_achievement = not getattr(account, "uStatus", False)
 
             # Mark uStatus as complete and unlock vowel challenges
-            account.uStatus = True
-            account.vowelScreen = True  # Unlock vowel challenges
-
-            with open("account_data.pkl", "wb") as file:
-                pickle.dump(account, file)
+            account_store.update(uStatus=True, vowelScreen=True)
 
             # Define the button behavior
             def on_thank_you(instance_btn):
@@ -1512,10 +1106,6 @@ class LetterUScreen(MDScreen):
             self.dialog.open()
 
     def show_achievement_popup(self):
-        # Update SFX volume from app settings
-        self.sfx_volume = self.app.sfx_volume
-        self.update_sound_volumes()
-
         # Play achievement sound with current volume
         if self.sfx.get('achievement'):
             self.sfx['achievement'].stop()
@@ -2,8 +2,8 @@
 from kivymd.uix.screen import MDScreen
 from kivymd.uix.label import MDLabel
 from kivy.clock import Clock
-import pickle
-import os
+
+from account_store import account_store
 
 class WelcomeScreen(MDScreen):
     def __init__(self, **kwargs):
@@ -12,18 +12,12 @@ class WelcomeScreen(MDScreen):
         Clock.schedule_once(self.check_account, 0)
 
     def check_account(self, dt):
-        if os.path.exists("account_data.pkl"):
-            try:
-                with open("account_data.pkl", "rb") as file:
-                    account = pickle.load(file)
-
-                    if account.username == "User":
-                        self.manager.current = "register"
-                    else:
-                        self.manager.current = "bottom_nav"
-
-            except Exception as e:
-                print(f"Failed to load account: {e}")
+        account = account_store.get()
+        if account:
+            if account.username == "User":
+                self.manager.current = "register"
+            else:
+                self.manager.current = "bottom_nav"
 
         self.label = MDLabel(
             text=self.welcome_text,